@@ -0,0 +1,91 @@
+import tempfile
+import time
+from types import SimpleNamespace
+
+from kataglyphispythonpackage.system_monitor import SystemMonitor
+
+
+N_SAMPLES = 2_000
+N_GPUS = 4
+NVML_CALL_SECONDS = 20e-6  # typical driver round trip
+
+
+class FakeNVML:
+    """NVML stand-in with a fixed cost per call, so this runs without a GPU."""
+
+    NVML_TEMPERATURE_GPU = 0
+
+    class NVMLError(Exception):
+        pass
+
+    def __init__(self, device_count):
+        self.device_count = device_count
+        self.calls = 0
+
+    def _call(self):
+        self.calls += 1
+        deadline = time.perf_counter() + NVML_CALL_SECONDS
+        while time.perf_counter() < deadline:
+            pass
+
+    def nvmlDeviceGetCount(self):
+        self._call()
+        return self.device_count
+
+    def nvmlDeviceGetHandleByIndex(self, index):
+        self._call()
+        return index
+
+    def nvmlDeviceGetName(self, handle):
+        self._call()
+        return b"Fake GPU"
+
+    def nvmlDeviceGetUtilizationRates(self, handle):
+        self._call()
+        return SimpleNamespace(gpu=50, memory=10)
+
+    def nvmlDeviceGetMemoryInfo(self, handle):
+        self._call()
+        return SimpleNamespace(used=1024**3, total=8 * 1024**3)
+
+    def nvmlDeviceGetTemperature(self, handle, sensor):
+        self._call()
+        return 60
+
+
+def per_sample_cost(monitor, collect, uncached):
+    start = time.perf_counter()
+    for _ in range(N_SAMPLES):
+        if uncached:
+            # What every sample used to do: look up devices and static facts.
+            monitor._gpu_handle_cache = None
+            monitor._static_info = None
+            monitor.get_static_info()
+        collect(monitor)
+    return (time.perf_counter() - start) / N_SAMPLES
+
+
+def main():
+    collectors = {
+        "cpu": SystemMonitor.get_cpu_info,
+        "memory": SystemMonitor.get_memory_info,
+        "gpu": SystemMonitor.get_gpu_info,
+        "sample": SystemMonitor.sample,
+    }
+    print(f"{N_GPUS} fake GPUs, {NVML_CALL_SECONDS * 1e6:.0f} us per NVML call")
+    with tempfile.TemporaryDirectory() as output_dir:
+        for uncached in (True, False):
+            label = "per-sample lookups" if uncached else "cached handles"
+            print(f"\n{label}")
+            for name, collect in collectors.items():
+                nvml = FakeNVML(N_GPUS)
+                monitor = SystemMonitor(output_dir, nvml=nvml, max_samples=1)
+                cost = per_sample_cost(monitor, collect, uncached)
+                print(
+                    f"  {name:<7} {cost * 1e6:8.1f} us/sample"
+                    f"  {nvml.calls / N_SAMPLES:5.1f} NVML calls/sample"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+import tempfile
+import time
+
+from bench.demo_collector_cost import FakeNVML
+from kataglyphispythonpackage.system_monitor import SystemMonitor
+
+
+TICK_HZ = 50
+RUN_SECONDS = 3.0
+N_GPUS = 4
+
+CONFIGS = {
+    "all collectors every tick": {"cpu": None, "memory": None, "gpu": None},
+    "cpu 50 Hz, memory 5 Hz, gpu 1 Hz": {"cpu": None, "memory": 0.2, "gpu": 1.0},
+}
+
+
+def run(output_dir, collectors):
+    nvml = FakeNVML(N_GPUS)
+    monitor = SystemMonitor(output_dir, nvml=nvml, collectors=collectors)
+    spent = 0.0
+    sample = monitor.sample
+
+    def timed_sample():
+        nonlocal spent
+        start = time.perf_counter()
+        result = sample()
+        spent += time.perf_counter() - start
+        return result
+
+    monitor.sample = timed_sample
+    with monitor.running(interval=1 / TICK_HZ):
+        time.sleep(RUN_SECONDS)
+    return monitor, nvml, spent
+
+
+def main():
+    print(f"{TICK_HZ} Hz ticks for {RUN_SECONDS:.0f}s, {N_GPUS} fake GPUs")
+    with tempfile.TemporaryDirectory() as output_dir:
+        for label, collectors in CONFIGS.items():
+            monitor, nvml, spent = run(output_dir, collectors)
+            calls = ", ".join(f"{c.name}={c.collections}" for c in monitor.collectors)
+            print(f"\n{label}")
+            print(f"  collections: {calls}")
+            print(f"  NVML calls:  {nvml.calls}")
+            print(
+                f"  sampler time {spent * 1e3:7.1f} ms "
+                f"({spent / RUN_SECONDS * 100:.2f}% of one core)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -6,7 +6,7 @@ from kataglyphispythonpackage.dummy import SimpleMLPreprocessor
 
 def main():
     ml = SimpleMLPreprocessor(10000)
-    ml.run_pipeline()
+    dict(ml.run_pipeline())
 
 
 if __name__ == "__main__":
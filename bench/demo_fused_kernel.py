@@ -0,0 +1,39 @@
+import timeit
+
+import numpy as np
+
+from kataglyphispythonpackage.fused import COMPILED_AVAILABLE, fused_label_stats
+
+
+N_SAMPLES = 5_000_000
+REPEATS = 5
+
+
+def multi_pass(features):
+    labels = (features.sum(axis=1) > 15).astype(int)
+    return labels, features.mean(axis=0), features.std(axis=0)
+
+
+def main():
+    features = np.random.default_rng(0).normal(5.0, 2.0, size=(N_SAMPLES, 3))
+    cases = {
+        "multi-pass (sum, mean, std)": lambda: multi_pass(features),
+        "fused, NumPy fallback": lambda: fused_label_stats(
+            features, use_compiled=False
+        ),
+    }
+    if COMPILED_AVAILABLE:
+        cases["fused, compiled kernel"] = lambda: fused_label_stats(
+            features, use_compiled=True
+        )
+    else:
+        print("Compiled kernel not built (build with CYTHONIZE=1 to include it).")
+
+    print(f"{N_SAMPLES} samples x 3 features, best of {REPEATS}:")
+    for name, run in cases.items():
+        best = min(timeit.repeat(run, number=1, repeat=REPEATS))
+        print(f"  {name:<30} {best * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
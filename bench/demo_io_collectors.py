@@ -0,0 +1,54 @@
+import os
+import tempfile
+import threading
+import time
+
+from kataglyphispythonpackage.system_monitor import SystemMonitor
+
+
+RUN_SECONDS = 2.0
+CHUNK = b"x" * 1024**2
+
+
+def write_load(path, stop):
+    """Write and fsync 1 MiB chunks so the traffic reaches the disk."""
+    with open(path, "wb") as f:
+        while not stop.is_set():
+            f.write(CHUNK)
+            f.flush()
+            os.fsync(f.fileno())
+
+
+def main():
+    with tempfile.TemporaryDirectory() as output_dir:
+        monitor = SystemMonitor(output_dir, collectors={"disk": 0.5, "network": 0.5})
+        stop = threading.Event()
+        writer = threading.Thread(
+            target=write_load, args=(os.path.join(output_dir, "load.bin"), stop)
+        )
+        writer.start()
+        with monitor.running(interval=0.1):
+            time.sleep(RUN_SECONDS)
+        stop.set()
+        writer.join()
+
+        df = monitor.to_dataframe()
+        disk = df.filter(like="disk_").mean().dropna()
+        net = df.filter(like="net_").mean().dropna()
+        print(f"mean over {RUN_SECONDS:.0f}s of 1 MiB fsync'ed writes")
+        for name, value in disk[disk > 0].items():
+            print(f"  {name:<32} {value:14.1f}")
+        for name, value in net[net > 0].items():
+            print(f"  {name:<32} {value:14.1f}")
+
+        start = time.perf_counter()
+        for collector in monitor.collectors:
+            for _ in range(100):
+                collector.collect()
+            cost = (time.perf_counter() - start) / 100
+            print(f"{collector.name:<8} collector: {cost * 1e6:7.1f} us/collection")
+            start = time.perf_counter()
+
+
+if __name__ == "__main__":
+    main()
@@ -14,14 +14,14 @@ def profile_funcs():
     profiler.add_function(ml.run_pipeline)
 
     # Warm-up
-    ml.run_pipeline()
+    dict(ml.run_pipeline())
 
     # Profile each
     profiler.enable()
     ml.generate_synthetic_data()
     ml.normalize_features()
     ml.apply_joke_labeling()
-    ml.run_pipeline()
+    dict(ml.run_pipeline())
     profiler.disable()
 
     profiler.print_stats()
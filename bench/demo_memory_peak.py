@@ -0,0 +1,47 @@
+import tracemalloc
+
+import numpy as np
+
+from kataglyphispythonpackage.dummy import SimpleMLPreprocessor
+
+
+N_SAMPLES = 2_000_000
+
+
+def naive_normalize(ml):
+    features = ml.features
+    return (features - features.mean(axis=0)) / features.std(axis=0)
+
+
+def measure_peak(ml, normalize):
+    ml.generate_synthetic_data()
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline, _ = tracemalloc.get_traced_memory()
+    normalize(ml)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # The feature matrix itself already exists before measuring, so add it
+    # back to compare total footprints in multiples of the feature matrix.
+    return (peak - baseline + ml.features.nbytes) / ml.features.nbytes
+
+
+def main():
+    cases = {
+        "naive (features - mean) / std": naive_normalize,
+        "normalize_features()": lambda ml: ml.normalize_features(),
+        "normalize_features(inplace=True)": lambda ml: ml.normalize_features(
+            inplace=True
+        ),
+    }
+    for dtype in (np.float64, np.float32):
+        print(f"\n{N_SAMPLES} samples, dtype={np.dtype(dtype).name}")
+        for name, normalize in cases.items():
+            ml = SimpleMLPreprocessor(N_SAMPLES, seed=0, dtype=dtype)
+            ratio = measure_peak(ml, normalize)
+            mib = ratio * ml.features.nbytes / 1024**2
+            print(f"  {name:<34} peak {ratio:4.2f}x features ({mib:7.1f} MiB)")
+
+
+if __name__ == "__main__":
+    main()
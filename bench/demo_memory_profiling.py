@@ -5,7 +5,7 @@ from kataglyphispythonpackage.dummy import SimpleMLPreprocessor
 @profile
 def test_memory_profile():
     ml = SimpleMLPreprocessor(1000)
-    ml.run_pipeline()
+    dict(ml.run_pipeline())
 
 
 test_memory_profile()
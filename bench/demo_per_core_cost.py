@@ -0,0 +1,69 @@
+import tempfile
+import time
+from unittest import mock
+
+import numpy as np
+import psutil
+
+from kataglyphispythonpackage.sample_store import SampleStore
+from kataglyphispythonpackage.system_monitor import SystemMonitor
+
+
+N_CORES = 128
+N_SAMPLES = 1_000
+
+_cputimes = type(psutil.cpu_times())
+_fields = _cputimes._fields
+_rng = np.random.default_rng(0)
+_counters = np.zeros((N_CORES, len(_fields)))
+
+
+def fake_cpu_times(percpu=False):
+    """Simulate a large host: N_CORES cores with advancing counters."""
+    _counters[:] += _rng.random(_counters.shape)
+    cores = [_cputimes(*row) for row in _counters.tolist()]
+    return cores if percpu else _cputimes(*_counters.sum(axis=0).tolist())
+
+
+def as_scalar_keys(sample):
+    """The alternative layout: one dict key per core and metric."""
+    return {
+        f"{name}_{i}": float(v)
+        for name, values in sample.items()
+        for i, v in enumerate(values)
+    }
+
+
+def main():
+    with (
+        tempfile.TemporaryDirectory() as output_dir,
+        mock.patch.object(psutil, "cpu_times", fake_cpu_times),
+    ):
+        monitor = SystemMonitor(output_dir, collectors={"cpu_cores": None})
+        (collector,) = monitor.collectors
+
+        start = time.perf_counter()
+        for _ in range(N_SAMPLES):
+            monitor.sample()
+        block_cost = (time.perf_counter() - start) / N_SAMPLES
+
+        keyed = SampleStore()
+        start = time.perf_counter()
+        for _ in range(N_SAMPLES):
+            keyed.append(as_scalar_keys(collector.collect()))
+        keyed_cost = (time.perf_counter() - start) / N_SAMPLES
+
+        print(f"{N_CORES} simulated cores, {N_SAMPLES} samples")
+        print(
+            f"  2-D blocks (float32): {block_cost * 1e6:7.1f} us/sample, "
+            f"{monitor.monitoring_data.nbytes / 1e6:6.1f} MB"
+        )
+        print(
+            f"  {len(keyed.columns)} scalar keys:    "
+            f"{keyed_cost * 1e6:7.1f} us/sample, "
+            f"{keyed.nbytes / 1e6:6.1f} MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
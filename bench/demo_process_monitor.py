@@ -0,0 +1,46 @@
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from kataglyphispythonpackage.system_monitor import SystemMonitor
+
+
+N_SAMPLES = 200
+CHILD_COUNTS = (0, 4, 16)
+
+
+def spawn_children(n):
+    code = "import time; time.sleep(60)"
+    return [subprocess.Popen([sys.executable, "-c", code]) for _ in range(n)]
+
+
+def main():
+    with tempfile.TemporaryDirectory() as output_dir:
+        for n in CHILD_COUNTS:
+            children = spawn_children(n)
+            try:
+                monitor = SystemMonitor(
+                    output_dir, collectors={"process": None}, pid=os.getpid()
+                )
+                start = time.perf_counter()
+                for _ in range(N_SAMPLES):
+                    sample = monitor.sample()
+                cost = (time.perf_counter() - start) / N_SAMPLES
+            finally:
+                for child in children:
+                    child.kill()
+                    child.wait()
+            print(
+                f"{n:3d} children: {cost * 1e3:6.2f} ms/sample, "
+                f"{sample['proc_count']} processes, "
+                f"RSS {sample['proc_rss_mb']:.0f} MB, "
+                f"USS {sample['proc_uss_mb']:.0f} MB, "
+                f"{sample['proc_num_threads']} threads, "
+                f"{sample['proc_num_fds']} fds"
+            )
+
+
+if __name__ == "__main__":
+    main()
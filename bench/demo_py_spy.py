@@ -7,7 +7,7 @@ from kataglyphispythonpackage.dummy import SimpleMLPreprocessor
 
 def main():
     preprocessor = SimpleMLPreprocessor(n_samples=1_000)
-    result = preprocessor.run_pipeline()
+    result = dict(preprocessor.run_pipeline())
 
     # Generate two large random matrices (e.g., 10000 x 1000 and 1000 x 10000)
     A = np.random.rand(10000, 1000)
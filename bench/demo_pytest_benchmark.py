@@ -4,4 +4,4 @@ from kataglyphispythonpackage.dummy import SimpleMLPreprocessor
 
 def test_pipeline_benchmark(benchmark):
     ml = SimpleMLPreprocessor(10000)
-    benchmark(ml.run_pipeline)
+    benchmark(lambda: dict(ml.run_pipeline()))
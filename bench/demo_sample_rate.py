@@ -0,0 +1,40 @@
+import tempfile
+import time
+
+from kataglyphispythonpackage.system_monitor import SystemMonitor
+
+
+N_SAMPLES = 2_000
+TARGET_HZ = 100
+RUN_SECONDS = 3.0
+
+
+def cost_per_sample(monitor, n):
+    start = time.perf_counter()
+    for _ in range(n):
+        monitor.sample()
+    return (time.perf_counter() - start) / n
+
+
+def main():
+    with tempfile.TemporaryDirectory() as output_dir:
+        blocking = SystemMonitor(output_dir, cpu_interval=0.1)
+        delta = SystemMonitor(output_dir)
+        print(
+            f"cpu_interval=0.1   {cost_per_sample(blocking, 10) * 1e3:8.3f} ms/sample"
+        )
+        print(
+            f"cpu_interval=None  {cost_per_sample(delta, N_SAMPLES) * 1e3:8.3f} ms/sample"
+        )
+
+        monitor = SystemMonitor(output_dir)
+        with monitor.running(interval=1 / TARGET_HZ):
+            time.sleep(RUN_SECONDS)
+        achieved = len(monitor.monitoring_data) / RUN_SECONDS
+        print(
+            f"background sampler at {TARGET_HZ} Hz target: {achieved:.1f} Hz achieved"
+        )
+
+
+if __name__ == "__main__":
+    main()
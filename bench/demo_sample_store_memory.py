@@ -0,0 +1,41 @@
+import tempfile
+import tracemalloc
+
+from kataglyphispythonpackage.sample_store import SampleStore
+from kataglyphispythonpackage.system_monitor import SystemMonitor
+
+
+N_SAMPLES = 100_000
+
+
+def measure(store, sample):
+    tracemalloc.start()
+    for i in range(N_SAMPLES):
+        row = dict(sample)
+        row["elapsed_ns"] = i
+        store.append(row)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size
+
+
+def main():
+    with tempfile.TemporaryDirectory() as output_dir:
+        sample = SystemMonitor(output_dir).sample()
+    print(f"{N_SAMPLES} samples with {len(sample)} metrics each")
+
+    cases = {
+        "list of dicts": [],
+        "SampleStore()": SampleStore(),
+        "SampleStore(max_samples=10_000)": SampleStore(max_samples=10_000),
+    }
+    for name, store in cases.items():
+        size = measure(store, sample)
+        print(
+            f"  {name:<32} {size / 1024**2:8.1f} MiB"
+            f"  ({size / N_SAMPLES:6.0f} B/sample)"
+        )
+
+
+if __name__ == "__main__":
+    main()
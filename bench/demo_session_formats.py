@@ -0,0 +1,67 @@
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from kataglyphispythonpackage.session_io import (
+    convert_session,
+    read_session,
+    write_session,
+)
+
+
+N_ROWS = 1_000_000
+PROJECTION = ["elapsed_seconds", "cpu_percent"]
+
+
+def synthetic_session(n_rows):
+    rng = np.random.default_rng(0)
+    elapsed_ns = np.arange(n_rows, dtype=np.int64) * 10_000_000
+    df = pd.DataFrame(
+        {
+            "timestamp_ns": elapsed_ns + 1_760_000_000_000_000_000,
+            "elapsed_ns": elapsed_ns,
+            "timestamp": (elapsed_ns + 1_760_000_000_000_000_000) / 1e9,
+            "elapsed_seconds": elapsed_ns / 1e9,
+        }
+    )
+    for name in ("cpu_percent", "cpu_freq_current", "ram_used_gb", "ram_percent"):
+        df[name] = rng.uniform(0, 100, n_rows)
+    df["cpu_count"] = 16
+    return df
+
+
+def timed(load):
+    start = time.perf_counter()
+    df = load()
+    return time.perf_counter() - start, df
+
+
+def main():
+    session = synthetic_session(N_ROWS)
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = write_session(session, Path(tmp) / "session.csv")
+        paths = {
+            "csv": csv_path,
+            "parquet": write_session(session, Path(tmp) / "session.parquet"),
+            "feather": write_session(session, Path(tmp) / "session.feather"),
+            # A converted CSV session keeps the precision already lost in CSV.
+            "csv->parquet": convert_session(csv_path, Path(tmp) / "converted.parquet"),
+        }
+
+        print(f"{N_ROWS} rows, {len(session.columns)} columns")
+        for name, path in paths.items():
+            full, df = timed(lambda: read_session(path))
+            projected, _ = timed(lambda: read_session(path, columns=PROJECTION))
+            exact = np.array_equal(df["cpu_percent"], session["cpu_percent"])
+            print(
+                f"  {name:<12} {path.stat().st_size / 1024**2:7.1f} MiB"
+                f"  load {full:6.3f} s  2 columns {projected:6.3f} s"
+                f"  exact floats: {exact}"
+            )
+
+
+if __name__ == "__main__":
+    main()
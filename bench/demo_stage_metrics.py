@@ -0,0 +1,30 @@
+import json
+
+from kataglyphispythonpackage.dummy import SimpleMLPreprocessor
+
+
+N_SAMPLES = 2_000_000
+
+
+def report(stage, record):
+    # Stand-in for a telemetry exporter (statsd, OpenTelemetry, ...).
+    print(f"{stage:<12} {json.dumps(record)}")
+
+
+def main():
+    ml = SimpleMLPreprocessor(N_SAMPLES, seed=0, stage_callback=report)
+    result = ml.run_pipeline()
+    dict(result)
+
+    print()
+    for stage, record in result.metrics.items():
+        print(
+            f"{stage:<12} wall {record['wall_s'] * 1e3:8.1f} ms  "
+            f"cpu {record['cpu_s'] * 1e3:8.1f} ms  "
+            f"alloc peak {record['alloc_peak_bytes'] / 1024**2:8.1f} MiB  "
+            f"rss +{record['peak_rss_delta_bytes'] / 1024**2:7.1f} MiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
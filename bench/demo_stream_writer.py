@@ -0,0 +1,38 @@
+import tempfile
+import time
+from pathlib import Path
+
+from kataglyphispythonpackage.stream_writer import (
+    StreamingCSVWriter,
+    read_monitoring_csv,
+)
+from kataglyphispythonpackage.system_monitor import SystemMonitor
+
+
+N_SAMPLES = 100_000
+
+
+def main():
+    with tempfile.TemporaryDirectory() as output_dir:
+        sample = SystemMonitor(output_dir).sample()
+        path = Path(output_dir) / "stream.csv"
+
+        for batch_size in (1, 64, 1024):
+            writer = StreamingCSVWriter(path, batch_size=batch_size)
+            start = time.perf_counter()
+            for i in range(N_SAMPLES):
+                writer.write({**sample, "elapsed_ns": i})
+            enqueue = time.perf_counter() - start
+            writer.close()
+            total = time.perf_counter() - start
+
+            assert len(read_monitoring_csv(path)) == N_SAMPLES
+            print(
+                f"batch_size={batch_size:<5} write() {enqueue / N_SAMPLES * 1e6:5.2f} us"
+                f"  drained in {total:5.2f} s"
+                f"  {writer.batches_written:6d} write calls"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,7 @@ from kataglyphispythonpackage.demo import SimpleMLPreprocessor
 
 def run():
     ml = SimpleMLPreprocessor(10000)
-    ml.run_pipeline()
+    dict(ml.run_pipeline())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,37 @@
+import time
+
+from loguru import logger
+
+from kataglyphispythonpackage.dummy import SimpleMLPreprocessor
+
+
+TOTAL_VALUES = 30_000_000
+WIDTHS = (3, 1_000, 10_000)
+
+
+def timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    logger.remove()
+    print(f"~{TOTAL_VALUES:,} float64 values per run")
+    print(
+        f"{'columns':>8} {'rows':>10} {'generate':>10} {'normalize':>10} {'Mvals/s':>9}"
+    )
+    for n_features in WIDTHS:
+        n_samples = TOTAL_VALUES // n_features
+        ml = SimpleMLPreprocessor(n_samples, seed=0, n_features=n_features)
+        generate = timed(ml.generate_synthetic_data)
+        normalize = timed(lambda: ml.normalize_features(inplace=True))
+        throughput = n_samples * n_features / (generate + normalize) / 1e6
+        print(
+            f"{n_features:>8} {n_samples:>10} {generate * 1000:>8.0f}ms "
+            f"{normalize * 1000:>8.0f}ms {throughput:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
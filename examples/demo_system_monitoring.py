@@ -80,18 +80,13 @@ def demo_monitoring_with_computation():
 
     monitor = SystemMonitor(output_dir="output/monitoring/demo2")
 
-    # Start background monitoring in a separate thread would be ideal,
-    # but for simplicity, we'll sample before, during, and after
-    logger.info("Taking baseline sample...")
-    monitor.sample()
+    # Sample in a background thread while the computation runs unchanged
+    logger.info("\nStarting computation with background monitoring...")
+    with monitor.running(interval=0.5):
+        example_heavy_computation()
 
-    logger.info("\nStarting computation...")
-    example_heavy_computation()
-
-    logger.info("\nTaking samples during cooldown...")
-    for i in range(5):
-        monitor.sample()
-        time.sleep(1)
+        logger.info("\nCooling down...")
+        time.sleep(5)
 
     # Save and visualize
     csv_path = monitor.save_data()
@@ -0,0 +1,30 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, initializedcheck=False
+"""Compiled single-pass kernel behind ``kataglyphispythonpackage.fused``."""
+
+ctypedef fused floating:
+    float
+    double
+
+
+def fused_block_stats(
+    const floating[:, ::1] block,
+    double threshold,
+    long long[::1] labels,
+    double[::1] col_sum,
+    double[::1] col_sumsq,
+):
+    """Label rows and accumulate column sums/sums of squares in one sweep."""
+    cdef Py_ssize_t i, j
+    cdef Py_ssize_t n_rows = block.shape[0]
+    cdef Py_ssize_t n_cols = block.shape[1]
+    cdef double value, row_sum
+
+    with nogil:
+        for i in range(n_rows):
+            row_sum = 0.0
+            for j in range(n_cols):
+                value = block[i, j]
+                row_sum += value
+                col_sum[j] += value
+                col_sumsq[j] += value * value
+            labels[i] = row_sum > threshold
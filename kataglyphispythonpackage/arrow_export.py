@@ -0,0 +1,146 @@
+"""Export preprocessing results to Apache Arrow record batches and Parquet."""
+
+import json
+from pathlib import Path
+from typing import Iterable, Iterator, Mapping, Optional, Union
+
+import numpy as np
+from loguru import logger
+
+from kataglyphispythonpackage.categorical import CategoricalLabels
+
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    ARROW_AVAILABLE = True
+except ImportError:
+    ARROW_AVAILABLE = False
+
+MATRIX_COLUMNS = ("features", "normalized")
+EXPORT_COLUMNS = ("features", "labels", "normalized", "joke_labels")
+
+
+def _require_arrow():
+    if not ARROW_AVAILABLE:
+        raise ImportError(
+            "pyarrow is required for Arrow/Parquet export. "
+            "Install it with: pip install kataglyphispythonpackage[arrow]"
+        )
+
+
+def _matrix_array(matrix: np.ndarray, width: int = 0) -> "pa.Array":
+    # A row-major matrix is exactly the child buffer of a fixed-size list, so
+    # contiguous matrices are wrapped without copying.
+    matrix = np.ascontiguousarray(matrix)
+    if matrix.ndim == 1 and matrix.size == 0:
+        # Results without samples hold a 1-D empty placeholder
+        matrix = matrix.reshape(0, width)
+    return pa.FixedSizeListArray.from_arrays(
+        pa.array(matrix.reshape(-1)), matrix.shape[1]
+    )
+
+
+def _column_array(name: str, values, width: int = 0) -> "pa.Array":
+    if name in MATRIX_COLUMNS:
+        return _matrix_array(values, width)
+    if isinstance(values, CategoricalLabels):
+        return pa.DictionaryArray.from_arrays(
+            pa.array(values.codes), pa.array(values.categories)
+        )
+    return pa.array(np.ascontiguousarray(values))
+
+
+def to_record_batch(result: Mapping) -> "pa.RecordBatch":
+    """
+    Convert a pipeline result or streamed chunk into an Arrow record batch.
+
+    Numeric arrays are wrapped zero-copy when they are contiguous; feature
+    matrices become fixed-size list columns and categorical joke labels
+    become dictionary-encoded columns. ``mean``/``std`` go into the schema
+    metadata.
+
+    Args:
+        result: Mapping from ``run_pipeline`` or a chunk from ``stream_pipeline``
+
+    Returns:
+        Record batch with one column per exported array present in ``result``
+    """
+    _require_arrow()
+    names = [name for name in EXPORT_COLUMNS if name in result]
+    # Feature width for empty matrices, taken from any 2-D one present
+    width = next(
+        (
+            result[name].shape[1]
+            for name in MATRIX_COLUMNS
+            if name in result and np.ndim(result[name]) == 2
+        ),
+        0,
+    )
+    arrays = [_column_array(name, result[name], width) for name in names]
+
+    metadata = {
+        key: json.dumps(list(result[key])) for key in ("mean", "std") if key in result
+    }
+    return pa.RecordBatch.from_arrays(arrays, names=names, metadata=metadata or None)
+
+
+def iter_record_batches(chunks: Iterable[Mapping]) -> Iterator["pa.RecordBatch"]:
+    """
+    Convert streamed chunks into record batches one at a time.
+
+    Args:
+        chunks: Chunks, e.g. from ``SimpleMLPreprocessor.stream_pipeline()``
+
+    Yields:
+        One record batch per chunk
+    """
+    for chunk in chunks:
+        yield to_record_batch(chunk)
+
+
+def write_parquet(
+    path: Union[str, Path],
+    data: Union[Mapping, Iterable[Mapping]],
+    compression: Optional[str] = "zstd",
+) -> Path:
+    """
+    Write a pipeline result or a stream of chunks to a Parquet file.
+
+    Each chunk is written as its own row group as soon as it is produced, so
+    streaming exports never hold more than one chunk in memory.
+
+    Example:
+        write_parquet("data.parquet", SimpleMLPreprocessor(10**8).stream_pipeline())
+
+    Args:
+        path: Output file path
+        data: A single result mapping or an iterable of chunk mappings
+        compression: Parquet compression codec
+
+    Returns:
+        Path to the written file
+    """
+    _require_arrow()
+    path = Path(path)
+    chunks = [data] if isinstance(data, Mapping) else data
+
+    writer = None
+    row_groups = 0
+    try:
+        for batch in iter_record_batches(chunks):
+            if writer is None:
+                writer = pq.ParquetWriter(path, batch.schema, compression=compression)
+            writer.write_batch(batch, row_group_size=batch.num_rows)
+            row_groups += 1
+    finally:
+        if writer is not None:
+            writer.close()
+
+    if writer is None:
+        logger.warning("No data to export.")
+        return None
+
+    logger.info(f"Exported {row_groups} row group(s) to {path}")
+    return path
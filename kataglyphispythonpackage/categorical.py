@@ -0,0 +1,103 @@
+"""Compact categorical label storage with lazy string decoding."""
+
+from typing import Iterator, List, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+
+class CategoricalLabels:
+    """Labels stored as int8 codes into a small table of category strings.
+
+    Strings are only materialized when explicitly requested (``tolist``,
+    ``np.asarray`` or indexing), so a row costs one byte instead of a
+    fixed-width unicode cell. The layout mirrors ``pandas.Categorical``.
+    """
+
+    def __init__(self, codes: np.ndarray, categories: Sequence[str]):
+        """
+        Initialize the categorical labels.
+
+        Args:
+            codes: Integer codes indexing into ``categories``
+            categories: Category strings, in code order
+        """
+        self.codes = np.asarray(codes, dtype=np.int8)
+        self.categories = tuple(categories)
+        if self.codes.size and not 0 <= self.codes.min() <= self.codes.max() < len(
+            self.categories
+        ):
+            raise ValueError("Codes must index into the category table.")
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, key) -> Union[str, "CategoricalLabels"]:
+        codes = self.codes[key]
+        if np.ndim(codes) == 0:
+            return self.categories[codes]
+        return CategoricalLabels(codes, self.categories)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.tolist())
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        decoded = np.asarray(self.categories)[self.codes]
+        return decoded if dtype is None else decoded.astype(dtype)
+
+    def __eq__(self, other) -> np.ndarray:
+        """
+        Compare elementwise, like ``pandas.Categorical``.
+
+        A string is compared through its category code, without decoding.
+
+        Returns:
+            Boolean array over ``codes``
+        """
+        if isinstance(other, str):
+            if other not in self.categories:
+                return np.zeros(self.codes.shape, dtype=bool)
+            return self.codes == self.categories.index(other)
+        if isinstance(other, CategoricalLabels) and other.categories == self.categories:
+            return self.codes == other.codes
+        return np.asarray(self) == np.asarray(other)
+
+    def __ne__(self, other) -> np.ndarray:
+        return ~self.__eq__(other)
+
+    # Elementwise __eq__ makes instances unhashable, as for ndarrays.
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (
+            f"CategoricalLabels({self[:5].tolist()}{'...' if len(self) > 5 else ''}, "
+            f"categories={list(self.categories)})"
+        )
+
+    @property
+    def shape(self) -> tuple:
+        """Shape of the codes array."""
+        return self.codes.shape
+
+    @property
+    def dtype(self) -> pd.CategoricalDtype:
+        """Categorical dtype over ``categories``, as in ``pandas.Categorical``."""
+        return pd.CategoricalDtype(list(self.categories))
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes used by the codes array."""
+        return self.codes.nbytes
+
+    def tolist(self) -> List[str]:
+        """Decode all labels into a list of strings."""
+        return [self.categories[code] for code in self.codes.tolist()]
+
+    def to_pandas(self) -> pd.Categorical:
+        """Convert to a ``pandas.Categorical`` sharing the same codes."""
+        return pd.Categorical.from_codes(self.codes, categories=self.categories)
+
+    @classmethod
+    def from_pandas(cls, categorical: pd.Categorical) -> "CategoricalLabels":
+        """Build labels from a ``pandas.Categorical``."""
+        return cls(categorical.codes, [str(c) for c in categorical.categories])
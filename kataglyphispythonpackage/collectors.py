@@ -0,0 +1,564 @@
+"""Collector plugins: the metric sources sampled by ``SystemMonitor``."""
+
+import os
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Type
+
+import numpy as np
+import psutil
+from loguru import logger
+
+
+if TYPE_CHECKING:
+    from kataglyphispythonpackage.system_monitor import SystemMonitor
+
+
+COLLECTORS: Dict[str, Type["Collector"]] = {}
+
+# Collectors sampled by a SystemMonitor unless configured otherwise, all on
+# every tick.
+DEFAULT_COLLECTORS: Dict[str, Optional[float]] = {
+    "cpu": None,
+    "memory": None,
+    "gpu": None,
+}
+
+
+def register_collector(cls: Type["Collector"]) -> Type["Collector"]:
+    """
+    Class decorator that makes a collector available by its ``name``.
+
+    Example:
+        @register_collector
+        class LoadAverageCollector(Collector):
+            name = "loadavg"
+
+            def schema(self):
+                return {"load_1m": "float64"}
+
+            def collect(self):
+                return {"load_1m": os.getloadavg()[0]}
+
+    Registered names can then be passed to
+    ``SystemMonitor(collectors={"loadavg": 5.0})``. The background sampler's
+    process mode rebuilds collectors by name, so register plugins at import
+    time of a module the sampler process imports as well.
+    """
+    if not cls.name:
+        raise ValueError(f"Collector {cls.__name__} needs a name.")
+    COLLECTORS[cls.name] = cls
+    return cls
+
+
+class Collector:
+    """A source of metrics sampled at its own period.
+
+    Subclasses set ``name``, declare the columns they produce in ``schema``
+    and return their current values from ``collect``. ``SystemMonitor``
+    runs every collector that is due on a tick and merges their values into
+    that tick's sample; columns of collectors that were not due stay empty
+    (NaN) in that row.
+    """
+
+    name: str = ""
+
+    def __init__(self, monitor: "SystemMonitor", period: Optional[float] = None):
+        """
+        Initialize the collector.
+
+        Args:
+            monitor: Monitor that owns this collector and its cached state
+            period: Seconds between collections. None collects on every
+                tick. Collections happen on ticks, so a period shorter than
+                the sampling interval collects on every tick as well
+        """
+        if period is not None and period <= 0:
+            raise ValueError(f"period must be positive, got {period}")
+        self.monitor = monitor
+        self.period = period
+        self.period_ns = None if period is None else max(1, round(period * 1e9))
+        self._next_due_ns = 0
+        self.collections = 0
+
+    def schema(self) -> Dict[str, Any]:
+        """
+        Return the columns this collector produces and their dtypes.
+
+        A ``(dtype, width)`` tuple declares an array-valued column that is
+        stored as a 2-D block (see ``SampleStore``).
+        """
+        raise NotImplementedError
+
+    def collect(self) -> Dict[str, Any]:
+        """Return the current value of each column in ``schema``."""
+        raise NotImplementedError
+
+    def due(self, elapsed_ns: int) -> bool:
+        """
+        Check whether the collector is due and, if so, book the collection.
+
+        Due times lie on the grid ``k * period_ns`` since the session start,
+        so late ticks do not shift later collections.
+
+        Args:
+            elapsed_ns: Time of the current tick since the session start
+
+        Returns:
+            True if the collector should collect on this tick
+        """
+        if self.period_ns is None:
+            return True
+        if elapsed_ns < self._next_due_ns:
+            return False
+        self._next_due_ns = (elapsed_ns // self.period_ns + 1) * self.period_ns
+        return True
+
+
+@register_collector
+class CPUCollector(Collector):
+    """Overall CPU utilization and frequency."""
+
+    name = "cpu"
+
+    def schema(self) -> Dict[str, str]:
+        return {"cpu_percent": "float64", "cpu_freq_current": "float64"}
+
+    def collect(self) -> Dict[str, Any]:
+        return self.monitor.get_cpu_info()
+
+
+@register_collector
+class MemoryCollector(Collector):
+    """System RAM usage."""
+
+    name = "memory"
+
+    def schema(self) -> Dict[str, str]:
+        return {
+            "ram_total_gb": "float64",
+            "ram_used_gb": "float64",
+            "ram_available_gb": "float64",
+            "ram_percent": "float64",
+        }
+
+    def collect(self) -> Dict[str, Any]:
+        return self.monitor.get_memory_info()
+
+
+@register_collector
+class GPUCollector(Collector):
+    """Load, memory and temperature of each NVIDIA GPU."""
+
+    name = "gpu"
+
+    _FIELDS = (
+        "gpu_load",
+        "gpu_memory_used_mb",
+        "gpu_memory_percent",
+        "gpu_temperature",
+    )
+
+    def schema(self) -> Dict[str, str]:
+        return {
+            f"gpu_{i}_{field}": "float64"
+            for i in range(len(self.monitor._gpu_handles()))
+            for field in self._FIELDS
+        }
+
+    def collect(self) -> Dict[str, Any]:
+        return {
+            f"gpu_{i}_{key}": value
+            for i, gpu in enumerate(self.monitor.get_gpu_info())
+            for key, value in gpu.items()
+        }
+
+
+@register_collector
+class PerCoreCPUCollector(Collector):
+    """Utilization of each CPU core with its user/system/iowait/steal split.
+
+    All cores are read with one ``cpu_times(percpu=True)`` call and the
+    deltas since the previous collection are computed with NumPy, so the
+    cost barely grows with the core count. Each metric is one float32 array
+    per sample, stored as a (samples, cores) block by the ``SampleStore``.
+    iowait and steal are NaN on platforms that do not report them.
+    """
+
+    name = "cpu_cores"
+
+    FIELDS = ("user", "system", "iowait", "steal")
+
+    def __init__(self, monitor: "SystemMonitor", period: Optional[float] = None):
+        super().__init__(monitor, period)
+        times = psutil.cpu_times(percpu=True)
+        self.n_cores = len(times)
+        fields = times[0]._fields
+        self._idle = [fields.index(f) for f in ("idle", "iowait") if f in fields]
+        # guest time is already counted in user time on Linux
+        self._total = [
+            i for i, f in enumerate(fields) if f not in ("guest", "guest_nice")
+        ]
+        self._split = [fields.index(f) if f in fields else None for f in self.FIELDS]
+        self._last = np.array(times, dtype=np.float64)
+
+    def schema(self) -> Dict[str, Any]:
+        return {
+            f"cpu_core_{metric}": ("float32", self.n_cores)
+            for metric in ("percent", *self.FIELDS)
+        }
+
+    def collect(self) -> Dict[str, Any]:
+        times = np.array(psutil.cpu_times(percpu=True), dtype=np.float64)
+        if times.shape != self._last.shape:
+            # Cores went on- or offline; the block width is fixed.
+            self._last = times
+            return {}
+        delta = times - self._last
+        self._last = times
+        total = delta[:, self._total].sum(axis=1)
+        # Cores without ticks since the last collection report 0 % instead
+        # of dividing by zero.
+        scale = np.divide(100.0, total, out=np.zeros_like(total), where=total > 0)
+
+        busy = total - delta[:, self._idle].sum(axis=1)
+        sample = {"cpu_core_percent": np.clip(busy * scale, 0, 100)}
+        for metric, index in zip(self.FIELDS, self._split):
+            if index is None:
+                sample[f"cpu_core_{metric}"] = np.full(self.n_cores, np.nan)
+            else:
+                sample[f"cpu_core_{metric}"] = np.clip(delta[:, index] * scale, 0, 100)
+        return {name: values.astype(np.float32) for name, values in sample.items()}
+
+
+@register_collector
+class ProcessCollector(Collector):
+    """Resources used by the monitored process and all its descendants.
+
+    Tracks ``SystemMonitor.pid`` (the current process by default), leaving
+    out the processes in ``SystemMonitor.exclude_pids``. The process tree
+    is re-listed on every collection: new children are picked up as they
+    appear, and exited ones are dropped with their last seen CPU time and
+    I/O bytes folded into running totals, so the cumulative counters never
+    go backwards. CPU time a child spends after its last collection is not
+    seen.
+
+    Metrics another user's process does not expose (e.g. USS or I/O
+    counters without permission, or I/O on macOS) are summed over the
+    processes that do, and left empty if none does.
+    """
+
+    name = "process"
+
+    def __init__(self, monitor: "SystemMonitor", period: Optional[float] = None):
+        super().__init__(monitor, period)
+        self.pid = monitor.pid
+        # Shared with the monitor, which may add PIDs after construction
+        self.exclude_pids: Set[int] = monitor.exclude_pids
+        self._root: Optional[psutil.Process] = None
+        self._known: Set[psutil.Process] = set()
+        # Last seen (user s, system s, read bytes, write bytes) per live
+        # process, and the sum of these over exited processes
+        self._counters: Dict[psutil.Process, tuple] = {}
+        self._exited = (0.0, 0.0, 0, 0)
+        self._last_cpu: Optional[tuple] = None  # (cpu seconds, perf_counter)
+        self._io_seen = False
+        self._lost = False
+
+    def schema(self) -> Dict[str, str]:
+        return {
+            "proc_count": "int64",
+            "proc_rss_mb": "float64",
+            "proc_uss_mb": "float64",
+            "proc_cpu_user_s": "float64",
+            "proc_cpu_system_s": "float64",
+            "proc_cpu_percent": "float64",
+            "proc_num_threads": "int64",
+            "proc_num_fds": "int64",
+            "proc_io_read_bytes": "int64",
+            "proc_io_write_bytes": "int64",
+        }
+
+    def _tree(self) -> List[psutil.Process]:
+        if self._root is None:
+            self._root = psutil.Process(self.pid)
+        if not self._root.is_running():
+            raise psutil.NoSuchProcess(self.pid)
+        try:
+            children = self._root.children(recursive=True)
+        except psutil.NoSuchProcess:
+            children = []
+        children = [proc for proc in children if proc.pid not in self.exclude_pids]
+        # Process objects compare by PID and creation time, so a reused PID
+        # counts as a new process.
+        current = {self._root, *children}
+        for proc in self._known - current:
+            self._retire(proc)
+        self._known = current
+        return [self._root, *children]
+
+    def _retire(self, proc: psutil.Process):
+        last = self._counters.pop(proc, None)
+        if last is not None:
+            self._exited = tuple(a + (b or 0) for a, b in zip(self._exited, last))
+
+    def collect(self) -> Dict[str, Any]:
+        try:
+            tree = self._tree()
+        except psutil.Error as e:
+            if not self._lost:
+                logger.warning(f"Cannot monitor process {self.pid}: {e}")
+                self._lost = True
+            return {}
+
+        totals: Dict[str, Any] = {
+            "rss": 0,
+            "uss": None,
+            "threads": 0,
+            "fds": None,
+        }
+        count = 0
+        for proc in tree:
+            try:
+                with proc.oneshot():
+                    self._counters[proc] = self._read_counters(proc)
+                    totals["rss"] += proc.memory_info().rss
+                    totals["threads"] += proc.num_threads()
+                    _add(totals, "uss", _uss(proc))
+                    _add(totals, "fds", _num_fds(proc))
+                count += 1
+            except psutil.NoSuchProcess:
+                # Exited since listing; retired on the next collection.
+                continue
+            except psutil.AccessDenied:
+                count += 1
+
+        user, system, read, write = self._exited
+        for counters in self._counters.values():
+            user += counters[0]
+            system += counters[1]
+            if counters[2] is not None:
+                read += counters[2]
+                write += counters[3]
+                self._io_seen = True
+
+        now = time.perf_counter()
+        cpu_percent = None
+        if self._last_cpu is not None and now > self._last_cpu[1]:
+            cpu_s, then = self._last_cpu
+            cpu_percent = max(0.0, (user + system - cpu_s) / (now - then) * 100)
+        self._last_cpu = (user + system, now)
+
+        return {
+            "proc_count": count,
+            "proc_rss_mb": totals["rss"] / (1024**2),
+            "proc_uss_mb": (
+                None if totals["uss"] is None else totals["uss"] / (1024**2)
+            ),
+            "proc_cpu_user_s": user,
+            "proc_cpu_system_s": system,
+            "proc_cpu_percent": cpu_percent,
+            "proc_num_threads": totals["threads"],
+            "proc_num_fds": totals["fds"],
+            "proc_io_read_bytes": read if self._io_seen else None,
+            "proc_io_write_bytes": write if self._io_seen else None,
+        }
+
+    @staticmethod
+    def _read_counters(proc: psutil.Process) -> tuple:
+        cpu = proc.cpu_times()
+        try:
+            io = proc.io_counters()
+            read, write = io.read_bytes, io.write_bytes
+        except (AttributeError, psutil.AccessDenied):
+            read = write = None
+        return cpu.user, cpu.system, read, write
+
+
+def _add(totals: Dict[str, Any], key: str, value: Optional[int]):
+    if value is not None:
+        totals[key] = (totals[key] or 0) + value
+
+
+def _uss(proc: psutil.Process) -> Optional[int]:
+    try:
+        return proc.memory_full_info().uss
+    except (AttributeError, psutil.AccessDenied):
+        return None
+
+
+def _num_fds(proc: psutil.Process) -> Optional[int]:
+    try:
+        if hasattr(proc, "num_fds"):
+            return proc.num_fds()
+        return proc.num_handles()  # Windows
+    except psutil.AccessDenied:
+        return None
+
+
+def _counter_delta(current: int, previous: int) -> int:
+    """
+    Increase of a monotonic counter between two readings.
+
+    A counter that went backwards is taken to have wrapped once, at 2**32
+    if the previous reading fit in 32 bits (as on 32-bit kernels and some
+    NIC drivers), otherwise at 2**64. If that would mean an increase of
+    more than half the counter range, the counter was reset instead (e.g.
+    a re-attached device) and counts from zero.
+    """
+    if current >= previous:
+        return current - previous
+    modulus = 2**32 if previous < 2**32 else 2**64
+    wrapped = current + modulus - previous
+    return current if wrapped > modulus // 2 else wrapped
+
+
+class _RateCollector(Collector):
+    """Base for collectors that turn cumulative per-device counters into rates.
+
+    psutil is queried with ``nowrap=False`` and wraparound is handled here
+    per collector, instead of in psutil's process-wide cache that every
+    caller shares. The first collection only records the counters; devices
+    that appear later get their columns from their second collection on.
+    These are not in the schema, so a ``stream_to`` CSV (whose header is
+    fixed) drops them with a warning; the in-memory samples keep them.
+    """
+
+    def __init__(self, monitor: "SystemMonitor", period: Optional[float] = None):
+        super().__init__(monitor, period)
+        self._previous = self._read()
+        self._then = time.perf_counter()
+        self.devices = list(self._previous)
+
+    def _read(self) -> Dict[str, Any]:
+        """Return the cumulative counters of each device."""
+        raise NotImplementedError
+
+    def _rates(self, device: str, delta: Dict[str, int], seconds: float) -> Dict:
+        """Turn one device's counter deltas into its sample values."""
+        raise NotImplementedError
+
+    def collect(self) -> Dict[str, Any]:
+        counters = self._read()
+        now = time.perf_counter()
+        seconds = now - self._then
+        previous, self._previous, self._then = self._previous, counters, now
+        if seconds <= 0:
+            return {}
+
+        sample = {}
+        for device, current in counters.items():
+            if device not in previous:
+                continue
+            delta = {
+                field: _counter_delta(value, getattr(previous[device], field))
+                for field, value in current._asdict().items()
+            }
+            sample.update(self._rates(device, delta, seconds))
+        return sample
+
+
+@register_collector
+class DiskIOCollector(_RateCollector):
+    """Throughput, operations and latency of each block device.
+
+    Per device: bytes/s and operations/s for reads and writes, the average
+    time per read and write operation in the interval (ms), and on Linux
+    the share of the interval the device was busy. Loop and RAM devices
+    are skipped, and so are partitions where the OS lists whole disks in
+    ``/sys/block`` (Linux): their I/O is already counted in their disk's.
+    Network filesystems such as NFS do not show up here but in the traffic
+    of the network collector.
+    """
+
+    name = "disk"
+
+    _SKIP_PREFIXES = ("loop", "ram", "zram")
+    _SYS_BLOCK = Path("/sys/block")
+
+    def _read(self) -> Dict[str, Any]:
+        counters = psutil.disk_io_counters(perdisk=True, nowrap=False) or {}
+        # Re-listed on every read, so disks attached later are kept
+        disks = set(os.listdir(self._SYS_BLOCK)) if self._SYS_BLOCK.is_dir() else None
+        return {
+            device: values
+            for device, values in counters.items()
+            if not device.startswith(self._SKIP_PREFIXES)
+            and (disks is None or device in disks)
+        }
+
+    def schema(self) -> Dict[str, Any]:
+        fields = (
+            "read_bytes_s",
+            "write_bytes_s",
+            "read_ops_s",
+            "write_ops_s",
+            "read_latency_ms",
+            "write_latency_ms",
+            "busy_percent",
+        )
+        return {
+            f"disk_{device}_{field}": "float64"
+            for device in self.devices
+            for field in fields
+        }
+
+    def _rates(self, device: str, delta: Dict[str, int], seconds: float) -> Dict:
+        prefix = f"disk_{device}_"
+        rates = {
+            f"{prefix}read_bytes_s": delta["read_bytes"] / seconds,
+            f"{prefix}write_bytes_s": delta["write_bytes"] / seconds,
+            f"{prefix}read_ops_s": delta["read_count"] / seconds,
+            f"{prefix}write_ops_s": delta["write_count"] / seconds,
+        }
+        # Average latency over the operations completed in the interval;
+        # undefined when there were none.
+        for op in ("read", "write"):
+            count = delta[f"{op}_count"]
+            time_ms = delta.get(f"{op}_time")
+            rates[f"{prefix}{op}_latency_ms"] = (
+                time_ms / count if count and time_ms is not None else None
+            )
+        busy_ms = delta.get("busy_time")
+        rates[f"{prefix}busy_percent"] = (
+            None if busy_ms is None else min(100.0, busy_ms / (seconds * 10))
+        )
+        return rates
+
+
+@register_collector
+class NetworkIOCollector(_RateCollector):
+    """Traffic, packets, errors and drops of each network interface.
+
+    Per interface: bytes/s and packets/s sent and received, plus errors/s
+    and drops/s over both directions.
+    """
+
+    name = "network"
+
+    def _read(self) -> Dict[str, Any]:
+        return psutil.net_io_counters(pernic=True, nowrap=False) or {}
+
+    def schema(self) -> Dict[str, Any]:
+        fields = (
+            "sent_bytes_s",
+            "recv_bytes_s",
+            "sent_packets_s",
+            "recv_packets_s",
+            "errors_s",
+            "drops_s",
+        )
+        return {
+            f"net_{nic}_{field}": "float64" for nic in self.devices for field in fields
+        }
+
+    def _rates(self, device: str, delta: Dict[str, int], seconds: float) -> Dict:
+        prefix = f"net_{device}_"
+        return {
+            f"{prefix}sent_bytes_s": delta["bytes_sent"] / seconds,
+            f"{prefix}recv_bytes_s": delta["bytes_recv"] / seconds,
+            f"{prefix}sent_packets_s": delta["packets_sent"] / seconds,
+            f"{prefix}recv_packets_s": delta["packets_recv"] / seconds,
+            f"{prefix}errors_s": (delta["errin"] + delta["errout"]) / seconds,
+            f"{prefix}drops_s": (delta["dropin"] + delta["dropout"]) / seconds,
+        }
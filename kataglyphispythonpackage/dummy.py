@@ -1,61 +1,831 @@
+import json
+import queue
+import sys
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple, Union
+
 import numpy as np
 from loguru import logger
+from numpy.typing import DTypeLike
+
+from kataglyphispythonpackage import categorical, fused, quantile_sketch, running_stats
+from kataglyphispythonpackage.categorical import CategoricalLabels
+from kataglyphispythonpackage.fused import fused_label_stats
+from kataglyphispythonpackage.instrumentation import StageProfiler
+from kataglyphispythonpackage.pipeline_cache import (
+    PipelineCache,
+    code_fingerprint,
+    package_version,
+)
+from kataglyphispythonpackage.pipeline_result import PipelineResult
+from kataglyphispythonpackage.quantile_sketch import QuantileSketch
+from kataglyphispythonpackage.running_stats import RunningStats
+
+
+DEFAULT_CHUNK_SIZE = 65_536
+DEFAULT_N_FEATURES = 3
+# Default chunks hold as many values as DEFAULT_CHUNK_SIZE rows of the default
+# width, so wide matrices get proportionally fewer rows per chunk.
+DEFAULT_CHUNK_ELEMENTS = DEFAULT_CHUNK_SIZE * DEFAULT_N_FEATURES
+JOKE_CATEGORIES = ("Possibly Not", "Definitely ML")
+# Spawn-key branches for shuffle orders and quantile sketch compactions,
+# beyond any reachable chunk index.
+_SHUFFLE_BRANCH = 2**63
+_SKETCH_BRANCH = 2**63 + 1
+
+
+@lru_cache(maxsize=1)
+def _code_fingerprint() -> str:
+    # Everything that shapes the cached pipeline outputs.
+    return code_fingerprint(
+        [sys.modules[__name__], fused, running_stats, categorical, quantile_sketch]
+    )
+
+
+def _apply_scaling(batch: np.ndarray, out: np.ndarray, params: tuple) -> np.ndarray:
+    center, scale, low, high = params
+    if low is not None:
+        batch = np.clip(batch, low, high, out=out)
+    np.subtract(batch, center, out=out)
+    return np.divide(out, scale, out=out)
+
+
+def _chunk_rng(seed_sequence: np.random.SeedSequence, index: int):
+    # Equivalent to seed_sequence.spawn(n)[index], without spawning all n.
+    child = np.random.SeedSequence(
+        seed_sequence.entropy, spawn_key=(*seed_sequence.spawn_key, index)
+    )
+    return np.random.default_rng(child)
+
+
+def _chunk_sketch(
+    block: np.ndarray, seed_sequence: np.random.SeedSequence, index: int
+) -> QuantileSketch:
+    # Chunk i's compaction coins depend only on i, so merging the chunk
+    # sketches in index order gives the same sketch for any n_workers.
+    seed = np.random.SeedSequence(
+        seed_sequence.entropy,
+        spawn_key=(*seed_sequence.spawn_key, _SKETCH_BRANCH, index),
+    )
+    return QuantileSketch(seed=seed).update(block)
+
+
+def _merge_chunks(
+    results: Sequence[Tuple[RunningStats, Optional[QuantileSketch]]],
+) -> Tuple[RunningStats, Optional[QuantileSketch]]:
+    # Always in chunk-index order: floating-point merges are not associative,
+    # so regrouping them per worker would change the last bits.
+    running = RunningStats()
+    sketch = None
+    for chunk_running, chunk_sketch in results:
+        running.merge(chunk_running)
+        if chunk_sketch is not None:
+            sketch = chunk_sketch if sketch is None else sketch.merge(chunk_sketch)
+    return running, sketch
+
+
+def _draw_chunk(
+    block: np.ndarray, seed_sequence: np.random.SeedSequence, index: int
+) -> np.ndarray:
+    _chunk_rng(seed_sequence, index).standard_normal(dtype=block.dtype, out=block)
+    block *= 2.0
+    block += 5.0
+    return block
+
+
+def _fill_chunks(
+    features: np.ndarray,
+    labels: np.ndarray,
+    seed_sequence: np.random.SeedSequence,
+    indices: Sequence[int],
+    chunk_size: int,
+    threshold: float,
+    sketch: bool = False,
+) -> List[Tuple[RunningStats, Optional[QuantileSketch]]]:
+    # Writes straight into the shared output, one chunk at a time; chunk i
+    # only depends on its own child seed, never on which worker fills it.
+    # Labels, column moments and (if sketch) the quantile sketch are taken
+    # while the fresh chunk is in cache, and returned per chunk for the
+    # caller to merge in index order.
+    results = []
+    for index in indices:
+        rows = slice(index * chunk_size, (index + 1) * chunk_size)
+        block = _draw_chunk(features[rows], seed_sequence, index)
+        running = fused_label_stats(block, threshold, labels=labels[rows])[1]
+        chunk_sketch = _chunk_sketch(block, seed_sequence, index) if sketch else None
+        results.append((running, chunk_sketch))
+    return results
+
+
+def _fill_stored_chunks(
+    storage_dir: Path,
+    seed_sequence: np.random.SeedSequence,
+    indices: Sequence[int],
+    chunk_size: int,
+    threshold: float,
+    sketch: bool = False,
+) -> List[Tuple[RunningStats, Optional[QuantileSketch]]]:
+    # Runs in worker processes: each one maps the shared .npy files itself.
+    features = np.load(storage_dir / "features.npy", mmap_mode="r+")
+    labels = np.load(storage_dir / "labels.npy", mmap_mode="r+")
+    results = _fill_chunks(
+        features, labels, seed_sequence, indices, chunk_size, threshold, sketch
+    )
+    features.flush()
+    labels.flush()
+    return results
 
 
 class SimpleMLPreprocessor:
-    def __init__(self, n_samples: int):
+    def __init__(
+        self,
+        n_samples: int,
+        seed: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        storage_dir: Optional[Union[str, Path]] = None,
+        n_workers: int = 1,
+        executor: Union[str, Executor] = "thread",
+        dtype: DTypeLike = np.float64,
+        n_features: int = DEFAULT_N_FEATURES,
+        cache: Optional[PipelineCache] = None,
+        scaling: str = "standard",
+        quantile_range: tuple = (25.0, 75.0),
+        clip_percentiles: Optional[tuple] = None,
+        instrument: bool = False,
+        stage_callback: Optional[Callable[[str, dict], None]] = None,
+    ):
+        if n_features <= 0:
+            raise ValueError(f"n_features must be positive, got {n_features}")
+        if chunk_size is None:
+            chunk_size = max(1, DEFAULT_CHUNK_ELEMENTS // n_features)
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        dtype = np.dtype(dtype)
+        if dtype not in (np.float32, np.float64):
+            raise ValueError(f"dtype must be float32 or float64, got {dtype}")
+        if n_workers <= 0:
+            raise ValueError(f"n_workers must be positive, got {n_workers}")
+        if executor not in ("thread", "process") and not isinstance(executor, Executor):
+            raise ValueError(f"Unknown executor: {executor!r}")
+        if executor == "process" and storage_dir is None:
+            raise ValueError("The process executor requires a storage_dir memmap.")
+        if scaling not in ("standard", "robust"):
+            raise ValueError(f"scaling must be 'standard' or 'robust', got {scaling!r}")
+        for name, percentiles in (
+            ("quantile_range", quantile_range),
+            ("clip_percentiles", clip_percentiles),
+        ):
+            if (
+                percentiles is not None
+                and not 0 <= percentiles[0] < percentiles[1] <= 100
+            ):
+                raise ValueError(f"{name} must satisfy 0 <= low < high <= 100")
+
         self.n_samples = n_samples
+        self.n_features = n_features
+        # Each feature is drawn around 5.0, so this generalizes the original
+        # "sum > 15" rule for three features to any width.
+        self.label_threshold = 5.0 * n_features
+        self.chunk_size = chunk_size
+        self.seed = seed
+        # Chunk i is always drawn from the i-th child of this sequence, so a
+        # chunk can be regenerated on demand instead of being kept in memory.
+        self.seed_sequence = np.random.SeedSequence(seed)
+        # Shuffle orders come from a separate branch (one child per epoch),
+        # so they never reuse the bit stream of a chunk.
+        self._shuffle_seeds = np.random.SeedSequence(
+            self.seed_sequence.entropy,
+            spawn_key=(*self.seed_sequence.spawn_key, _SHUFFLE_BRANCH),
+        )
+        # When set, arrays live in .npy memmaps under this directory instead
+        # of RAM, so datasets larger than physical memory can be processed.
+        self.storage_dir = Path(storage_dir) if storage_dir is not None else None
+        self.n_workers = n_workers
+        self.executor = executor
+        self.dtype = dtype
+        self.cache = cache
+        # "robust" centers on the median and scales by the inter-quantile
+        # range, both estimated in one pass with a mergeable QuantileSketch.
+        self.scaling = scaling
+        self.quantile_range = tuple(quantile_range)
+        self.clip_percentiles = (
+            tuple(clip_percentiles) if clip_percentiles is not None else None
+        )
+        # Per-stage timing/memory records for run_pipeline; a callback
+        # implies instrumentation. Disabled stages run without any wrapping.
+        self.instrument = instrument or stage_callback is not None
+        self.stage_callback = stage_callback
+        if cache is not None and seed is None:
+            logger.warning("Pipeline caching needs a fixed seed; cache disabled.")
         self.features = np.array([])
         self.labels = np.array([])
         self.normalized = np.array([])
         self.stats = {}
+        self.fitted_stats: Optional[RunningStats] = None
+        self.fitted_sketch: Optional[QuantileSketch] = None
+        self._feature_stats: tuple = (None, None, None)
+        self._transform_params: dict = {}
+
+    @classmethod
+    def open(
+        cls, storage_dir: Union[str, Path], chunk_size: Optional[int] = None
+    ) -> "SimpleMLPreprocessor":
+        """Reopen a dataset previously written to ``storage_dir`` zero-copy."""
+        storage_dir = Path(storage_dir)
+        features_path = storage_dir / "features.npy"
+        if not features_path.exists():
+            raise FileNotFoundError(f"No stored features found in {storage_dir}")
+
+        features = np.load(features_path, mmap_mode="r")
+        ml = cls(
+            len(features),
+            chunk_size=chunk_size,
+            storage_dir=storage_dir,
+            n_features=features.shape[1],
+        )
+        ml.features = features
+        if (storage_dir / "labels.npy").exists():
+            ml.labels = np.load(storage_dir / "labels.npy", mmap_mode="r")
+        if (storage_dir / "normalized.npy").exists():
+            ml.normalized = np.load(storage_dir / "normalized.npy", mmap_mode="r")
+        logger.info(f"Opened {ml.n_samples} stored samples from {storage_dir}")
+        return ml
+
+    def _allocate(self, name: str, shape: tuple, dtype) -> np.ndarray:
+        if self.storage_dir is None:
+            return np.empty(shape, dtype=dtype)
+        self.storage_dir.mkdir(parents=True, exist_ok=True)
+        return np.lib.format.open_memmap(
+            self.storage_dir / f"{name}.npy", mode="w+", dtype=dtype, shape=shape
+        )
+
+    @property
+    def n_chunks(self) -> int:
+        return -(-self.n_samples // self.chunk_size)
+
+    def _chunk_bounds(self, index: int) -> tuple:
+        start = index * self.chunk_size
+        return start, min(start + self.chunk_size, self.n_samples)
+
+    def _generate_chunk(self, index: int) -> np.ndarray:
+        start, stop = self._chunk_bounds(index)
+        block = np.empty((stop - start, self.n_features), dtype=self.dtype)
+        return _draw_chunk(block, self.seed_sequence, index)
+
+    def _fill_in_parallel(self) -> Tuple[RunningStats, Optional[QuantileSketch]]:
+        groups = [
+            group.tolist()
+            for group in np.array_split(np.arange(self.n_chunks), self.n_workers)
+            if len(group)
+        ]
+        sketch = self.scaling == "robust"
+        if len(groups) <= 1:
+            return _merge_chunks(
+                _fill_chunks(
+                    self.features,
+                    self.labels,
+                    self.seed_sequence,
+                    range(self.n_chunks),
+                    self.chunk_size,
+                    self.label_threshold,
+                    sketch,
+                )
+            )
+
+        # Worker processes cannot see this process' memory, so they map the
+        # .npy files themselves; threads write into the arrays directly.
+        owned = not isinstance(self.executor, Executor)
+        use_files = self.executor == "process" or isinstance(
+            self.executor, ProcessPoolExecutor
+        )
+        if use_files and self.storage_dir is None:
+            raise ValueError("The process executor requires a storage_dir memmap.")
+
+        if not owned:
+            pool = self.executor
+        elif use_files:
+            pool = ProcessPoolExecutor(max_workers=self.n_workers)
+        else:
+            pool = ThreadPoolExecutor(max_workers=self.n_workers)
+
+        try:
+            if use_files:
+                self.features.flush()
+                self.labels.flush()
+                futures = [
+                    pool.submit(
+                        _fill_stored_chunks,
+                        self.storage_dir,
+                        self.seed_sequence,
+                        group,
+                        self.chunk_size,
+                        self.label_threshold,
+                        sketch,
+                    )
+                    for group in groups
+                ]
+            else:
+                futures = [
+                    pool.submit(
+                        _fill_chunks,
+                        self.features,
+                        self.labels,
+                        self.seed_sequence,
+                        group,
+                        self.chunk_size,
+                        self.label_threshold,
+                        sketch,
+                    )
+                    for group in groups
+                ]
+            # Groups are contiguous and submitted in order, so this is
+            # chunk-index order.
+            return _merge_chunks(
+                [result for future in futures for result in future.result()]
+            )
+        finally:
+            if owned:
+                pool.shutdown()
 
     def generate_synthetic_data(self) -> tuple:
         logger.debug(
             f"Generating {self.n_samples} samples of synthetic features and labels..."
         )
-        self.features = np.random.normal(loc=5.0, scale=2.0, size=(self.n_samples, 3))
-        self.labels = (self.features.sum(axis=1) > 15).astype(int)
+        if (
+            self.storage_dir is None
+            and self.seed is None
+            and self.n_workers == 1
+            and self.dtype == np.float64
+        ):
+            self.features = np.random.normal(
+                loc=5.0, scale=2.0, size=(self.n_samples, self.n_features)
+            )
+            self.labels, running = fused_label_stats(
+                self.features, self.label_threshold
+            )
+            sketch = None
+        else:
+            # Seeded, stored and parallel runs share the chunked generator, so
+            # a given seed gives identical data for any n_workers or backend.
+            self.features = self._allocate(
+                "features", (self.n_samples, self.n_features), self.dtype
+            )
+            self.labels = self._allocate("labels", (self.n_samples,), np.int64)
+            running, sketch = self._fill_in_parallel()
+            if self.storage_dir is not None:
+                self.features.flush()
+                self.labels.flush()
+        # Remember which array these statistics describe, so that
+        # normalize_features can skip its own pass over the same data.
+        self._feature_stats = (self.features, running, sketch)
         logger.info(f"First 5 feature vectors: {self.features[:5]}")
         logger.info(f"First 5 labels: {self.labels[:5]}")
         return self.features, self.labels
 
-    def normalize_features(self) -> np.ndarray:
+    def normalize_features(
+        self, out: Optional[np.ndarray] = None, inplace: bool = False
+    ) -> np.ndarray:
+        """Scale the features chunk by chunk without full-size temporaries.
+
+        ``inplace=True`` overwrites ``self.features`` with the normalized
+        values and ``out`` writes into a caller-provided buffer; both keep
+        peak memory at roughly one feature matrix.
+        """
         if self.features.size == 0:
             logger.warning("No features to normalize.")
             return np.array([])
 
-        mean = self.features.mean(axis=0)
-        std = self.features.std(axis=0)
-        self.normalized = (self.features - mean) / std
+        self._fit_features()
 
-        self.stats = {"mean": mean.tolist(), "std": std.tolist()}
+        if inplace:
+            if out is not None:
+                raise ValueError("Pass either out or inplace=True, not both.")
+            out = self.features
+        if out is None:
+            dtype = self.features.dtype
+            if not np.issubdtype(dtype, np.floating):
+                dtype = self.dtype
+            out = self._allocate("normalized", self.features.shape, dtype)
+        elif out.shape != self.features.shape:
+            raise ValueError(
+                f"out has shape {out.shape}, expected {self.features.shape}"
+            )
+        if not out.flags.writeable or not np.issubdtype(out.dtype, np.floating):
+            raise ValueError("Normalization output must be a writable float array.")
+
+        params = self._transform_parameters(out.dtype)
+        for start in range(0, len(self.features), self.chunk_size):
+            rows = slice(start, start + self.chunk_size)
+            _apply_scaling(self.features[rows], out[rows], params)
+        if isinstance(out, np.memmap):
+            out.flush()
+        self.normalized = out
+        if out is self.features:
+            self._feature_stats = (None, None, None)
         logger.debug(f"Feature normalization stats: {self.stats}")
         return self.normalized
 
-    def apply_joke_labeling(self) -> np.ndarray:
+    def _feature_statistics(self) -> RunningStats:
+        source, running, _ = self._feature_stats
+        if source is not self.features:
+            running = RunningStats()
+            for start in range(0, len(self.features), self.chunk_size):
+                running.update(self.features[start : start + self.chunk_size])
+        return running
+
+    def _feature_sketch(self) -> Optional[QuantileSketch]:
+        if self.scaling != "robust":
+            return None
+        source, _, sketch = self._feature_stats
+        if source is self.features and sketch is not None:
+            # Built (and merged across workers) during generation
+            return sketch
+        # Same per-chunk seeds and merge order as generation, so a restored
+        # or reloaded dataset gets the identical sketch.
+        sketch = None
+        for index, start in enumerate(range(0, len(self.features), self.chunk_size)):
+            block = self.features[start : start + self.chunk_size]
+            chunk_sketch = _chunk_sketch(block, self.seed_sequence, index)
+            sketch = chunk_sketch if sketch is None else sketch.merge(chunk_sketch)
+        return sketch
+
+    def _fit_features(self):
+        self._set_fitted_stats(self._feature_statistics(), self._feature_sketch())
+
+    def _set_fitted_stats(
+        self, running: RunningStats, sketch: Optional[QuantileSketch] = None
+    ):
+        self.fitted_stats = running
+        self.fitted_sketch = sketch
+        self._transform_params = {}
+        self.stats = {"mean": running.mean.tolist(), "std": running.std.tolist()}
+        if self.scaling == "robust" and sketch is not None:
+            center, scale, _, _ = self._transform_parameters(np.float64)
+            self.stats.update({"median": center.tolist(), "iqr": scale.tolist()})
+
+    def _transform_parameters(self, dtype) -> tuple:
+        # (center, scale, clip_low, clip_high), cast once per dtype so small
+        # serving batches skip the conversion.
+        params = self._transform_params.get(np.dtype(dtype))
+        if params is not None:
+            return params
+
+        if self.scaling == "standard":
+            center, scale = self.fitted_stats.mean, self.fitted_stats.std
+            low = high = None
+        else:
+            if self.fitted_sketch is None:
+                raise RuntimeError("Robust scaling needs a fitted quantile sketch.")
+            percentiles = [50.0, *self.quantile_range, *(self.clip_percentiles or ())]
+            values = self.fitted_sketch.quantile(np.array(percentiles) / 100)
+            center, scale = values[0], values[2] - values[1]
+            low, high = (
+                (values[3], values[4]) if self.clip_percentiles else (None, None)
+            )
+
+        params = tuple(
+            None if value is None else value.astype(dtype)
+            for value in (center, scale, low, high)
+        )
+        self._transform_params[np.dtype(dtype)] = params
+        return params
+
+    def _fitted_state(self) -> dict:
+        state = self.fitted_stats.to_dict()
+        if self.fitted_sketch is not None:
+            state["sketch"] = self.fitted_sketch.to_dict()
+        return state
+
+    def _restore_fitted_state(self, state: dict):
+        sketch = None
+        if "sketch" in state:
+            sketch = QuantileSketch.from_dict(state["sketch"], seed=self.seed)
+        self._set_fitted_stats(RunningStats.from_dict(state), sketch)
+
+    def partial_fit(self, batch: np.ndarray) -> "SimpleMLPreprocessor":
+        """Fold one batch into the fitted normalization statistics."""
+        running = self.fitted_stats if self.fitted_stats is not None else RunningStats()
+        sketch = self.fitted_sketch
+        if self.scaling == "robust":
+            sketch = sketch if sketch is not None else QuantileSketch(seed=self.seed)
+            sketch.update(batch)
+        self._set_fitted_stats(running.update(batch), sketch)
+        return self
+
+    def transform(
+        self, batch: np.ndarray, out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Normalize a batch with the fitted statistics, without rescanning."""
+        if self.fitted_stats is None or self.fitted_stats.count == 0:
+            raise RuntimeError("Statistics are not fitted; call partial_fit first.")
+
+        batch = np.asarray(batch)
+        if self.normalized is self.features and np.may_share_memory(
+            batch, self.features
+        ):
+            raise ValueError(
+                "The features were normalized in place; they must not be "
+                "transformed again."
+            )
+        dtype = batch.dtype if np.issubdtype(batch.dtype, np.floating) else self.dtype
+        if out is None:
+            out = np.empty(batch.shape, dtype=dtype)
+        return _apply_scaling(batch, out, self._transform_parameters(out.dtype))
+
+    def iter_batches(
+        self, batch_size: int, shuffle: bool = False, prefetch: int = 2
+    ) -> Iterator[tuple]:
+        """Yield normalized ``(features, labels)`` mini-batches.
+
+        A background thread prepares up to ``prefetch`` batches ahead while
+        the consumer works on the current one. Batches are normalized with
+        the fitted statistics, fitting them on the features if needed, or
+        taken as they are after ``normalize_features(inplace=True)``.
+        """
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+        if prefetch < 0:
+            raise ValueError(f"prefetch must be non-negative, got {prefetch}")
+        if self.features.size == 0:
+            self.generate_synthetic_data()
+        if self.fitted_stats is None:
+            self._fit_features()
+
+        n_rows = len(self.features)
+        order = None
+        if shuffle:
+            # A fresh child per call: each epoch is shuffled differently, but
+            # the sequence of epochs is reproducible for a seeded instance.
+            rng = np.random.default_rng(self._shuffle_seeds.spawn(1)[0])
+            order = rng.permutation(n_rows)
+
+        # Normalized in place: the features already hold the batch values.
+        normalized = self.normalized is self.features
+
+        def make_batch(start: int) -> tuple:
+            if order is None:
+                rows = slice(start, start + batch_size)
+                if normalized:
+                    return self.features[rows].copy(), self.labels[rows]
+                return self.transform(self.features[rows]), self.labels[rows]
+            rows = order[start : start + batch_size]
+            features = self.features[rows]
+            if normalized:
+                return features, self.labels[rows]
+            return self.transform(features, out=features), self.labels[rows]
+
+        starts = range(0, n_rows, batch_size)
+        if prefetch == 0:
+            for start in starts:
+                yield make_batch(start)
+            return
+
+        ready: queue.Queue = queue.Queue(maxsize=prefetch)
+        stop = threading.Event()
+        done = object()
+
+        def put(item) -> bool:
+            while not stop.is_set():
+                try:
+                    ready.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce():
+            try:
+                for start in starts:
+                    if not put(make_batch(start)):
+                        return
+            except Exception as e:
+                put(e)
+                return
+            put(done)
+
+        producer = threading.Thread(target=produce, name="batch-prefetch", daemon=True)
+        producer.start()
+        try:
+            while True:
+                item = ready.get()
+                if item is done:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+            producer.join()
+
+    def save_stats(self, path: Union[str, Path]) -> Path:
+        """Persist the fitted statistics to a small JSON file."""
+        if self.fitted_stats is None:
+            raise RuntimeError("Statistics are not fitted; nothing to save.")
+
+        path = Path(path)
+        with open(path, "w") as f:
+            json.dump(self._fitted_state(), f)
+        logger.info(f"Normalization statistics saved to {path}")
+        return path
+
+    def load_stats(self, path: Union[str, Path]) -> "SimpleMLPreprocessor":
+        """Load statistics written by ``save_stats`` for use in ``transform``."""
+        with open(path) as f:
+            self._restore_fitted_state(json.load(f))
+        logger.info(f"Normalization statistics loaded from {path}")
+        return self
+
+    def apply_joke_labeling(self) -> CategoricalLabels:
         if self.labels.size == 0:
             logger.warning("No labels to convert into jokes.")
-            return np.array([])
+            return CategoricalLabels(np.array([], dtype=np.int8), JOKE_CATEGORIES)
 
-        jokes = np.where(self.labels == 1, "Definitely ML", "Possibly Not")
-        logger.info(f"First 5 joke labels: {jokes[:5]}")
+        # One int8 code per row; the strings are only decoded on request.
+        jokes = CategoricalLabels(self.labels == 1, JOKE_CATEGORIES)
+        logger.info(f"First 5 joke labels: {jokes[:5].tolist()}")
         return jokes
 
-    def run_pipeline(self) -> dict:
+    def run_pipeline(self) -> PipelineResult:
+        """Return the pipeline stages as a lazy, memoized mapping.
+
+        Stages run on first access of one of their keys, so callers that
+        only read ``labels`` never pay for normalization or joke labeling.
+        """
         logger.info(
             f"Running ML preprocessing pipeline for {self.n_samples} samples..."
         )
-        self.generate_synthetic_data()
-        self.normalize_features()
-        jokes = self.apply_joke_labeling()
-
-        result = {
-            "features": self.features,
-            "labels": self.labels,
-            "normalized": self.normalized,
-            **self.stats,
-            "joke_labels": jokes,
-        }
-        logger.success("ML pipeline complete!")
+        profiler = StageProfiler(self.stage_callback) if self.instrument else None
+        result = PipelineResult(
+            on_release=self._release_stage,
+            metrics=profiler.metrics if profiler is not None else None,
+        )
+
+        # Each stage returns (result values, arrays to cache, cache metadata);
+        # its restore_* counterpart rebuilds the values from a cache hit.
+        def generate() -> tuple:
+            features, labels = self.generate_synthetic_data()
+            values = {"features": features, "labels": labels}
+            return values, values, {"stats": self._feature_stats[1].to_dict()}
+
+        def restore_generated(arrays: dict, meta: dict) -> dict:
+            self.features, self.labels = arrays["features"], arrays["labels"]
+            self._feature_stats = (
+                self.features,
+                RunningStats.from_dict(meta["stats"]),
+                None,
+            )
+            return arrays
+
+        stat_keys = ("mean", "std")
+        if self.scaling == "robust":
+            stat_keys += ("median", "iqr")
+
+        def normalized_values() -> dict:
+            # Every registered key is present, as empty lists when there were
+            # no samples to fit on.
+            stats = {key: self.stats.get(key, []) for key in stat_keys}
+            return {"normalized": self.normalized, **stats}
+
+        def normalize() -> tuple:
+            self.normalize_features()
+            values = normalized_values()
+            if self.fitted_stats is None:
+                # No samples to fit on: nothing worth caching.
+                return values, None, None
+            meta = {"stats": self._fitted_state()}
+            return values, {"normalized": self.normalized}, meta
+
+        def restore_normalized(arrays: dict, meta: dict) -> dict:
+            self.normalized = arrays["normalized"]
+            self._restore_fitted_state(meta["stats"])
+            return normalized_values()
+
+        def label_jokes() -> tuple:
+            jokes = self.apply_joke_labeling()
+            meta = {"categories": list(jokes.categories)}
+            return {"joke_labels": jokes}, {"codes": jokes.codes}, meta
+
+        def restore_jokes(arrays: dict, meta: dict) -> dict:
+            return {
+                "joke_labels": CategoricalLabels(arrays["codes"], meta["categories"])
+            }
+
+        def stage(name: str, compute: Callable, restore: Callable, requires=()):
+            # Dependencies are resolved before the stage is measured, so each
+            # record only covers the stage's own work.
+            def prepare():
+                for key in requires:
+                    result[key]
+
+            return lambda: self._cached_stage(name, compute, restore, prepare, profiler)
+
+        result.add_stage(
+            ("features", "labels"), stage("generate", generate, restore_generated)
+        )
+        result.add_stage(
+            ("normalized", *stat_keys),
+            stage("normalize", normalize, restore_normalized, requires=("features",)),
+        )
+        result.add_stage(
+            ("joke_labels",),
+            stage("joke_labels", label_jokes, restore_jokes, requires=("labels",)),
+        )
+        logger.success("ML pipeline ready; stages are computed on access.")
         return result
+
+    def _cache_key(self, stage: str) -> Optional[str]:
+        if self.cache is None or self.seed is None:
+            return None
+        return self.cache.make_key(
+            stage=stage,
+            n_samples=self.n_samples,
+            seed=self.seed,
+            dtype=self.dtype.name,
+            n_features=self.n_features,
+            chunk_size=self.chunk_size,
+            scaling=[self.scaling, self.quantile_range, self.clip_percentiles],
+            compiled=fused.COMPILED_AVAILABLE,
+            version=package_version(),
+            code=_code_fingerprint(),
+        )
+
+    def _cached_stage(
+        self,
+        stage: str,
+        compute: Callable,
+        restore: Callable,
+        prepare: Callable,
+        profiler: Optional[StageProfiler] = None,
+    ) -> dict:
+        key = self._cache_key(stage)
+        hit = self.cache.load(key) if key is not None else None
+        if hit is None:
+            prepare()
+        if profiler is None:
+            return self._run_stage(key, hit, compute, restore)
+
+        with profiler.measure(stage) as record:
+            record["cached"] = hit is not None
+            return self._run_stage(key, hit, compute, restore)
+
+    def _run_stage(
+        self,
+        key: Optional[str],
+        hit: Optional[tuple],
+        compute: Callable,
+        restore: Callable,
+    ) -> dict:
+        if hit is not None:
+            return restore(*hit)
+
+        values, arrays, meta = compute()
+        if key is not None and arrays is not None:
+            self.cache.store(key, arrays, meta)
+        return values
+
+    def _release_stage(self, key: str):
+        if key in ("features", "labels", "normalized"):
+            setattr(self, key, np.array([]))
+
+    def stream_pipeline(self) -> Iterator[dict]:
+        """Yield normalized chunks while holding at most one chunk in memory.
+
+        A first pass accumulates the scaling statistics chunk by chunk
+        (plus a quantile sketch for robust scaling); the second pass
+        regenerates each chunk from its seed and yields it normalized.
+        """
+        logger.info(
+            f"Streaming ML preprocessing pipeline for {self.n_samples} samples "
+            f"in chunks of {self.chunk_size}..."
+        )
+        running = RunningStats()
+        sketch = None
+        for index in range(self.n_chunks):
+            chunk = self._generate_chunk(index)
+            running.update(chunk)
+            if self.scaling == "robust":
+                # Seeded per chunk like generate_synthetic_data's sketches
+                chunk_sketch = _chunk_sketch(chunk, self.seed_sequence, index)
+                sketch = chunk_sketch if sketch is None else sketch.merge(chunk_sketch)
+
+        if running.count == 0:
+            logger.warning("No samples to stream.")
+            return
+
+        self._set_fitted_stats(running, sketch)
+        logger.debug(f"Feature normalization stats: {self.stats}")
+        params = self._transform_parameters(self.dtype)
+
+        for index in range(self.n_chunks):
+            features = self._generate_chunk(index)
+            normalized = _apply_scaling(features, np.empty_like(features), params)
+            yield {
+                "offset": self._chunk_bounds(index)[0],
+                "features": features,
+                "labels": fused_label_stats(features, self.label_threshold)[0],
+                "normalized": normalized,
+            }
+        logger.success("ML streaming pipeline complete!")
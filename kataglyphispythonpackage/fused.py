@@ -0,0 +1,91 @@
+"""Fused single-pass labeling and column statistics over a feature matrix."""
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+from kataglyphispythonpackage.running_stats import RunningStats
+
+try:
+    from kataglyphispythonpackage._fused_kernel import fused_block_stats as _compiled
+except ImportError:
+    _compiled = None
+
+COMPILED_AVAILABLE = _compiled is not None
+
+# Tiles of at most BLOCK_COLS columns and as many rows as fit in BLOCK_BYTES
+# stay resident in a typical L2, also for matrices with thousands of columns.
+BLOCK_BYTES = 256 * 1024
+BLOCK_COLS = 2048
+
+
+def _numpy_block_stats(
+    block: np.ndarray,
+    threshold: float,
+    labels: np.ndarray,
+    col_sum: np.ndarray,
+    col_sumsq: np.ndarray,
+):
+    # Walk the row block tile by tile so wide rows never produce temporaries
+    # larger than one tile; only the row-sum vector spans all columns.
+    row_sums = np.zeros(len(block))
+    for start in range(0, block.shape[1], BLOCK_COLS):
+        cols = slice(start, start + BLOCK_COLS)
+        tile = block[:, cols]
+        row_sums += tile.sum(axis=1)
+        col_sum[cols] += tile.sum(axis=0, dtype=np.float64)
+        col_sumsq[cols] += np.einsum("ij,ij->j", tile, tile, dtype=np.float64)
+    np.greater(row_sums, threshold, out=labels, casting="unsafe")
+
+
+def fused_label_stats(
+    features: np.ndarray,
+    threshold: float = 15.0,
+    labels: Optional[np.ndarray] = None,
+    block_rows: Optional[int] = None,
+    use_compiled: Optional[bool] = None,
+) -> Tuple[np.ndarray, RunningStats]:
+    """
+    Compute threshold labels and column statistics in one blocked pass.
+
+    Each cache-sized row block is read once to produce the row sums (and from
+    them the labels) together with the column sum and sum of squares; wide
+    blocks are further split into column tiles. The
+    per-block moments are merged with Chan's update, which keeps the
+    sum-of-squares cancellation error bounded by the block size.
+
+    Args:
+        features: Array of shape (n_rows, n_features)
+        threshold: Rows whose feature sum exceeds this value are labeled 1
+        labels: Optional int64 output array of shape (n_rows,)
+        block_rows: Rows per block. Defaults to as many rows of one column
+            tile as fit in L2 cache
+        use_compiled: Force (True) or disable (False) the compiled kernel.
+            Defaults to using it when it was built
+
+    Returns:
+        Tuple of (labels, RunningStats over the columns)
+    """
+    if use_compiled and not COMPILED_AVAILABLE:
+        raise RuntimeError("The compiled fused kernel is not built.")
+    kernel = _numpy_block_stats
+    if _compiled is not None and use_compiled is not False:
+        kernel = _compiled
+
+    n_rows, n_cols = features.shape
+    if labels is None:
+        labels = np.empty(n_rows, dtype=np.int64)
+    if block_rows is None:
+        tile_cols = max(1, min(n_cols, BLOCK_COLS))
+        block_rows = max(1, BLOCK_BYTES // (tile_cols * features.itemsize))
+
+    running = RunningStats()
+    for start in range(0, n_rows, block_rows):
+        block = np.ascontiguousarray(features[start : start + block_rows])
+        count = len(block)
+        col_sum = np.zeros(n_cols)
+        col_sumsq = np.zeros(n_cols)
+        kernel(block, threshold, labels[start : start + count], col_sum, col_sumsq)
+        mean = col_sum / count
+        running.merge_moments(count, mean, np.maximum(col_sumsq - col_sum * mean, 0.0))
+    return labels, running
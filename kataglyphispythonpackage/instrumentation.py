@@ -0,0 +1,101 @@
+"""Per-stage wall time, CPU time and memory instrumentation."""
+
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, Optional
+
+import psutil
+
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def peak_rss_bytes() -> int:
+    """Return the peak resident set size of this process in bytes."""
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports kilobytes, macOS bytes.
+        return peak if sys.platform == "darwin" else peak * 1024
+    info = psutil.Process().memory_info()
+    return getattr(info, "peak_wset", info.rss)
+
+
+class StageProfiler:
+    """Record wall time, CPU time, allocations and peak RSS growth per stage.
+
+    Each measured stage produces a flat dict of numbers that is stored in
+    ``metrics`` and passed to the optional callback, ready to be forwarded
+    to a telemetry backend. Allocations are traced with ``tracemalloc`` only
+    while a stage runs; if tracing is already active it is left running.
+    """
+
+    def __init__(
+        self,
+        callback: Optional[Callable[[str, dict], None]] = None,
+        metrics: Optional[Dict[str, dict]] = None,
+    ):
+        """
+        Initialize the profiler.
+
+        Args:
+            callback: Called with ``(stage, record)`` after each measured stage
+            metrics: Dict to store the records in. A new one is created if None
+        """
+        self.callback = callback
+        self.metrics: Dict[str, dict] = metrics if metrics is not None else {}
+
+    @contextmanager
+    def measure(self, stage: str) -> Iterator[dict]:
+        """
+        Measure the enclosed block as ``stage``.
+
+        The yielded record can be extended by the caller (e.g. with a cache
+        hit flag) and is filled with the measurements when the block exits:
+
+        - ``wall_s`` / ``cpu_s``: elapsed wall-clock and process CPU time
+        - ``alloc_bytes``: memory allocated and still held after the stage
+        - ``alloc_peak_bytes``: peak traced memory above the stage's start
+        - ``peak_rss_delta_bytes``: growth of the process peak RSS
+
+        Args:
+            stage: Stage name used as key in ``metrics``
+
+        Yields:
+            The record for this stage
+        """
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        traced_start, _ = tracemalloc.get_traced_memory()
+        rss_start = peak_rss_bytes()
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+
+        record: dict = {}
+        try:
+            yield record
+            wall = time.perf_counter() - wall_start
+            cpu = time.process_time() - cpu_start
+            traced_end, traced_peak = tracemalloc.get_traced_memory()
+        finally:
+            if started_tracing:
+                tracemalloc.stop()
+
+        record.update(
+            {
+                "wall_s": wall,
+                "cpu_s": cpu,
+                "alloc_bytes": traced_end - traced_start,
+                "alloc_peak_bytes": traced_peak - traced_start,
+                "peak_rss_delta_bytes": peak_rss_bytes() - rss_start,
+            }
+        )
+        self.metrics[stage] = record
+        if self.callback is not None:
+            self.callback(stage, record)
@@ -0,0 +1,195 @@
+"""Content-addressed on-disk cache for pipeline outputs with LRU eviction."""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import uuid
+from importlib import metadata
+from pathlib import Path
+from types import ModuleType
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+import numpy as np
+from loguru import logger
+
+
+def package_version() -> str:
+    """Return the installed package version, or 'unknown' for source trees."""
+    try:
+        return metadata.version("kataglyphispythonpackage")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def code_fingerprint(modules: Iterable[ModuleType]) -> str:
+    """
+    Hash the files implementing ``modules``.
+
+    Works for both plain ``.py`` sources and compiled extension modules, so
+    any change to the code producing cached data changes the cache key.
+
+    Args:
+        modules: Modules whose implementation determines the cached outputs
+
+    Returns:
+        Hex digest over the module files
+    """
+    digest = hashlib.sha256()
+    for module in modules:
+        digest.update(module.__name__.encode())
+        digest.update(Path(module.__file__).read_bytes())
+    return digest.hexdigest()
+
+
+class PipelineCache:
+    """Store pipeline arrays as ``.npy`` files keyed by a hash of their inputs.
+
+    Each entry is a directory holding one ``.npy`` file per array plus a
+    ``meta.json``. Entries are published with an atomic rename, loaded back
+    through ``mmap`` and evicted least-recently-used first once the cache
+    grows beyond ``max_bytes``.
+    """
+
+    def __init__(self, directory: Union[str, Path], max_bytes: int = 2 * 1024**3):
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Cache directory. Created if missing
+            max_bytes: Size budget for all entries together
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def make_key(**params) -> str:
+        """
+        Build a cache key from JSON-serializable parameters.
+
+        Args:
+            **params: Everything that determines the cached outputs
+
+        Returns:
+            Hex digest identifying the entry
+        """
+        payload = json.dumps(params, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def load(self, key: str) -> Optional[Tuple[Dict[str, np.ndarray], dict]]:
+        """
+        Open a cached entry zero-copy.
+
+        Args:
+            key: Entry key from ``make_key``
+
+        Returns:
+            Tuple of (read-only memory-mapped arrays, metadata), or None on a miss
+        """
+        entry = self.directory / key
+        if not (entry / "meta.json").exists():
+            return None
+
+        try:
+            with open(entry / "meta.json") as f:
+                meta = json.load(f)
+            arrays = {
+                name: np.load(entry / f"{name}.npy", mmap_mode="r")
+                for name in meta["arrays"]
+            }
+            # The directory mtime doubles as the last-used time for LRU eviction.
+            os.utime(entry)
+        except FileNotFoundError:
+            # Evicted by another process while we were opening it
+            return None
+        logger.debug(f"Pipeline cache hit: {key[:12]}")
+        return arrays, meta["meta"]
+
+    def store(
+        self, key: str, arrays: Dict[str, np.ndarray], meta: Optional[dict] = None
+    ) -> Path:
+        """
+        Publish arrays under ``key`` and evict old entries if over budget.
+
+        Args:
+            key: Entry key from ``make_key``
+            arrays: Arrays to store, one ``.npy`` file each
+            meta: Small JSON-serializable metadata stored alongside
+
+        Returns:
+            Path to the entry directory
+        """
+        entry = self.directory / key
+        staging = Path(tempfile.mkdtemp(prefix=".staging-", dir=self.directory))
+        try:
+            for name, array in arrays.items():
+                np.save(staging / f"{name}.npy", np.asarray(array))
+            with open(staging / "meta.json", "w") as f:
+                json.dump({"arrays": list(arrays), "meta": meta or {}}, f)
+            # Readers only ever see complete entries; if another process won
+            # the race the entry is identical, so ours is simply dropped.
+            os.replace(staging, entry)
+        except OSError:
+            if not (entry / "meta.json").exists():
+                raise
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+        logger.debug(f"Pipeline cache store: {key[:12]}")
+        self.evict(keep=key)
+        return entry
+
+    def _entries(self) -> list:
+        entries = []
+        for entry in self.directory.iterdir():
+            if entry.name.startswith(".") or not entry.is_dir():
+                continue
+            try:
+                size = sum(f.stat().st_size for f in entry.iterdir())
+                entries.append((entry.stat().st_mtime, size, entry))
+            except FileNotFoundError:
+                continue  # removed concurrently
+        return sorted(entries)
+
+    def _remove(self, entry: Path):
+        # Unpublish atomically first, like store publishes: readers see the
+        # whole entry or none of it, never one with files missing.
+        staging = self.directory / f".staging-{uuid.uuid4().hex}"
+        try:
+            os.rename(entry, staging)
+        except FileNotFoundError:
+            return  # already removed by another process
+        shutil.rmtree(staging, ignore_errors=True)
+
+    def size_bytes(self) -> int:
+        """Total size of all cache entries in bytes."""
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self, keep: Optional[str] = None):
+        """
+        Remove least recently used entries until the cache fits its budget.
+
+        Args:
+            keep: Key that must not be evicted (e.g. the entry just stored)
+        """
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in entries:
+            if total <= self.max_bytes:
+                break
+            if entry.name == keep:
+                continue
+            self._remove(entry)
+            total -= size
+            logger.debug(f"Pipeline cache evicted: {entry.name[:12]}")
+
+    def clear(self):
+        """Remove all cache entries."""
+        for _, _, entry in self._entries():
+            self._remove(entry)
+        logger.info(f"Pipeline cache cleared: {self.directory}")
+
+    def __repr__(self) -> str:
+        return f"PipelineCache({str(self.directory)!r}, max_bytes={self.max_bytes})"
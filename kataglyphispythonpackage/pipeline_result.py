@@ -0,0 +1,91 @@
+"""Lazily evaluated, memoized pipeline results."""
+
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterator, Optional, Sequence
+
+from loguru import logger
+
+
+class PipelineResult(Mapping):
+    """Read-only mapping whose values are computed on first access.
+
+    Each stage produces one or more keys at once; all of them are memoized
+    after the first access to any of them. Stages the caller no longer needs
+    can be released to drop their memory, after which accessing them raises.
+    """
+
+    def __init__(
+        self,
+        on_release: Optional[Callable[[str], None]] = None,
+        metrics: Optional[Dict[str, dict]] = None,
+    ):
+        """
+        Initialize an empty result.
+
+        Args:
+            on_release: Called with each released key, so the producer can drop
+                its own references to the released data
+            metrics: Per-stage instrumentation records, filled in as stages run
+        """
+        self._producers: Dict[str, Callable[[], Dict[str, Any]]] = {}
+        self._values: Dict[str, Any] = {}
+        self._released: set = set()
+        self._on_release = on_release
+        self.metrics: Dict[str, dict] = metrics if metrics is not None else {}
+
+    def add_stage(self, keys: Sequence[str], compute: Callable[[], Dict[str, Any]]):
+        """
+        Register a lazily computed stage.
+
+        Args:
+            keys: Keys produced by the stage
+            compute: Callable returning a dict with a value for every key
+        """
+        for key in keys:
+            self._producers[key] = compute
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._values:
+            return self._values[key]
+        if key in self._released:
+            raise RuntimeError(f"Pipeline stage '{key}' was released.")
+
+        compute = self._producers[key]
+        logger.debug(f"Computing pipeline stage for '{key}'...")
+        produced = compute()
+        self._values.update(
+            {
+                name: value
+                for name, value in produced.items()
+                if name not in self._released
+            }
+        )
+        return self._values[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._producers)
+
+    def __len__(self) -> int:
+        return len(self._producers)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._producers
+
+    def is_computed(self, key: str) -> bool:
+        """Return whether the value for ``key`` is currently memoized."""
+        return key in self._values
+
+    def release(self, *keys: str):
+        """
+        Drop memoized values that are no longer needed.
+
+        Args:
+            *keys: Keys to release. Accessing them afterwards raises RuntimeError
+        """
+        for key in keys:
+            if key not in self._producers:
+                raise KeyError(key)
+            self._values.pop(key, None)
+            self._released.add(key)
+            if self._on_release is not None:
+                self._on_release(key)
@@ -0,0 +1,153 @@
+"""Mergeable streaming quantile sketch (KLL) for column-wise quantiles."""
+
+import math
+from typing import List, Optional, Sequence, Union
+
+import numpy as np
+
+
+class QuantileSketch:
+    """Column-wise KLL sketch with bounded memory and one-pass updates.
+
+    Every column is summarized by its own KLL compactor hierarchy. Because all
+    columns receive the same number of values, their levels always have the
+    same length and are stored side by side as 2-D arrays, so one sort per
+    compaction serves all columns. Sketches built per chunk or per worker can
+    be merged; the rank error is roughly ``1.7 / k`` independent of the
+    number of values seen.
+    """
+
+    def __init__(
+        self, k: int = 200, seed: Union[int, np.random.SeedSequence, None] = None
+    ):
+        """
+        Initialize an empty sketch.
+
+        Args:
+            k: Accuracy parameter; the top level keeps about ``k`` values
+            seed: Seed for the random compaction offsets
+        """
+        if k < 2:
+            raise ValueError(f"k must be at least 2, got {k}")
+        self.k = k
+        self.count = 0
+        self.levels: List[np.ndarray] = []
+        self._rng = np.random.default_rng(seed)
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - level - 1
+        return max(2, math.ceil(self.k * (2 / 3) ** depth))
+
+    def _compress(self):
+        level = 0
+        while level < len(self.levels):
+            values = self.levels[level]
+            if len(values) > self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(values[:0])
+                # Keep one value back when the level is odd, sort the rest
+                # per column and promote every other value with doubled weight.
+                n_pairs = len(values) // 2
+                leftover = values[2 * n_pairs :]
+                paired = np.sort(values[: 2 * n_pairs], axis=0)
+                promoted = paired[self._rng.integers(2) :: 2]
+                self.levels[level] = leftover
+                self.levels[level + 1] = np.concatenate(
+                    [self.levels[level + 1], promoted]
+                )
+            level += 1
+
+    def update(self, batch: np.ndarray) -> "QuantileSketch":
+        """
+        Add a batch of rows to the sketch.
+
+        Args:
+            batch: Array of shape (n_rows, n_columns), or (n_rows,) for one column
+
+        Returns:
+            The sketch itself, to allow chaining
+        """
+        batch = np.asarray(batch, dtype=np.float64)
+        if batch.ndim == 1:
+            batch = batch[:, None]
+        if len(batch) == 0:
+            return self
+
+        if not self.levels:
+            self.levels.append(batch[:0])
+        self.levels[0] = np.concatenate([self.levels[0], batch])
+        self.count += len(batch)
+        self._compress()
+        return self
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        """
+        Merge another sketch built over a disjoint set of rows.
+
+        Args:
+            other: Sketch over the same columns
+
+        Returns:
+            The sketch itself, to allow chaining
+        """
+        for level, values in enumerate(other.levels):
+            if level == len(self.levels):
+                self.levels.append(values[:0])
+            self.levels[level] = np.concatenate([self.levels[level], values])
+        self.count += other.count
+        self._compress()
+        return self
+
+    def quantile(self, q: Union[float, Sequence[float]]) -> np.ndarray:
+        """
+        Estimate column-wise quantiles.
+
+        Args:
+            q: Quantile or sequence of quantiles in [0, 1]
+
+        Returns:
+            Array of shape (n_columns,) for a scalar ``q``, otherwise
+            (len(q), n_columns)
+        """
+        if self.count == 0:
+            raise ValueError("Cannot compute quantiles of an empty sketch.")
+
+        values = np.concatenate(self.levels)
+        weights = np.concatenate(
+            [np.full(len(level), 2.0**h) for h, level in enumerate(self.levels)]
+        )
+        order = np.argsort(values, axis=0)
+        sorted_values = np.take_along_axis(values, order, axis=0)
+        cumulative = np.cumsum(weights[order], axis=0)
+
+        qs = np.atleast_1d(np.asarray(q, dtype=np.float64))
+        targets = qs[:, None, None] * cumulative[-1]
+        index = (cumulative[None, :, :] < targets).sum(axis=1)
+        index = np.minimum(index, len(values) - 1)
+        result = np.take_along_axis(sorted_values, index, axis=0)
+        return result[0] if np.ndim(q) == 0 else result
+
+    @property
+    def n_retained(self) -> int:
+        """Number of values currently retained per column."""
+        return sum(len(level) for level in self.levels)
+
+    def to_dict(self) -> dict:
+        """Serialize the sketch into plain Python types (JSON friendly)."""
+        return {
+            "k": self.k,
+            "count": self.count,
+            "levels": [level.tolist() for level in self.levels],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict, seed: Optional[int] = None) -> "QuantileSketch":
+        """Restore a sketch serialized with ``to_dict``."""
+        sketch = cls(k=data["k"], seed=seed)
+        sketch.count = data["count"]
+        width = max((len(level[0]) for level in data["levels"] if level), default=0)
+        sketch.levels = [
+            np.asarray(level, dtype=np.float64).reshape(-1, width)
+            for level in data["levels"]
+        ]
+        return sketch
@@ -0,0 +1,112 @@
+"""Mergeable column-wise running statistics (Welford/Chan)."""
+
+from typing import Optional
+
+import numpy as np
+
+
+class RunningStats:
+    """Accumulate column-wise mean and variance over many batches.
+
+    Batches are folded in with Chan et al.'s pairwise update, so statistics
+    computed independently per chunk or per worker can be merged and give the
+    same result as a single pass over the concatenated data.
+    """
+
+    def __init__(self):
+        """Initialize an empty accumulator."""
+        self.count: int = 0
+        self.mean: Optional[np.ndarray] = None
+        self.m2: Optional[np.ndarray] = None
+
+    def update(self, batch: np.ndarray) -> "RunningStats":
+        """
+        Fold a batch of rows into the running statistics.
+
+        Args:
+            batch: Array of shape (n_rows, n_features)
+
+        Returns:
+            The accumulator itself, to allow chaining
+        """
+        batch = np.asarray(batch)
+        if batch.shape[0] == 0:
+            return self
+
+        batch_mean = batch.mean(axis=0, dtype=np.float64)
+        batch_m2 = np.square(batch - batch_mean).sum(axis=0)
+        self._combine(batch.shape[0], batch_mean, batch_m2)
+        return self
+
+    def merge(self, other: "RunningStats") -> "RunningStats":
+        """
+        Merge the statistics of another accumulator into this one.
+
+        Args:
+            other: Accumulator built over a disjoint set of rows
+
+        Returns:
+            The accumulator itself, to allow chaining
+        """
+        if other.count:
+            self._combine(other.count, other.mean, other.m2)
+        return self
+
+    def merge_moments(
+        self, count: int, mean: np.ndarray, m2: np.ndarray
+    ) -> "RunningStats":
+        """
+        Merge precomputed moments of a disjoint batch.
+
+        Args:
+            count: Number of rows in the batch
+            mean: Column means of the batch
+            m2: Column sums of squared deviations from ``mean``
+
+        Returns:
+            The accumulator itself, to allow chaining
+        """
+        if count:
+            self._combine(count, mean, m2)
+        return self
+
+    def _combine(self, count: int, mean: np.ndarray, m2: np.ndarray):
+        if self.count == 0:
+            self.count = count
+            self.mean = np.array(mean, dtype=np.float64)
+            self.m2 = np.array(m2, dtype=np.float64)
+            return
+
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean = self.mean + delta * (count / total)
+        self.m2 = self.m2 + m2 + np.square(delta) * (self.count * count / total)
+        self.count = total
+
+    def to_dict(self) -> dict:
+        """Serialize the accumulator into plain Python types (JSON friendly)."""
+        return {
+            "count": self.count,
+            "mean": None if self.mean is None else self.mean.tolist(),
+            "m2": None if self.m2 is None else self.m2.tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "RunningStats":
+        """Restore an accumulator serialized with ``to_dict``."""
+        stats = cls()
+        if data["count"]:
+            stats._combine(
+                int(data["count"]), np.asarray(data["mean"]), np.asarray(data["m2"])
+            )
+        return stats
+
+    @property
+    def variance(self) -> np.ndarray:
+        """Population variance (ddof=0), matching ``np.var`` defaults."""
+        return self.m2 / self.count
+
+    @property
+    def std(self) -> np.ndarray:
+        """Population standard deviation (ddof=0), matching ``np.std``."""
+        return np.sqrt(self.variance)
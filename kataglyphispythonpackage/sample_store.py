@@ -0,0 +1,252 @@
+"""Columnar, preallocated storage for monitoring samples."""
+
+import threading
+from typing import Any, Dict, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+# Column dtypes ordered from narrowest to widest; a column is widened in
+# place of losing a value that does not fit (e.g. a float in an int column).
+_DTYPE_ORDER = (
+    np.dtype(np.bool_),
+    np.dtype(np.int64),
+    np.dtype(np.float64),
+    np.dtype(object),
+)
+
+
+def _dtype_for(value: Any) -> np.dtype:
+    if value is None:
+        # Missing values need NaN, i.e. at least a float column.
+        return np.dtype(np.float64)
+    if isinstance(value, (bool, np.bool_)):
+        return np.dtype(np.bool_)
+    if isinstance(value, (int, np.integer)):
+        return np.dtype(np.int64)
+    if isinstance(value, (float, np.floating)):
+        return np.dtype(np.float64)
+    return np.dtype(object)
+
+
+def _storage_dtype(dtype: Any) -> np.dtype:
+    # Declared dtypes map onto the widening order, e.g. float32 to float64.
+    kind = np.dtype(dtype).kind
+    return _DTYPE_ORDER[{"b": 0, "i": 1, "u": 1, "f": 2}.get(kind, 3)]
+
+
+def _value(column: np.ndarray, row: int) -> Any:
+    if column.ndim > 1:
+        return column[row].copy()
+    return column[row] if column.dtype.kind == "O" else column[row].item()
+
+
+def _missing(dtype: np.dtype) -> Any:
+    return None if dtype.kind == "O" else np.nan
+
+
+class SampleStore:
+    """Store samples column-wise with one preallocated typed array per metric.
+
+    Samples are appended as dicts but kept as NumPy columns, so a sample
+    costs a few bytes per metric instead of a dict of boxed values. The
+    schema is taken from the samples themselves: ints, floats and bools get
+    native columns, anything else an object column.
+
+    A sample value may also be a 1-D NumPy array (e.g. one value per CPU
+    core). It is kept in a 2-D block column of shape (samples, width)
+    instead of one column per element, and expanded to ``name_0``,
+    ``name_1``, ... only on export.
+
+    With ``max_samples`` the store is a bounded ring buffer that keeps only
+    the newest samples. It is mirrored (every sample is written twice, into
+    a buffer of twice the size), so the retained window is always one
+    contiguous slice and ``to_dataframe`` never has to copy.
+    """
+
+    def __init__(self, max_samples: Optional[int] = None, capacity: int = 1024):
+        """
+        Initialize an empty store.
+
+        Args:
+            max_samples: Keep only the newest ``max_samples`` samples. None keeps all
+            capacity: Initial number of rows allocated when unbounded
+        """
+        if max_samples is not None and max_samples <= 0:
+            raise ValueError(f"max_samples must be positive, got {max_samples}")
+        if capacity <= 0:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        self.max_samples = max_samples
+        self._initial_capacity = capacity
+        self._capacity = 2 * max_samples if max_samples is not None else capacity
+        self._columns: Dict[str, np.ndarray] = {}
+        self._start = 0  # buffer index of the oldest retained sample
+        self._count = 0  # number of retained samples
+        self.total_appended = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def columns(self) -> List[str]:
+        """Metric names in order of first appearance."""
+        return list(self._columns)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes allocated by all column buffers."""
+        return sum(column.nbytes for column in self._columns.values())
+
+    def append(self, sample: Dict[str, Any]):
+        """
+        Append one sample.
+
+        Args:
+            sample: Mapping from metric name to value. Metrics missing from a
+                sample are stored as NaN (or None in object columns)
+        """
+        with self._lock:
+            if self.max_samples is None:
+                if self._count == self._capacity:
+                    self._grow()
+                rows = (self._count,)
+            else:
+                row = self.total_appended % self.max_samples
+                rows = (row, row + self.max_samples)
+
+            for name, value in sample.items():
+                if name not in self._columns:
+                    self._add_column(name, value)
+            for name, column in self._columns.items():
+                value = sample.get(name)
+                if column.ndim > 1:
+                    for row in rows:
+                        column[row] = np.nan if value is None else value
+                    continue
+                needed = _dtype_for(value)
+                if _DTYPE_ORDER.index(needed) > _DTYPE_ORDER.index(column.dtype):
+                    column = self._widen(name, needed)
+                if value is None:
+                    value = _missing(column.dtype)
+                for row in rows:
+                    column[row] = value
+
+            self.total_appended += 1
+            if self.max_samples is None or self._count < self.max_samples:
+                self._count += 1
+            else:
+                self._start = self.total_appended % self.max_samples
+
+    def _grow(self):
+        self._capacity *= 2
+        for name, column in self._columns.items():
+            grown = np.empty((self._capacity, *column.shape[1:]), dtype=column.dtype)
+            grown[: len(column)] = column
+            self._columns[name] = grown
+
+    def declare(self, schema: Dict[str, Any]):
+        """
+        Add empty columns ahead of the samples that fill them.
+
+        Declared columns keep their position and dtype even if the first
+        samples lack them. Columns that already exist are left unchanged.
+
+        Args:
+            schema: Mapping from metric name to a NumPy dtype (or its name).
+                Sized dtypes are stored widened, e.g. float32 as float64. A
+                ``(dtype, width)`` tuple declares a block column of that
+                width; blocks keep their float dtype, e.g. float32
+        """
+        with self._lock:
+            for name, dtype in schema.items():
+                if name in self._columns:
+                    continue
+                if isinstance(dtype, tuple):
+                    dtype, width = dtype
+                    self._add_column_of(name, np.dtype(dtype), (width,))
+                else:
+                    self._add_column_of(name, _storage_dtype(dtype))
+
+    def _add_column(self, name: str, value: Any):
+        if isinstance(value, np.ndarray):
+            self._add_column_of(name, value.dtype, value.shape)
+        else:
+            self._add_column_of(name, _dtype_for(value))
+
+    def _add_column_of(self, name: str, dtype: np.dtype, shape: tuple = ()):
+        if shape and dtype.kind != "f":
+            # Blocks are not widened, so they must hold NaN from the start.
+            dtype = np.dtype(np.float64)
+        if self._count and dtype.kind in "bi":
+            # Earlier samples lack this metric and need NaN.
+            dtype = np.dtype(np.float64)
+        column = np.empty((self._capacity, *shape), dtype=dtype)
+        column[:] = _missing(dtype) if dtype.kind in "fO" else 0
+        self._columns[name] = column
+
+    def _widen(self, name: str, dtype: np.dtype) -> np.ndarray:
+        self._columns[name] = self._columns[name].astype(dtype)
+        return self._columns[name]
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        Return one metric for all retained samples, oldest first.
+
+        Args:
+            name: Metric name
+
+        Returns:
+            Read-only view into the store's buffer (no copy); 2-D with one
+            row per sample for block columns
+        """
+        view = self._columns[name][self._start : self._start + self._count]
+        view.flags.writeable = False
+        return view
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("sample index out of range")
+        row = self._start + index
+        return {name: _value(column, row) for name, column in self._columns.items()}
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for index in range(self._count):
+            yield self[index]
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Build a DataFrame over the retained samples without copying.
+
+        Numeric columns share memory with the store, so later appends that
+        overwrite ring-buffer rows show up in the frame; call ``.copy()`` on
+        the result to detach it. Block columns are expanded into one
+        ``name_<i>`` column per element (still views into the block).
+
+        Returns:
+            One row per retained sample, oldest first
+        """
+        with self._lock:
+            data = {}
+            for name in self._columns:
+                column = self.column(name)
+                if column.ndim > 1:
+                    data.update(
+                        {f"{name}_{i}": column[:, i] for i in range(column.shape[1])}
+                    )
+                else:
+                    data[name] = column
+            return pd.DataFrame(data, copy=False)
+
+    def clear(self):
+        """Drop all samples. Allocated buffers are released too."""
+        with self._lock:
+            self._columns = {}
+            if self.max_samples is None:
+                self._capacity = self._initial_capacity
+            self._start = 0
+            self._count = 0
+            self.total_appended = 0
@@ -0,0 +1,109 @@
+"""Read and write monitoring sessions as CSV, Parquet or Feather files."""
+
+from pathlib import Path
+from typing import List, Optional, Union
+
+import pandas as pd
+from loguru import logger
+
+from kataglyphispythonpackage.arrow_export import _require_arrow
+from kataglyphispythonpackage.stream_writer import read_monitoring_csv
+
+
+SESSION_FORMATS = {".csv": "csv", ".parquet": "parquet", ".feather": "feather"}
+
+
+def session_format(path: Union[str, Path]) -> str:
+    """
+    Return the session format implied by a file suffix.
+
+    Args:
+        path: Session file path
+
+    Returns:
+        "parquet" or "feather" for those suffixes, otherwise "csv"
+    """
+    return SESSION_FORMATS.get(Path(path).suffix.lower(), "csv")
+
+
+def write_session(
+    df: pd.DataFrame, path: Union[str, Path], compression: Optional[str] = "zstd"
+) -> Path:
+    """
+    Write a session DataFrame in the format implied by ``path``.
+
+    Parquet and Feather keep the exact binary values and column types and
+    are compressed; both need pyarrow.
+
+    Args:
+        df: Session data, e.g. from ``SystemMonitor.to_dataframe()``
+        path: Output file; its suffix selects the format
+        compression: Codec for Parquet/Feather. Ignored for CSV
+
+    Returns:
+        Path to the written file
+    """
+    path = Path(path)
+    file_format = session_format(path)
+    if file_format == "csv":
+        df.to_csv(path, index=False)
+        return path
+
+    _require_arrow()
+    if file_format == "parquet":
+        df.to_parquet(path, compression=compression, index=False)
+    else:
+        df.reset_index(drop=True).to_feather(path, compression=compression)
+    return path
+
+
+def read_session(
+    path: Union[str, Path], columns: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """
+    Load a session file written as CSV, Parquet or Feather.
+
+    Args:
+        path: Session file; its suffix selects the format
+        columns: Load only these columns. With Parquet/Feather the other
+            columns are never read from disk
+
+    Returns:
+        Session data
+    """
+    file_format = session_format(path)
+    if file_format == "csv":
+        return read_monitoring_csv(path, columns=columns)
+
+    _require_arrow()
+    if file_format == "parquet":
+        return pd.read_parquet(path, columns=columns)
+    return pd.read_feather(path, columns=columns)
+
+
+def convert_session(
+    path: Union[str, Path],
+    output_path: Optional[Union[str, Path]] = None,
+    compression: Optional[str] = "zstd",
+) -> Path:
+    """
+    Convert an existing session file, e.g. a CSV session to Parquet.
+
+    Example:
+        convert_session("output/monitoring/monitoring_20260107_120000.csv")
+
+    Args:
+        path: Session file to convert
+        output_path: Target file; its suffix selects the format. Defaults to
+            ``path`` with a ``.parquet`` suffix
+        compression: Codec for Parquet/Feather output
+
+    Returns:
+        Path to the converted file
+    """
+    path = Path(path)
+    if output_path is None:
+        output_path = path.with_suffix(".parquet")
+    output_path = write_session(read_session(path), output_path, compression)
+    logger.info(f"Converted {path} to {output_path}")
+    return output_path
@@ -0,0 +1,194 @@
+"""Incremental, crash-safe CSV persistence for monitoring samples."""
+
+import atexit
+import csv
+import io
+import os
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set, Union
+
+import pandas as pd
+from loguru import logger
+
+
+_CLOSE = object()
+
+
+class StreamingCSVWriter:
+    """Append samples to a CSV file in batches from a background thread.
+
+    ``write`` only enqueues the sample, so the sampling thread never blocks
+    on disk I/O. The writer thread formats a whole batch in memory and hands
+    it to the OS with a single write once ``batch_size`` samples are queued
+    or ``flush_interval`` seconds have passed. Batches always end on a
+    complete line, so the file is a valid CSV after every flush and a crash
+    loses at most the samples of the current, unflushed batch.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        batch_size: int = 256,
+        flush_interval: float = 1.0,
+        transform: Optional[Callable[[Dict], Dict]] = None,
+        fsync: bool = False,
+        columns: Optional[List[str]] = None,
+    ):
+        """
+        Open the file and start the writer thread.
+
+        Args:
+            path: Output CSV file. Overwritten if it exists
+            batch_size: Flush once this many samples are queued
+            flush_interval: Flush at least this often (seconds) while samples arrive
+            transform: Applied to each sample on the writer thread before writing
+            fsync: Also fsync after each batch, to survive power loss and
+                not just a crash of this process (much slower)
+            columns: CSV header. Defaults to the columns of the first sample
+        """
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+        if flush_interval <= 0:
+            raise ValueError(f"flush_interval must be positive, got {flush_interval}")
+
+        self.path = Path(path)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.transform = transform
+        self.fsync = fsync
+        self.rows_written = 0
+        self.batches_written = 0
+
+        self._columns: Optional[List[str]] = list(columns) if columns else None
+        self._header_written = False
+        self._known: Set[str] = set()  # header plus already reported extras
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._closed = False
+        # Large buffer: a batch reaches the OS in one write call.
+        self._file = open(self.path, "w", newline="", buffering=1024**2)
+        self._thread = threading.Thread(
+            target=self._run, name="stream-writer", daemon=True
+        )
+        self._thread.start()
+        # Flush what is queued on a normal interpreter exit as well.
+        atexit.register(self.close)
+
+    def write(self, sample: Dict):
+        """
+        Queue one sample for writing.
+
+        Args:
+            sample: Mapping from column name to value
+        """
+        if self._closed:
+            raise RuntimeError(f"Stream to {self.path} is closed.")
+        self._queue.put(sample)
+
+    def close(self, timeout: Optional[float] = None):
+        """
+        Write all queued samples, stop the writer thread and close the file.
+
+        Args:
+            timeout: Seconds to wait for the writer thread
+        """
+        if self._closed:
+            return
+        self._closed = True
+        atexit.unregister(self.close)
+        self._queue.put(_CLOSE)
+        self._thread.join(timeout)
+        self._file.close()
+        logger.info(
+            f"Streamed {self.rows_written} samples in {self.batches_written} "
+            f"batches to {self.path}"
+        )
+
+    def __enter__(self) -> "StreamingCSVWriter":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _run(self):
+        batch = []
+        deadline = time.monotonic() + self.flush_interval
+        while True:
+            try:
+                sample = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                sample = None
+            if sample is _CLOSE:
+                break
+            if sample is not None:
+                batch.append(sample)
+            if len(batch) >= self.batch_size or time.monotonic() >= deadline:
+                self._write_batch(batch)
+                batch = []
+                deadline = time.monotonic() + self.flush_interval
+        self._write_batch(batch)
+
+    def _write_batch(self, batch: List[Dict]):
+        if not batch:
+            return
+        rows = [self.transform(sample) for sample in batch] if self.transform else batch
+
+        buffer = io.StringIO()
+        if not self._header_written:
+            if self._columns is None:
+                self._columns = list(rows[0])
+            csv.writer(buffer, lineterminator="\n").writerow(self._columns)
+            self._header_written = True
+            self._known = set(self._columns)
+        # The header is fixed up front or by the first sample; later extra
+        # metrics are dropped (reported once each) and missing ones left empty.
+        extra = {name for row in rows for name in row} - self._known
+        if extra:
+            logger.warning(
+                f"Dropping columns missing from the header of {self.path}: "
+                f"{sorted(extra)}"
+            )
+            self._known |= extra
+        writer = csv.DictWriter(
+            buffer, self._columns, extrasaction="ignore", lineterminator="\n"
+        )
+        writer.writerows(rows)
+
+        try:
+            self._file.write(buffer.getvalue())
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+        except OSError as e:
+            logger.error(f"Failed to write {len(rows)} samples to {self.path}: {e}")
+            return
+        self.rows_written += len(rows)
+        self.batches_written += 1
+
+
+def read_monitoring_csv(
+    path: Union[str, Path], columns: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """
+    Load a monitoring CSV, tolerating a truncated last line.
+
+    A file whose writer was killed mid-write may end in a partial row; that
+    row is dropped instead of being parsed with missing values. A file with
+    no complete line yet gives an empty DataFrame.
+
+    Args:
+        path: CSV file written by ``save_data`` or a ``StreamingCSVWriter``
+        columns: Parse only these columns
+
+    Returns:
+        DataFrame with all complete rows
+    """
+    text = Path(path).read_text()
+    if not text.endswith("\n"):
+        text = text[: text.rfind("\n") + 1]
+    if not text:
+        # Nothing flushed yet, not even the header
+        return pd.DataFrame(columns=columns)
+    return pd.read_csv(io.StringIO(text), usecols=columns)
@@ -1,15 +1,31 @@
 """System monitoring module for CPU, GPU, RAM usage tracking and visualization."""
 
+import os
 import time
+import queue
+import threading
+import multiprocessing
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterator, List, Optional, Set, Union
 import json
 
+import numpy as np
 import psutil
 import pandas as pd
 from loguru import logger
 
+from kataglyphispythonpackage.collectors import (
+    COLLECTORS,
+    DEFAULT_COLLECTORS,
+    Collector,
+)
+from kataglyphispythonpackage.sample_store import SampleStore
+from kataglyphispythonpackage.session_io import SESSION_FORMATS, write_session
+from kataglyphispythonpackage.stream_writer import StreamingCSVWriter
+from kataglyphispythonpackage.tick_scheduler import TickScheduler
+
 try:
     import pynvml  # nvidia-ml-py package
 
@@ -26,33 +42,131 @@ except (ImportError, Exception) as e:
 class SystemMonitor:
     """Monitor system resources (CPU, GPU, RAM) and save data for later visualization."""
 
-    def __init__(self, output_dir: Optional[Union[str, Path]] = None):
+    def __init__(
+        self,
+        output_dir: Optional[Union[str, Path]] = None,
+        cpu_interval: Optional[float] = None,
+        max_samples: Optional[int] = None,
+        nvml=None,
+        collectors: Optional[Dict[str, Optional[float]]] = None,
+        pid: Optional[int] = None,
+    ):
         """
         Initialize the system monitor.
 
         Args:
             output_dir: Directory to save monitoring data. Defaults to './output/monitoring'
+            cpu_interval: Seconds to block per sample while measuring CPU usage.
+                None (default) measures non-blocking over the time since the
+                previous sample instead
+            max_samples: Keep only the newest ``max_samples`` samples (ring
+                buffer) for long-running sessions. None keeps all samples
+            nvml: NVML module to query GPUs with. Defaults to ``pynvml`` when
+                it is available
+            collectors: Registered collector names mapped to their sampling
+                period in seconds (None samples on every tick), e.g.
+                ``{"cpu": 0.02, "memory": 0.2, "gpu": 1.0}``. Defaults to
+                cpu, memory and gpu on every tick, plus the process collector
+                if ``pid`` is given
+            pid: Process whose tree (it and all its children) the "process"
+                collector tracks. Defaults to the current process
         """
         if output_dir is None:
             output_dir = Path("output/monitoring")
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
-        self.monitoring_data: List[Dict] = []
+        # Columnar store: one typed NumPy array per metric instead of a dict
+        # of boxed values per sample.
+        self.monitoring_data = SampleStore(max_samples=max_samples)
         self.start_time: Optional[float] = None
+        # Clock anchors: samples are timed on perf_counter_ns and mapped to
+        # wall-clock nanoseconds through the pair taken at session start.
+        self._start_wall_ns: Optional[int] = None
+        self._start_perf_ns: Optional[int] = None
+        self.schedule_stats: Optional[Dict[str, int]] = None
+        self._stream: Optional[StreamingCSVWriter] = None
+
+        # NVML backend (a fake can be passed for tests and benchmarks); GPU
+        # handles and static facts are cached per session.
+        self._nvml = nvml if nvml is not None else (pynvml if GPU_AVAILABLE else None)
+        self._gpu_handle_cache: Optional[list] = None
+        self._static_info: Optional[Dict] = None
+
+        # Resolved here: the process-mode sampler must track this process,
+        # not itself.
+        self.pid = os.getpid() if pid is None else pid
+        # PIDs the process collector leaves out of the tree: the process-mode
+        # sampler and multiprocessing's helpers are children of self.pid
+        self.exclude_pids: Set[int] = set()
+        if collectors is None:
+            collectors = dict(DEFAULT_COLLECTORS)
+            if pid is not None:
+                collectors["process"] = None
+        self.collector_periods: Dict[str, Optional[float]] = dict(collectors)
+        self.collectors = self._build_collectors()
         self.session_id: str = datetime.now().strftime("%Y%m%d_%H%M%S")
 
+        # CPU busy/total times at the previous sample for the delta mode
+        self.cpu_interval = cpu_interval
+        self._last_cpu_times = _cpu_busy_and_total(psutil.cpu_times())
+
+        # Background sampler state (see start/stop)
+        self._stop_event = None  # threading.Event or its multiprocessing twin
+        self._sampler_thread: Optional[threading.Thread] = None
+        self._sampler_process: Optional[multiprocessing.Process] = None
+
         logger.info(f"SystemMonitor initialized. Output directory: {self.output_dir}")
         logger.info(f"Session ID: {self.session_id}")
 
+    def _build_collectors(self) -> List[Collector]:
+        unknown = set(self.collector_periods) - set(COLLECTORS)
+        if unknown:
+            raise ValueError(
+                f"Unknown collectors {sorted(unknown)}; "
+                f"registered: {sorted(COLLECTORS)}"
+            )
+        return [
+            COLLECTORS[name](self, period)
+            for name, period in self.collector_periods.items()
+        ]
+
+    def schema(self) -> Dict:
+        """
+        Return the columns of a sample and their dtypes.
+
+        Returns:
+            The integer timestamps followed by the schema of each collector;
+            block columns map to a ``(dtype, width)`` tuple
+        """
+        schema = {"timestamp_ns": "int64", "elapsed_ns": "int64"}
+        for collector in self.collectors:
+            schema.update(collector.schema())
+        return schema
+
     def get_cpu_info(self) -> Dict[str, float]:
         """Get current CPU usage information."""
+        if self.cpu_interval is not None:
+            cpu_percent = psutil.cpu_percent(interval=self.cpu_interval)
+        else:
+            cpu_percent = self._cpu_percent_since_last_sample()
+        cpu_freq = psutil.cpu_freq()
         return {
-            "cpu_percent": psutil.cpu_percent(interval=0.1),
-            "cpu_count": psutil.cpu_count(),
-            "cpu_freq_current": psutil.cpu_freq().current if psutil.cpu_freq() else 0.0,
+            "cpu_percent": cpu_percent,
+            "cpu_freq_current": cpu_freq.current if cpu_freq else 0.0,
         }
 
+    def _cpu_percent_since_last_sample(self) -> float:
+        # Same computation as psutil.cpu_percent(interval=None), but with the
+        # reference point kept per monitor instead of in psutil's global state.
+        busy, total = _cpu_busy_and_total(psutil.cpu_times())
+        last_busy, last_total = self._last_cpu_times
+        self._last_cpu_times = (busy, total)
+        if total <= last_total:
+            return 0.0
+        percent = (busy - last_busy) / (total - last_total) * 100
+        return min(max(percent, 0.0), 100.0)
+
     def get_memory_info(self) -> Dict[str, float]:
         """Get current RAM usage information."""
         mem = psutil.virtual_memory()
@@ -63,49 +177,82 @@ class SystemMonitor:
             "ram_percent": mem.percent,
         }
 
-    def get_gpu_info(self) -> List[Dict[str, float]]:
-        """Get current GPU usage information using pynvml."""
-        if not GPU_AVAILABLE:
-            return []
+    def _gpu_handles(self) -> list:
+        # Device handles are looked up once per session and reused by every
+        # sample; only the dynamic queries run per sample.
+        if self._gpu_handle_cache is None:
+            self._gpu_handle_cache = []
+            if self._nvml is not None:
+                try:
+                    self._gpu_handle_cache = [
+                        self._nvml.nvmlDeviceGetHandleByIndex(i)
+                        for i in range(self._nvml.nvmlDeviceGetCount())
+                    ]
+                except Exception as e:
+                    logger.warning(f"Failed to enumerate GPUs: {e}")
+        return self._gpu_handle_cache
+
+    def get_static_info(self) -> Dict:
+        """
+        Get static system facts, collected once per session.
 
-        try:
-            device_count = pynvml.nvmlDeviceGetCount()
-            gpu_data = []
+        These values do not change while monitoring, so they are stored in
+        the session metadata instead of being repeated in every sample.
 
-            for i in range(device_count):
-                handle = pynvml.nvmlDeviceGetHandleByIndex(i)
+        Returns:
+            CPU count, total RAM and the id, name and memory size of each GPU
+        """
+        if self._static_info is not None:
+            return self._static_info
 
-                # Get GPU info
-                name = pynvml.nvmlDeviceGetName(handle)
+        gpus = []
+        for i, handle in enumerate(self._gpu_handles()):
+            try:
+                name = self._nvml.nvmlDeviceGetName(handle)
                 if isinstance(name, bytes):
                     name = name.decode("utf-8")
+                memory = self._nvml.nvmlDeviceGetMemoryInfo(handle)
+                gpus.append(
+                    {"id": i, "name": name, "memory_total_mb": memory.total / (1024**2)}
+                )
+            except Exception as e:
+                logger.warning(f"Failed to get static info for GPU {i}: {e}")
 
-                # Get utilization rates
-                utilization = pynvml.nvmlDeviceGetUtilizationRates(handle)
+        self._static_info = {
+            "cpu_count": psutil.cpu_count(),
+            "total_ram_gb": psutil.virtual_memory().total / (1024**3),
+            "gpu_available": self._nvml is not None,
+            "gpus": gpus,
+        }
+        return self._static_info
 
-                # Get memory info
-                memory = pynvml.nvmlDeviceGetMemoryInfo(handle)
-                memory_used_mb = memory.used / (1024**2)
-                memory_total_mb = memory.total / (1024**2)
+    def get_gpu_info(self) -> List[Dict[str, float]]:
+        """Get current GPU usage information using pynvml."""
+        handles = self._gpu_handles()
+        if not handles:
+            return []
+
+        nvml = self._nvml
+        try:
+            gpu_data = []
+            for handle in handles:
+                utilization = nvml.nvmlDeviceGetUtilizationRates(handle)
+                memory = nvml.nvmlDeviceGetMemoryInfo(handle)
                 memory_percent = (
-                    (memory.used / memory.total * 100) if memory.total > 0 else 0
+                    (memory.used / memory.total * 100) if memory.total > 0 else 0.0
                 )
 
-                # Get temperature
                 try:
-                    temperature = pynvml.nvmlDeviceGetTemperature(
-                        handle, pynvml.NVML_TEMPERATURE_GPU
+                    temperature = nvml.nvmlDeviceGetTemperature(
+                        handle, nvml.NVML_TEMPERATURE_GPU
                     )
-                except pynvml.NVMLError:
+                except nvml.NVMLError:
                     temperature = 0.0
 
                 gpu_data.append(
                     {
-                        "gpu_id": i,
-                        "gpu_name": name,
                         "gpu_load": float(utilization.gpu),  # Already in percentage
-                        "gpu_memory_used_mb": memory_used_mb,
-                        "gpu_memory_total_mb": memory_total_mb,
+                        "gpu_memory_used_mb": memory.used / (1024**2),
                         "gpu_memory_percent": memory_percent,
                         "gpu_temperature": float(temperature),
                     }
@@ -115,45 +262,60 @@ class SystemMonitor:
             logger.warning(f"Failed to get GPU info: {e}")
             return []
 
-    def sample(self) -> Dict:
-        """Take a single sample of all system metrics."""
-        if self.start_time is None:
-            self.start_time = time.time()
+    def _mark_start(self):
+        self._start_perf_ns = time.perf_counter_ns()
+        self._start_wall_ns = time.time_ns()
+        self.start_time = self._start_wall_ns / 1e9
+        # Fix column order and dtypes before collectors with long periods
+        # first report.
+        self.monitoring_data.declare(self.schema())
+
+    def sample(self) -> Optional[Dict]:
+        """
+        Take a single sample of the collectors that are due.
+
+        Every collector whose period has elapsed contributes to the sample;
+        with the default collectors that is all of them on every call.
+        Timestamps are stored as integer nanoseconds (``timestamp_ns`` on the
+        wall clock, ``elapsed_ns`` since the session start); seconds and ISO
+        strings are derived only on export (see ``to_dataframe``).
 
-        timestamp = time.time()
-        elapsed_time = timestamp - self.start_time
+        Returns:
+            The sample, or None if no collector was due
+        """
+        now_ns = time.perf_counter_ns()
+        if self.start_time is None:
+            self._mark_start()
+            now_ns = self._start_perf_ns
 
+        elapsed_ns = now_ns - self._start_perf_ns
         sample_data = {
-            "timestamp": timestamp,
-            "elapsed_seconds": elapsed_time,
-            "datetime": datetime.fromtimestamp(timestamp).isoformat(),
+            "timestamp_ns": self._start_wall_ns + elapsed_ns,
+            "elapsed_ns": elapsed_ns,
         }
 
-        # Add CPU info
-        sample_data.update(self.get_cpu_info())
-
-        # Add memory info
-        sample_data.update(self.get_memory_info())
-
-        # Add GPU info
-        gpu_data = self.get_gpu_info()
-        if gpu_data:
-            # For simplicity, we'll track the first GPU primarily
-            sample_data.update(
-                {
-                    f"gpu_{i}_{key}": value
-                    for i, gpu in enumerate(gpu_data)
-                    for key, value in gpu.items()
-                }
-            )
+        due = [c for c in self.collectors if c.due(elapsed_ns)]
+        if not due:
+            return None
+        for collector in due:
+            sample_data.update(collector.collect())
+            collector.collections += 1
 
-        self.monitoring_data.append(sample_data)
+        self._record(sample_data)
         return sample_data
 
+    def _record(self, sample: Dict):
+        self.monitoring_data.append(sample)
+        if self._stream is not None:
+            self._stream.write(sample)
+
     def start_monitoring(self, interval: float = 1.0, duration: Optional[float] = None):
         """
         Start continuous monitoring.
 
+        Samples are aligned to a fixed grid (see ``TickScheduler``), so the
+        time spent sampling does not add up as drift.
+
         Args:
             interval: Time between samples in seconds
             duration: Total monitoring duration in seconds. None for infinite
@@ -161,29 +323,254 @@ class SystemMonitor:
         logger.info(
             f"Starting monitoring with interval={interval}s, duration={duration}s"
         )
-        self.start_time = time.time()
+        self._mark_start()
+        scheduler = TickScheduler(interval, start_ns=self._start_perf_ns)
 
         try:
-            while True:
+            while scheduler.wait() is not None:
                 sample = self.sample()
-                logger.debug(
-                    f"Sample: CPU={sample['cpu_percent']:.1f}%, RAM={sample['ram_percent']:.1f}%"
-                )
+                self.schedule_stats = scheduler.stats()
+                if sample is not None:
+                    logger.debug(f"Sample: {len(sample) - 2} metrics")
 
-                if duration and (time.time() - self.start_time) >= duration:
+                elapsed = (time.perf_counter_ns() - scheduler.start_ns) / 1e9
+                if duration and elapsed >= duration:
                     logger.info("Monitoring duration reached.")
                     break
-
-                time.sleep(interval)
         except KeyboardInterrupt:
             logger.info("Monitoring stopped by user.")
 
-    def save_data(self, filename: Optional[str] = None) -> Path:
+    @property
+    def is_running(self) -> bool:
+        """Whether a background sampler is active."""
+        return self._sampler_thread is not None
+
+    def start(self, interval: float = 1.0, mode: str = "thread"):
         """
-        Save monitoring data to CSV file.
+        Start sampling in the background and return immediately.
+
+        Samples are appended to ``monitoring_data`` while the caller's own
+        code keeps running. The "process" mode samples from a separate
+        process, so a busy interpreter (GIL contention) cannot delay or skew
+        the samples; they are forwarded to this process as they are taken.
 
         Args:
-            filename: Output filename. Defaults to 'monitoring_{session_id}.csv'
+            interval: Time between samples in seconds
+            mode: "thread" or "process"
+        """
+        if self.is_running:
+            raise RuntimeError("Background monitoring is already running.")
+        if interval <= 0:
+            raise ValueError(f"interval must be positive, got {interval}")
+        if mode not in ("thread", "process"):
+            raise ValueError(f"mode must be 'thread' or 'process', got {mode!r}")
+
+        if self.start_time is None:
+            self._mark_start()
+        logger.info(
+            f"Starting background monitoring ({mode}) with interval={interval}s"
+        )
+
+        if mode == "thread":
+            self._stop_event = threading.Event()
+            target, args = self._sample_loop, (interval,)
+        else:
+            # spawn avoids forking a process that holds threads or NVML state.
+            context = multiprocessing.get_context("spawn")
+            self._stop_event = context.Event()
+            samples = context.Queue()
+            # The tracker is started by the Event and Queue above, if at all.
+            helpers = {_resource_tracker_pid(), *self.exclude_pids} - {None}
+            self._sampler_process = context.Process(
+                target=_sample_in_subprocess,
+                args=(
+                    self.output_dir,
+                    self.cpu_interval,
+                    self.collector_periods,
+                    self.pid,
+                    (self._start_wall_ns, self._start_perf_ns),
+                    interval,
+                    self._stop_event,
+                    samples,
+                    helpers,
+                ),
+                name="system-monitor-sampler",
+                daemon=True,
+            )
+            self._sampler_process.start()
+            target, args = self._receive_samples, (samples, self._sampler_process)
+
+        # Daemon thread: a forgotten stop() never blocks interpreter exit.
+        self._sampler_thread = threading.Thread(
+            target=target, args=args, name="system-monitor", daemon=True
+        )
+        self._sampler_thread.start()
+
+    def stop(self, timeout: Optional[float] = 10.0):
+        """
+        Stop the background sampler and wait for it to finish.
+
+        Args:
+            timeout: Seconds to wait for the sampler to shut down
+        """
+        if not self.is_running:
+            logger.warning("Background monitoring is not running.")
+            return
+
+        self._stop_event.set()
+        if self._sampler_process is not None:
+            self._sampler_process.join(timeout)
+            if self._sampler_process.is_alive():
+                logger.warning("Sampler process did not exit in time; terminating.")
+                self._sampler_process.terminate()
+        self._sampler_thread.join(timeout)
+
+        self._sampler_thread = None
+        self._sampler_process = None
+        self._stop_event = None
+        logger.info(
+            f"Background monitoring stopped. Total samples: {len(self.monitoring_data)}"
+        )
+
+    @contextmanager
+    def running(
+        self, interval: float = 1.0, mode: str = "thread"
+    ) -> Iterator["SystemMonitor"]:
+        """
+        Sample in the background for the duration of a ``with`` block.
+
+        Example:
+            with SystemMonitor().running(interval=0.5) as monitor:
+                heavy_computation()
+            monitor.save_data()
+
+        Args:
+            interval: Time between samples in seconds
+            mode: "thread" or "process"
+
+        Yields:
+            The monitor itself
+        """
+        self.start(interval=interval, mode=mode)
+        try:
+            yield self
+        finally:
+            self.stop()
+
+    def _sample_loop(self, interval: float):
+        scheduler = TickScheduler(interval)
+        # Waiting on the event lets stop() interrupt the sleep immediately.
+        while scheduler.wait(self._stop_event) is not None:
+            try:
+                self.sample()
+            except Exception as e:
+                logger.warning(f"Background sample failed: {e}")
+            self.schedule_stats = scheduler.stats()
+
+    def _receive_samples(
+        self, samples: "multiprocessing.Queue", process: multiprocessing.Process
+    ):
+        while True:
+            try:
+                sample = samples.get(timeout=0.5)
+            except queue.Empty:
+                # A crashed or terminated sampler never sends the sentinel.
+                if not process.is_alive():
+                    logger.warning(
+                        "Sampler process exited without stopping cleanly "
+                        f"(exitcode {process.exitcode})."
+                    )
+                    break
+                continue
+            if isinstance(sample, tuple):
+                # ("stopped", schedule stats) ends the stream
+                self.schedule_stats = sample[1]
+                break
+            self._record(sample)
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Convert the samples into a DataFrame for export.
+
+        Adds ``timestamp`` (Unix seconds), ``elapsed_seconds`` and the ISO
+        ``datetime`` column next to the integer nanosecond timestamps. The
+        metric columns share memory with ``monitoring_data`` (no copy).
+
+        Returns:
+            One row per sample
+        """
+        df = self.monitoring_data.to_dataframe()
+        if "timestamp_ns" in df:
+            timestamp_ns = df["timestamp_ns"]
+            df.insert(2, "timestamp", timestamp_ns / 1e9)
+            df.insert(3, "elapsed_seconds", df["elapsed_ns"] / 1e9)
+            df.insert(
+                4,
+                "datetime",
+                [datetime.fromtimestamp(ns / 1e9).isoformat() for ns in timestamp_ns],
+            )
+        return df
+
+    def stream_to(
+        self,
+        filename: Optional[str] = None,
+        batch_size: int = 256,
+        flush_interval: float = 1.0,
+        fsync: bool = False,
+    ) -> Path:
+        """
+        Append every following sample to a CSV file as the session runs.
+
+        Samples are written in batches from a background thread (see
+        ``StreamingCSVWriter``), so a crash loses at most the last batch and
+        the file can be read at any time with ``read_monitoring_csv``.
+        Combine with ``max_samples`` to keep memory bounded on long runs.
+
+        Args:
+            filename: Output filename. Defaults to 'monitoring_{session_id}_stream.csv'
+            batch_size: Flush once this many samples are queued
+            flush_interval: Flush at least every ``flush_interval`` seconds
+            fsync: Also fsync each batch to survive power loss
+
+        Returns:
+            Path to the streamed file
+        """
+        if self._stream is not None:
+            raise RuntimeError(f"Already streaming to {self._stream.path}.")
+        if filename is None:
+            filename = f"monitoring_{self.session_id}_stream.csv"
+
+        self._stream = StreamingCSVWriter(
+            self.output_dir / filename,
+            batch_size=batch_size,
+            flush_interval=flush_interval,
+            transform=_export_row,
+            fsync=fsync,
+            # Header from the schema: not every collector reports on the
+            # first tick.
+            columns=[*_EXPORT_TIME_COLUMNS, *_export_columns(self.schema())[2:]],
+        )
+        logger.info(f"Streaming monitoring data to {self._stream.path}")
+        return self._stream.path
+
+    def close_stream(self):
+        """Flush the remaining samples and close the streamed file."""
+        if self._stream is None:
+            return
+        self._stream.close()
+        self._stream = None
+
+    def save_data(self, filename: Optional[str] = None, format: str = "csv") -> Path:
+        """
+        Save monitoring data to a CSV, Parquet or Feather file.
+
+        Parquet and Feather (requires pyarrow) are compressed, keep exact
+        values and load much faster than CSV for long sessions.
+
+        Args:
+            filename: Output filename. Its suffix (.csv, .parquet, .feather)
+                selects the format. Defaults to 'monitoring_{session_id}.{format}'
+            format: "csv", "parquet" or "feather"; used when filename is None
 
         Returns:
             Path to saved file
@@ -193,11 +580,11 @@ class SystemMonitor:
             return None
 
         if filename is None:
-            filename = f"monitoring_{self.session_id}.csv"
+            if f".{format}" not in SESSION_FORMATS:
+                raise ValueError(f"Unsupported session format: {format!r}")
+            filename = f"monitoring_{self.session_id}.{format}"
 
-        output_path = self.output_dir / filename
-        df = pd.DataFrame(self.monitoring_data)
-        df.to_csv(output_path, index=False)
+        output_path = write_session(self.to_dataframe(), self.output_dir / filename)
 
         logger.info(f"Monitoring data saved to {output_path}")
         logger.info(f"Total samples: {len(self.monitoring_data)}")
@@ -221,24 +608,12 @@ class SystemMonitor:
             "session_id": self.session_id,
             "start_time": self.start_time,
             "sample_count": len(self.monitoring_data),
-            "cpu_count": psutil.cpu_count(),
-            "total_ram_gb": psutil.virtual_memory().total / (1024**3),
-            "gpu_available": GPU_AVAILABLE,
+            "schedule": self.schedule_stats,
+            "collectors": self.collector_periods,
+            "pid": self.pid,
+            **self.get_static_info(),
         }
 
-        if GPU_AVAILABLE:
-            try:
-                device_count = pynvml.nvmlDeviceGetCount()
-                metadata["gpus"] = []
-                for i in range(device_count):
-                    handle = pynvml.nvmlDeviceGetHandleByIndex(i)
-                    name = pynvml.nvmlDeviceGetName(handle)
-                    if isinstance(name, bytes):
-                        name = name.decode("utf-8")
-                    metadata["gpus"].append({"id": i, "name": name})
-            except Exception:
-                pass
-
         output_path = self.output_dir / filename
         with open(output_path, "w") as f:
             json.dump(metadata, f, indent=2)
@@ -248,16 +623,121 @@ class SystemMonitor:
 
     def reset(self):
         """Reset monitoring data for a new session."""
-        self.monitoring_data = []
+        self.close_stream()
+        # A fresh store: frames exported earlier keep viewing the old buffers.
+        self.monitoring_data = SampleStore(max_samples=self.monitoring_data.max_samples)
         self.start_time = None
+        self._start_wall_ns = None
+        self._start_perf_ns = None
+        self.schedule_stats = None
+        self._gpu_handle_cache = None
+        self._static_info = None
+        self.collectors = self._build_collectors()
         self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
         logger.info(f"Monitor reset. New session ID: {self.session_id}")
 
 
+_EXPORT_TIME_COLUMNS = (
+    "timestamp_ns",
+    "elapsed_ns",
+    "timestamp",
+    "elapsed_seconds",
+    "datetime",
+)
+
+
+def _export_columns(schema: Dict) -> List[str]:
+    """Column names of ``schema`` with block columns expanded per element."""
+    columns = []
+    for name, dtype in schema.items():
+        if isinstance(dtype, tuple):
+            columns.extend(f"{name}_{i}" for i in range(dtype[1]))
+        else:
+            columns.append(name)
+    return columns
+
+
+def _export_row(sample: Dict) -> Dict:
+    """Add the derived time columns of ``to_dataframe`` to one sample."""
+    timestamp = sample["timestamp_ns"] / 1e9
+    row = {
+        "timestamp_ns": sample["timestamp_ns"],
+        "elapsed_ns": sample["elapsed_ns"],
+        "timestamp": timestamp,
+        "elapsed_seconds": sample["elapsed_ns"] / 1e9,
+        "datetime": datetime.fromtimestamp(timestamp).isoformat(),
+    }
+    for name, value in sample.items():
+        if isinstance(value, np.ndarray):
+            row.update({f"{name}_{i}": v for i, v in enumerate(value.tolist())})
+        else:
+            row[name] = value
+    return row
+
+
+def _cpu_busy_and_total(times) -> tuple:
+    """Split ``psutil.cpu_times()`` into busy and total seconds."""
+    total = sum(times)
+    # Guest time is already included in user time on Linux.
+    total -= getattr(times, "guest", 0.0) + getattr(times, "guest_nice", 0.0)
+    busy = total - times.idle - getattr(times, "iowait", 0.0)
+    return busy, total
+
+
+def _sample_in_subprocess(
+    output_dir: Path,
+    cpu_interval: Optional[float],
+    collectors: Dict[str, Optional[float]],
+    pid: int,
+    clock_anchor: tuple,
+    interval: float,
+    stop_event: "multiprocessing.Event",
+    samples: "multiprocessing.Queue",
+    exclude_pids: Set[int],
+):
+    """Sampler loop run by ``SystemMonitor.start(mode="process")``."""
+    # Samples are forwarded, so a one-slot ring is all the local store needs.
+    monitor = SystemMonitor(
+        output_dir=output_dir,
+        cpu_interval=cpu_interval,
+        max_samples=1,
+        collectors=collectors,
+        pid=pid,
+    )
+    # The sampler is a child of the monitored process; keep it (and the
+    # parent's multiprocessing helpers) out of the "process" metrics.
+    monitor.exclude_pids.update({os.getpid(), *exclude_pids})
+    # perf_counter_ns is system-wide, so the parent's anchors stay valid here.
+    monitor._start_wall_ns, monitor._start_perf_ns = clock_anchor
+    monitor.start_time = monitor._start_wall_ns / 1e9
+    scheduler = TickScheduler(interval)
+    try:
+        while scheduler.wait(stop_event) is not None:
+            try:
+                sample = monitor.sample()
+                if sample is not None:
+                    samples.put(sample)
+            except Exception as e:
+                logger.warning(f"Background sample failed: {e}")
+    finally:
+        # Sentinel: tells the receiving thread that no more samples follow.
+        samples.put(("stopped", scheduler.stats()))
+
+
+def _resource_tracker_pid() -> Optional[int]:
+    # multiprocessing keeps no public handle on its resource tracker process
+    from multiprocessing import resource_tracker
+
+    return getattr(resource_tracker._resource_tracker, "_pid", None)
+
+
 def monitor_function(func):
     """
     Decorator to monitor a function's execution.
 
+    Records the system-wide metrics and those of the current process and
+    its children (see ``ProcessCollector``).
+
     Example:
         @monitor_function
         def my_heavy_computation():
@@ -266,7 +746,7 @@ def monitor_function(func):
     """
 
     def wrapper(*args, **kwargs):
-        monitor = SystemMonitor()
+        monitor = SystemMonitor(collectors={**DEFAULT_COLLECTORS, "process": None})
         logger.info(f"Starting monitoring for function: {func.__name__}")
 
         # Take a sample before
@@ -0,0 +1,95 @@
+"""Drift-free fixed-rate scheduling on the monotonic nanosecond clock."""
+
+import time
+from typing import Dict, Optional
+
+
+class TickScheduler:
+    """Fire ticks on the fixed grid ``start_ns + k * period_ns``.
+
+    Deadlines come from the grid on the ``perf_counter_ns`` clock instead of
+    "now + interval", so time spent between ticks never accumulates as
+    drift. A caller that falls behind by whole periods skips the missed
+    ticks instead of firing them in a burst; skipped ticks and ticks that
+    fire noticeably after their deadline are counted.
+    """
+
+    def __init__(
+        self,
+        interval: float,
+        late_tolerance: Optional[float] = None,
+        start_ns: Optional[int] = None,
+    ):
+        """
+        Initialize the scheduler. Tick 0 is due immediately.
+
+        Args:
+            interval: Period between ticks in seconds
+            late_tolerance: Seconds after its deadline at which a tick counts
+                as late. Defaults to a tenth of the interval
+            start_ns: Grid origin on the ``perf_counter_ns`` clock. Defaults to now
+        """
+        if interval <= 0:
+            raise ValueError(f"interval must be positive, got {interval}")
+        self.period_ns = max(1, round(interval * 1e9))
+        self.late_tolerance_ns = (
+            self.period_ns // 10
+            if late_tolerance is None
+            else round(late_tolerance * 1e9)
+        )
+        self.start_ns = time.perf_counter_ns() if start_ns is None else start_ns
+        self.next_tick = 0
+        self.ticks = 0
+        self.skipped = 0
+        self.late = 0
+
+    def deadline_ns(self, tick: int) -> int:
+        """Scheduled time of ``tick`` on the ``perf_counter_ns`` clock."""
+        return self.start_ns + tick * self.period_ns
+
+    def wait(self, stop_event=None) -> Optional[int]:
+        """
+        Block until the next tick is due.
+
+        Args:
+            stop_event: Optional ``threading``/``multiprocessing`` Event that
+                interrupts the wait
+
+        Returns:
+            Index of the tick that fired, or None if ``stop_event`` was set
+        """
+        tick = self.next_tick
+        deadline = self.deadline_ns(tick)
+        now = time.perf_counter_ns()
+        # Loop because sleeps may return marginally before the deadline.
+        while now < deadline:
+            timeout = (deadline - now) / 1e9
+            if stop_event is not None:
+                if stop_event.wait(timeout):
+                    return None
+            else:
+                time.sleep(timeout)
+            now = time.perf_counter_ns()
+        if stop_event is not None and stop_event.is_set():
+            return None
+
+        missed = (now - deadline) // self.period_ns
+        if missed:
+            tick += missed
+            self.skipped += missed
+            deadline = self.deadline_ns(tick)
+        if now - deadline > self.late_tolerance_ns:
+            self.late += 1
+
+        self.ticks += 1
+        self.next_tick = tick + 1
+        return tick
+
+    def stats(self) -> Dict[str, int]:
+        """Return the interval and the fired, skipped and late tick counts."""
+        return {
+            "interval_ns": self.period_ns,
+            "ticks": self.ticks,
+            "skipped": self.skipped,
+            "late": self.late,
+        }
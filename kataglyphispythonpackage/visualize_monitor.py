@@ -1,32 +1,46 @@
 """Visualization tools for system monitoring data."""
 
+from functools import partial
 from pathlib import Path
 from typing import Optional, Union, List
-import pandas as pd
 import matplotlib.pyplot as plt
 from matplotlib.figure import Figure
 from loguru import logger
 
+from kataglyphispythonpackage.session_io import read_session
+
 
 class MonitoringVisualizer:
-    """Visualize system monitoring data from CSV files."""
+    """Visualize system monitoring data from CSV, Parquet or Feather files."""
 
-    def __init__(self, csv_path: Union[str, Path]):
+    def __init__(self, csv_path: Union[str, Path], columns: Optional[List[str]] = None):
         """
         Initialize the visualizer with monitoring data.
 
         Args:
-            csv_path: Path to the monitoring CSV file
+            csv_path: Path to the monitoring session file (.csv, .parquet or .feather)
+            columns: Load only these columns, e.g. ["elapsed_seconds", "cpu_percent"]
+                for ``plot_cpu``. None loads all columns
         """
         self.csv_path = Path(csv_path)
         if not self.csv_path.exists():
             raise FileNotFoundError(f"Monitoring data file not found: {self.csv_path}")
 
-        self.df = pd.read_csv(self.csv_path)
+        self.df = read_session(self.csv_path, columns=columns)
         logger.info(
             f"Loaded monitoring data: {len(self.df)} samples from {self.csv_path}"
         )
 
+    def _has(self, *columns: str) -> bool:
+        # Sessions may lack collectors, and loading may project columns away.
+        return all(column in self.df.columns for column in columns)
+
+    def _series(self, column: str) -> tuple:
+        # Collectors with a longer period leave NaN rows in between; drop
+        # them so the line connects the actual measurements.
+        valid = self.df[column].notna()
+        return self.df["elapsed_seconds"][valid], self.df[column][valid]
+
     def plot_cpu(self, ax: Optional[plt.Axes] = None, show: bool = False) -> plt.Axes:
         """
         Plot CPU usage over time.
@@ -42,8 +56,7 @@ class MonitoringVisualizer:
             fig, ax = plt.subplots(figsize=(12, 4))
 
         ax.plot(
-            self.df["elapsed_seconds"],
-            self.df["cpu_percent"],
+            *self._series("cpu_percent"),
             label="CPU Usage",
             color="blue",
             linewidth=2,
@@ -78,8 +91,7 @@ class MonitoringVisualizer:
             fig, ax = plt.subplots(figsize=(12, 4))
 
         ax.plot(
-            self.df["elapsed_seconds"],
-            self.df["ram_percent"],
+            *self._series("ram_percent"),
             label="RAM Usage",
             color="green",
             linewidth=2,
@@ -92,18 +104,18 @@ class MonitoringVisualizer:
         ax.set_ylim(0, 100)
 
         # Add secondary y-axis for absolute values
-        ax2 = ax.twinx()
-        ax2.plot(
-            self.df["elapsed_seconds"],
-            self.df["ram_used_gb"],
-            label="RAM Used (GB)",
-            color="darkgreen",
-            linewidth=1,
-            linestyle="--",
-            alpha=0.6,
-        )
-        ax2.set_ylabel("RAM Used (GB)")
-        ax2.legend(loc="upper right")
+        if self._has("ram_used_gb"):
+            ax2 = ax.twinx()
+            ax2.plot(
+                *self._series("ram_used_gb"),
+                label="RAM Used (GB)",
+                color="darkgreen",
+                linewidth=1,
+                linestyle="--",
+                alpha=0.6,
+            )
+            ax2.set_ylabel("RAM Used (GB)")
+            ax2.legend(loc="upper right")
 
         if show:
             plt.tight_layout()
@@ -128,7 +140,7 @@ class MonitoringVisualizer:
         gpu_load_col = f"gpu_{gpu_id}_gpu_load"
         gpu_mem_col = f"gpu_{gpu_id}_gpu_memory_percent"
 
-        if gpu_load_col not in self.df.columns:
+        if not self._has(gpu_load_col, gpu_mem_col):
             logger.warning(f"GPU {gpu_id} data not found in monitoring file")
             return None
 
@@ -136,15 +148,13 @@ class MonitoringVisualizer:
             fig, ax = plt.subplots(figsize=(12, 4))
 
         ax.plot(
-            self.df["elapsed_seconds"],
-            self.df[gpu_load_col],
+            *self._series(gpu_load_col),
             label=f"GPU {gpu_id} Load",
             color="red",
             linewidth=2,
         )
         ax.plot(
-            self.df["elapsed_seconds"],
-            self.df[gpu_mem_col],
+            *self._series(gpu_mem_col),
             label=f"GPU {gpu_id} Memory",
             color="orange",
             linewidth=2,
@@ -162,6 +172,77 @@ class MonitoringVisualizer:
 
         return ax
 
+    def core_columns(self, metric: str = "percent") -> List[str]:
+        """
+        Return the per-core columns of one metric, ordered by core.
+
+        Args:
+            metric: "percent", "user", "system", "iowait" or "steal"
+
+        Returns:
+            Column names ``cpu_core_<metric>_<core>``; empty if the session
+            was recorded without the "cpu_cores" collector
+        """
+        prefix = f"cpu_core_{metric}_"
+        cores = [
+            int(col[len(prefix) :])
+            for col in self.df.columns
+            if col.startswith(prefix) and col[len(prefix) :].isdigit()
+        ]
+        return [f"{prefix}{core}" for core in sorted(cores)]
+
+    def plot_cpu_cores(
+        self,
+        metric: str = "percent",
+        ax: Optional[plt.Axes] = None,
+        show: bool = False,
+    ) -> Optional[plt.Axes]:
+        """
+        Plot a per-core heatmap (cores over time) of CPU usage.
+
+        Idle cores next to saturated ones point to an imbalanced thread
+        pool; steal time on some cores to noisy neighbours.
+
+        Args:
+            metric: "percent" (total), "user", "system", "iowait" or "steal"
+            ax: Matplotlib axes to plot on. Creates new if None
+            show: Whether to display the plot immediately
+
+        Returns:
+            The axes object with the plot, or None if per-core data not available
+        """
+        columns = self.core_columns(metric)
+        if not columns:
+            logger.warning(f"Per-core CPU {metric} data not found in monitoring file")
+            return None
+
+        if ax is None:
+            fig, ax = plt.subplots(figsize=(12, 4))
+
+        rows = self.df[columns].notna().any(axis=1)
+        elapsed = self.df["elapsed_seconds"][rows]
+        values = self.df.loc[rows, columns].to_numpy(dtype=float).T
+        image = ax.imshow(
+            values,
+            aspect="auto",
+            origin="lower",
+            interpolation="nearest",
+            cmap="viridis",
+            vmin=0,
+            vmax=100,
+            extent=(elapsed.min(), elapsed.max(), -0.5, len(columns) - 0.5),
+        )
+        ax.figure.colorbar(image, ax=ax, label=f"CPU {metric} (%)")
+        ax.set_xlabel("Time (seconds)")
+        ax.set_ylabel("CPU core")
+        ax.set_title(f"Per-Core CPU {metric.capitalize()} Over Time")
+
+        if show:
+            plt.tight_layout()
+            plt.show()
+
+        return ax
+
     def plot_all(
         self, output_path: Optional[Union[str, Path]] = None, show: bool = True
     ) -> Figure:
@@ -175,25 +256,29 @@ class MonitoringVisualizer:
         Returns:
             The matplotlib Figure object
         """
-        # Check if GPU data is available
-        has_gpu = any(col.startswith("gpu_0_") for col in self.df.columns)
+        # Only draw panels whose collector was recorded in this session
+        panels = []
+        if self._has("cpu_percent"):
+            panels.append(self.plot_cpu)
+        if self._has("ram_percent"):
+            panels.append(self.plot_memory)
+        if self._has("gpu_0_gpu_load", "gpu_0_gpu_memory_percent"):
+            panels.append(partial(self.plot_gpu, gpu_id=0))
+        if self.core_columns():
+            panels.append(self.plot_cpu_cores)
 
         # Create subplots
-        n_plots = 3 if has_gpu else 2
-        fig, axes = plt.subplots(n_plots, 1, figsize=(14, 4 * n_plots))
-
-        if n_plots == 2:
-            axes = list(axes)
-
-        # Plot CPU
-        self.plot_cpu(ax=axes[0])
+        n_plots = max(len(panels), 1)
+        fig, axes = plt.subplots(n_plots, 1, figsize=(14, 4 * n_plots), squeeze=False)
 
-        # Plot Memory
-        self.plot_memory(ax=axes[1])
+        for panel, ax in zip(panels, axes[:, 0]):
+            panel(ax=ax)
 
-        # Plot GPU if available
-        if has_gpu:
-            self.plot_gpu(gpu_id=0, ax=axes[2])
+        if not panels:
+            axes[0, 0].text(
+                0.5, 0.5, "No plottable metrics recorded", ha="center", va="center"
+            )
+            axes[0, 0].set_axis_off()
 
         # Add overall title
         fig.suptitle(f"System Monitoring - {self.csv_path.stem}", fontsize=16, y=0.995)
@@ -222,22 +307,28 @@ class MonitoringVisualizer:
         stats = {
             "duration_seconds": self.df["elapsed_seconds"].max(),
             "sample_count": len(self.df),
-            "cpu": {
+        }
+
+        if self._has("cpu_percent"):
+            stats["cpu"] = {
                 "mean": self.df["cpu_percent"].mean(),
                 "max": self.df["cpu_percent"].max(),
                 "min": self.df["cpu_percent"].min(),
                 "std": self.df["cpu_percent"].std(),
-            },
-            "ram": {
-                "mean_percent": self.df["ram_percent"].mean(),
-                "max_percent": self.df["ram_percent"].max(),
-                "mean_used_gb": self.df["ram_used_gb"].mean(),
-                "max_used_gb": self.df["ram_used_gb"].max(),
-            },
-        }
+            }
+
+        ram = {}
+        if self._has("ram_percent"):
+            ram["mean_percent"] = self.df["ram_percent"].mean()
+            ram["max_percent"] = self.df["ram_percent"].max()
+        if self._has("ram_used_gb"):
+            ram["mean_used_gb"] = self.df["ram_used_gb"].mean()
+            ram["max_used_gb"] = self.df["ram_used_gb"].max()
+        if ram:
+            stats["ram"] = ram
 
         # Add GPU stats if available
-        if "gpu_0_gpu_load" in self.df.columns:
+        if self._has("gpu_0_gpu_load", "gpu_0_gpu_memory_percent"):
             stats["gpu_0"] = {
                 "mean_load": self.df["gpu_0_gpu_load"].mean(),
                 "max_load": self.df["gpu_0_gpu_load"].max(),
@@ -256,17 +347,21 @@ class MonitoringVisualizer:
         print("=" * 60)
         print(f"Duration: {stats['duration_seconds']:.2f} seconds")
         print(f"Samples: {stats['sample_count']}")
-        print("\n--- CPU ---")
-        print(f"  Mean: {stats['cpu']['mean']:.2f}%")
-        print(f"  Max:  {stats['cpu']['max']:.2f}%")
-        print(f"  Min:  {stats['cpu']['min']:.2f}%")
-        print("\n--- RAM ---")
-        print(
-            f"  Mean: {stats['ram']['mean_percent']:.2f}% ({stats['ram']['mean_used_gb']:.2f} GB)"
-        )
-        print(
-            f"  Max:  {stats['ram']['max_percent']:.2f}% ({stats['ram']['max_used_gb']:.2f} GB)"
-        )
+        if "cpu" in stats:
+            print("\n--- CPU ---")
+            print(f"  Mean: {stats['cpu']['mean']:.2f}%")
+            print(f"  Max:  {stats['cpu']['max']:.2f}%")
+            print(f"  Min:  {stats['cpu']['min']:.2f}%")
+
+        if "ram" in stats:
+            print("\n--- RAM ---")
+            for label, key in (("Mean", "mean"), ("Max", "max")):
+                parts = []
+                if f"{key}_percent" in stats["ram"]:
+                    parts.append(f"{stats['ram'][f'{key}_percent']:.2f}%")
+                if f"{key}_used_gb" in stats["ram"]:
+                    parts.append(f"({stats['ram'][f'{key}_used_gb']:.2f} GB)")
+                print(f"  {label + ':':<5} {' '.join(parts)}")
 
         if "gpu_0" in stats:
             print("\n--- GPU 0 ---")
@@ -285,7 +380,7 @@ def visualize_monitoring_file(
     Convenience function to visualize a monitoring file.
 
     Args:
-        csv_path: Path to monitoring CSV file
+        csv_path: Path to monitoring session file (.csv, .parquet or .feather)
         output_dir: Directory to save plots. If None, uses same dir as CSV
     """
     csv_path = Path(csv_path)
@@ -222,16 +222,19 @@ package_dir = "kataglyphispythonpackage"
 version = Path("VERSION.txt").read_text().strip()
 
 
-def list_py_files(package_dir):
+def list_py_files(package_dir, suffix=".py"):
     py_files = []
     for root, dirs, files in os.walk(package_dir):
         for file in files:
-            if file.endswith(".py"):
+            if file.endswith(suffix):
                 py_files.append(os.path.join(root, file))
     return py_files
 
 
 py_files = list_py_files(package_dir)
+# Hand-written Cython kernels (e.g. _fused_kernel.pyx); the pure-Python
+# modules importing them fall back to NumPy when they are not compiled.
+pyx_files = list_py_files(package_dir, suffix=".pyx")
 
 extensions = []
 if CYTHONIZE:
@@ -242,15 +245,26 @@ if CYTHONIZE:
         extra_compile_args = ["-O3", "-flto", "-fvisibility=hidden"]
         extra_link_args = ["-flto"]
 
-    extensions = [
-        Extension(
-            py_file.replace(os.path.sep, ".")[:-3],  # + "_compiled",
-            [py_file],
-            extra_compile_args=extra_compile_args,
-            extra_link_args=extra_link_args,
-        )
-        for py_file in py_files
-    ]
+    extensions = (
+        [
+            Extension(
+                py_file.replace(os.path.sep, ".")[:-3],  # + "_compiled",
+                [py_file],
+                extra_compile_args=extra_compile_args,
+                extra_link_args=extra_link_args,
+            )
+            for py_file in py_files
+        ]
+        + [
+            Extension(
+                pyx_file.replace(os.path.sep, ".")[:-4],
+                [pyx_file],
+                extra_compile_args=extra_compile_args,
+                extra_link_args=extra_link_args,
+            )
+            for pyx_file in pyx_files
+        ]
+    )
 
 setup_kwargs = {"name": package_dir, "version": version, "zip_safe": False}
 
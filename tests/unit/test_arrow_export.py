@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from kataglyphispythonpackage.dummy import SimpleMLPreprocessor
+
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from kataglyphispythonpackage.arrow_export import (  # noqa: E402
+    to_record_batch,
+    write_parquet,
+)
+
+
+def test_record_batch_wraps_buffers_without_copy():
+    result = SimpleMLPreprocessor(100, seed=1).run_pipeline()
+    batch = to_record_batch(result)
+
+    assert batch.num_rows == 100
+    assert batch.schema.names == ["features", "labels", "normalized", "joke_labels"]
+    assert batch.schema.metadata[b"mean"]
+    features = batch.column("features")
+    assert features.values.buffers()[1].address == result["features"].ctypes.data
+    assert batch.column("labels").buffers()[1].address == result["labels"].ctypes.data
+    assert batch.column("joke_labels").to_pylist() == result["joke_labels"].tolist()
+    assert np.array_equal(
+        np.asarray(features.flatten()).reshape(100, 3), result["features"]
+    )
+
+
+def test_write_parquet_streams_row_groups(tmp_path):
+    ml = SimpleMLPreprocessor(1000, seed=2, chunk_size=300)
+    path = write_parquet(tmp_path / "stream.parquet", ml.stream_pipeline())
+
+    parquet = pq.ParquetFile(path)
+    assert parquet.metadata.num_row_groups == 4
+    assert parquet.metadata.num_rows == 1000
+
+    table = parquet.read()
+    features = np.asarray(table.column("features").combine_chunks().flatten())
+    expected, _ = SimpleMLPreprocessor(
+        1000, seed=2, chunk_size=300
+    ).generate_synthetic_data()
+    assert np.array_equal(features.reshape(1000, 3), expected)
+
+
+def test_write_parquet_single_result(tmp_path):
+    result = SimpleMLPreprocessor(50, seed=3).run_pipeline()
+    path = write_parquet(tmp_path / "result.parquet", result)
+
+    table = pq.read_table(path)
+    assert table.num_rows == 50
+    assert table.column("labels").to_pylist() == result["labels"].tolist()
+
+
+def test_record_batch_of_empty_result():
+    batch = to_record_batch(SimpleMLPreprocessor(0).run_pipeline())
+
+    assert batch.num_rows == 0
+    assert batch.schema.field("features").type.list_size == 3
+    assert batch.schema.field("normalized").type.list_size == 3
@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from kataglyphispythonpackage.categorical import CategoricalLabels
+
+
+def test_lazy_decoding():
+    labels = CategoricalLabels(np.array([0, 1, 1]), ["no", "yes"])
+
+    assert len(labels) == 3
+    assert labels.tolist() == ["no", "yes", "yes"]
+    assert np.asarray(labels).tolist() == ["no", "yes", "yes"]
+    assert labels[1:].tolist() == ["yes", "yes"]
+    assert list(labels) == ["no", "yes", "yes"]
+
+
+def test_pandas_round_trip():
+    labels = CategoricalLabels(np.array([1, 0]), ["a", "b"])
+    categorical = labels.to_pandas()
+
+    assert isinstance(categorical, pd.Categorical)
+    assert list(categorical) == ["b", "a"]
+    restored = CategoricalLabels.from_pandas(categorical)
+    assert np.array_equal(restored.codes, labels.codes)
+    assert restored.categories == labels.categories
+
+
+def test_codes_must_index_categories():
+    with pytest.raises(ValueError):
+        CategoricalLabels(np.array([0, 2]), ["a", "b"])
+
+
+def test_elementwise_comparison():
+    labels = CategoricalLabels(np.array([0, 1, 1]), ["no", "yes"])
+
+    assert (labels == "yes").tolist() == [False, True, True]
+    assert (labels != "yes").tolist() == [True, False, False]
+    assert not (labels == "maybe").any()
+    assert (labels == labels[::-1]).tolist() == [False, True, False]
+    assert (labels == ["no", "no", "yes"]).tolist() == [True, False, True]
+    # Same masks as the pandas.Categorical layout it mirrors
+    assert np.array_equal(labels == "yes", labels.to_pandas() == "yes")
+    assert labels.shape == (3,)
+    assert labels.dtype == labels.to_pandas().dtype
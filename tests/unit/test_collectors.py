@@ -0,0 +1,300 @@
+import os
+import subprocess
+import sys
+import time
+from collections import namedtuple
+
+import numpy as np
+import psutil
+import pytest
+
+from kataglyphispythonpackage.collectors import (
+    COLLECTORS,
+    Collector,
+    DiskIOCollector,
+    _counter_delta,
+    register_collector,
+)
+from kataglyphispythonpackage.stream_writer import read_monitoring_csv
+from kataglyphispythonpackage.system_monitor import SystemMonitor
+
+
+class CountingCollector(Collector):
+    name = "counting"
+
+    def schema(self):
+        return {"count": "int64"}
+
+    def collect(self):
+        return {"count": self.collections}
+
+
+@pytest.fixture
+def counting_collector():
+    register_collector(CountingCollector)
+    yield CountingCollector
+    del COLLECTORS[CountingCollector.name]
+
+
+def test_due_on_period_grid():
+    collector = CountingCollector(monitor=None, period=1e-6)
+    assert collector.due(0)
+    assert not collector.due(999)
+    # A late tick collects once and keeps the grid
+    assert collector.due(2_500)
+    assert not collector.due(2_999)
+    assert collector.due(3_000)
+    assert all(CountingCollector(None).due(t) for t in (0, 0, 1))
+
+
+def test_collectors_run_at_their_own_period(tmp_path):
+    monitor = SystemMonitor(
+        output_dir=tmp_path, collectors={"cpu": None, "memory": 0.05}
+    )
+    deadline = time.perf_counter() + 0.25
+    while time.perf_counter() < deadline:
+        monitor.sample()
+        time.sleep(0.005)
+
+    cpu, memory = monitor.collectors
+    assert memory.collections < cpu.collections
+    assert 4 <= memory.collections <= 7
+
+    df = monitor.to_dataframe()
+    assert df["cpu_percent"].notna().all()
+    assert df["ram_percent"].notna().sum() == memory.collections
+    assert "gpu_0_gpu_load" not in df
+
+
+def test_sample_without_due_collectors(tmp_path):
+    monitor = SystemMonitor(output_dir=tmp_path, collectors={"memory": 60.0})
+    assert monitor.sample() is not None
+    assert monitor.sample() is None
+    assert len(monitor.monitoring_data) == 1
+
+
+def test_registered_plugin(tmp_path, counting_collector):
+    monitor = SystemMonitor(output_dir=tmp_path, collectors={"counting": None})
+    assert monitor.schema() == {
+        "timestamp_ns": "int64",
+        "elapsed_ns": "int64",
+        "count": "int64",
+    }
+    for _ in range(3):
+        monitor.sample()
+    assert monitor.monitoring_data.column("count").tolist() == [0, 1, 2]
+    assert monitor.monitoring_data.column("count").dtype == np.int64
+
+
+def test_unknown_collector(tmp_path):
+    with pytest.raises(ValueError, match="registered"):
+        SystemMonitor(output_dir=tmp_path, collectors={"nope": 1.0})
+    with pytest.raises(ValueError):
+        SystemMonitor(output_dir=tmp_path, collectors={"cpu": 0})
+
+
+def _busy_child(seconds):
+    code = f"import time\nend = time.time() + {seconds}\nwhile time.time() < end: pass"
+    return subprocess.Popen([sys.executable, "-c", code])
+
+
+def test_process_collector_tracks_current_process(tmp_path):
+    monitor = SystemMonitor(output_dir=tmp_path, pid=os.getpid())
+    assert "process" in monitor.collector_periods
+    first = monitor.sample()
+    assert first["proc_count"] >= 1
+    assert first["proc_rss_mb"] > 0
+    assert first["proc_num_threads"] >= 1
+    assert first["proc_cpu_percent"] is None
+
+    deadline = time.perf_counter() + 0.2
+    while time.perf_counter() < deadline:
+        pass
+    second = monitor.sample()
+    assert second["proc_cpu_user_s"] + second["proc_cpu_system_s"] > (
+        first["proc_cpu_user_s"] + first["proc_cpu_system_s"]
+    )
+    assert second["proc_cpu_percent"] > 0
+
+
+def test_process_collector_follows_children(tmp_path):
+    monitor = SystemMonitor(output_dir=tmp_path, collectors={"process": None})
+    before = monitor.sample()
+
+    child = _busy_child(0.5)
+    try:
+        time.sleep(0.3)
+        during = monitor.sample()
+        assert during["proc_count"] == before["proc_count"] + 1
+    finally:
+        child.wait()
+
+    after = monitor.sample()
+    assert after["proc_count"] == before["proc_count"]
+    # The exited child's CPU time stays in the cumulative totals
+    assert after["proc_cpu_user_s"] >= during["proc_cpu_user_s"]
+    assert after["proc_cpu_user_s"] - before["proc_cpu_user_s"] > 0.1
+
+
+def test_process_sampler_excludes_itself(tmp_path):
+    monitor = SystemMonitor(output_dir=tmp_path, collectors={"process": None})
+    with monitor.running(interval=0.1, mode="process"):
+        deadline = time.time() + 30
+        while len(monitor.monitoring_data) < 2 and time.time() < deadline:
+            time.sleep(0.1)
+    counts = monitor.monitoring_data.column("proc_count")
+    assert len(counts) >= 2
+    assert (counts == 1).all()
+
+
+def test_process_collector_lost_process(tmp_path):
+    child = _busy_child(0)
+    child.wait()
+    monitor = SystemMonitor(output_dir=tmp_path, collectors={"process": None})
+    monitor.collectors[0].pid = child.pid
+    sample = monitor.sample()
+    assert "proc_count" not in sample
+
+
+def test_per_core_collector_stores_blocks(tmp_path):
+    monitor = SystemMonitor(output_dir=tmp_path, collectors={"cpu_cores": None})
+    n_cores = psutil.cpu_count()
+    stream = monitor.stream_to()
+    deadline = time.perf_counter() + 0.05
+    monitor.sample()
+    while time.perf_counter() < deadline:
+        pass
+    sample = monitor.sample()
+    monitor.close_stream()
+
+    assert sample["cpu_core_percent"].shape == (n_cores,)
+    assert sample["cpu_core_percent"].max() > 0
+    assert (sample["cpu_core_user"] <= sample["cpu_core_percent"] + 1e-3).all()
+    block = monitor.monitoring_data.column("cpu_core_percent")
+    assert block.shape == (2, n_cores) and block.dtype == np.float32
+
+    df = monitor.to_dataframe()
+    assert f"cpu_core_steal_{n_cores - 1}" in df
+    streamed = read_monitoring_csv(stream)
+    assert streamed.columns.tolist() == df.columns.tolist()
+    assert np.allclose(streamed["cpu_core_percent_0"], df["cpu_core_percent_0"])
+
+
+def test_per_core_heatmap(tmp_path):
+    matplotlib = pytest.importorskip("matplotlib")
+    matplotlib.use("Agg")
+    from kataglyphispythonpackage.visualize_monitor import MonitoringVisualizer
+
+    monitor = SystemMonitor(
+        output_dir=tmp_path, collectors={"cpu": None, "cpu_cores": None}
+    )
+    for _ in range(3):
+        monitor.sample()
+    vis = MonitoringVisualizer(monitor.save_data())
+    assert len(vis.core_columns("iowait")) == psutil.cpu_count()
+    ax = vis.plot_cpu_cores()
+    assert ax.get_ylabel() == "CPU core"
+    assert vis.plot_cpu_cores(metric="nope") is None
+
+
+def test_visualize_session_without_cpu_or_memory(tmp_path):
+    matplotlib = pytest.importorskip("matplotlib")
+    matplotlib.use("Agg")
+    from kataglyphispythonpackage.visualize_monitor import visualize_monitoring_file
+
+    monitor = SystemMonitor(output_dir=tmp_path, collectors={"network": None})
+    for _ in range(2):
+        monitor.sample()
+    path = monitor.save_data()
+    visualize_monitoring_file(path)
+    assert (tmp_path / f"{path.stem}_visualization.png").exists()
+
+
+def test_counter_delta_handles_wraparound():
+    assert _counter_delta(150, 100) == 50
+    assert _counter_delta(10, 2**32 - 10) == 20
+    assert _counter_delta(10, 2**64 - 10) == 20
+    # Going back by more than half the range is a reset, not a wrap
+    assert _counter_delta(5, 2**40) == 5
+
+
+# Linux layout of psutil.disk_io_counters()
+_DiskIO = namedtuple(
+    "sdiskio",
+    "read_count write_count read_bytes write_bytes read_time write_time busy_time",
+)
+
+
+def _disk(**values):
+    return _DiskIO(**{**dict.fromkeys(_DiskIO._fields, 0), **values})
+
+
+def test_disk_rates_from_counter_deltas(tmp_path, monkeypatch):
+    readings = iter(
+        [
+            {"sda": _disk(), "sda1": _disk(), "loop0": _disk()},
+            {"sda": _disk(read_bytes=2**32 - 100, read_count=10, read_time=30)},
+            {
+                "sda": _disk(read_bytes=924, read_count=20, read_time=40),
+                "sdb": _disk(write_bytes=7),
+            },
+        ]
+    )
+    monkeypatch.setattr(
+        psutil, "disk_io_counters", lambda perdisk, nowrap: next(readings)
+    )
+    sys_block = tmp_path / "block"
+    for disk in ("sda", "sdb", "loop0"):
+        (sys_block / disk).mkdir(parents=True)
+    monkeypatch.setattr(DiskIOCollector, "_SYS_BLOCK", sys_block)
+    monitor = SystemMonitor(output_dir=tmp_path, collectors={"disk": None})
+    (collector,) = monitor.collectors
+    assert collector.devices == ["sda"]
+    assert "disk_sda_read_latency_ms" in monitor.schema()
+
+    collector._then = time.perf_counter() - 2.0
+    first = collector.collect()
+    assert first["disk_sda_read_ops_s"] == pytest.approx(5, rel=0.01)
+    assert first["disk_sda_read_latency_ms"] == 3.0
+    assert first["disk_sda_write_latency_ms"] is None
+
+    collector._then = time.perf_counter() - 2.0
+    second = collector.collect()
+    # The 32-bit read_bytes counter wrapped: 100 bytes before, 924 after
+    assert second["disk_sda_read_bytes_s"] == pytest.approx(512, rel=0.01)
+    assert second["disk_sda_read_latency_ms"] == 1.0
+    # New devices report from their second reading on
+    assert "disk_sdb_write_bytes_s" not in second
+
+
+def test_disk_partitions_are_not_double_counted(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        psutil,
+        "disk_io_counters",
+        lambda perdisk, nowrap: {"sda": _disk(), "sda1": _disk(), "nvme0n1": _disk()},
+    )
+    sys_block = tmp_path / "block"
+    (sys_block / "sda").mkdir(parents=True)
+    (sys_block / "nvme0n1").mkdir()
+    monkeypatch.setattr(DiskIOCollector, "_SYS_BLOCK", sys_block)
+    (collector,) = SystemMonitor(
+        output_dir=tmp_path, collectors={"disk": None}
+    ).collectors
+    assert collector.devices == ["sda", "nvme0n1"]
+
+    # Without /sys/block (not Linux) every reported device is kept
+    monkeypatch.setattr(DiskIOCollector, "_SYS_BLOCK", tmp_path / "missing")
+    (collector,) = SystemMonitor(
+        output_dir=tmp_path, collectors={"disk": None}
+    ).collectors
+    assert collector.devices == ["sda", "sda1", "nvme0n1"]
+
+
+def test_network_collector(tmp_path):
+    monitor = SystemMonitor(output_dir=tmp_path, collectors={"network": None})
+    (collector,) = monitor.collectors
+    for _ in range(2):
+        sample = monitor.sample()
+    for nic in collector.devices:
+        assert sample[f"net_{nic}_recv_bytes_s"] >= 0
+        assert sample[f"net_{nic}_drops_s"] >= 0
@@ -1,7 +1,12 @@
+import shutil
+import threading
+
 import numpy as np
 import pytest
 
 from kataglyphispythonpackage.dummy import SimpleMLPreprocessor
+from kataglyphispythonpackage.pipeline_cache import PipelineCache
+from kataglyphispythonpackage.quantile_sketch import QuantileSketch
 
 
 def test_generate_synthetic_data():
@@ -34,3 +39,466 @@ def test_apply_joke_labeling():
         ]
     )
     assert np.array_equal(jokes, expected)
+
+
+def test_stream_pipeline_matches_full_statistics():
+    ml = SimpleMLPreprocessor(1050, seed=7, chunk_size=100)
+    chunks = list(ml.stream_pipeline())
+
+    assert len(chunks) == 11
+    assert max(len(chunk["features"]) for chunk in chunks) == 100
+    assert [chunk["offset"] for chunk in chunks] == list(range(0, 1050, 100))
+
+    features = np.concatenate([chunk["features"] for chunk in chunks])
+    normalized = np.concatenate([chunk["normalized"] for chunk in chunks])
+    labels = np.concatenate([chunk["labels"] for chunk in chunks])
+    assert features.shape == (1050, 3)
+    assert np.allclose(ml.stats["mean"], features.mean(axis=0))
+    assert np.allclose(ml.stats["std"], features.std(axis=0))
+    assert np.allclose(normalized, (features - features.mean(0)) / features.std(0))
+    assert np.array_equal(labels, (features.sum(axis=1) > 15).astype(int))
+
+
+def test_stream_pipeline_is_reproducible():
+    first = list(SimpleMLPreprocessor(300, seed=3, chunk_size=64).stream_pipeline())
+    second = list(SimpleMLPreprocessor(300, seed=3, chunk_size=64).stream_pipeline())
+    for a, b in zip(first, second):
+        assert np.array_equal(a["features"], b["features"])
+
+
+def test_stream_pipeline_rejects_invalid_chunk_size():
+    with pytest.raises(ValueError):
+        SimpleMLPreprocessor(10, chunk_size=0)
+
+
+def test_memmap_storage_round_trip(tmp_path):
+    ml = SimpleMLPreprocessor(500, seed=11, chunk_size=64, storage_dir=tmp_path)
+    features, labels = ml.generate_synthetic_data()
+    normalized = ml.normalize_features()
+
+    assert isinstance(features, np.memmap)
+    assert isinstance(normalized, np.memmap)
+    assert features.shape == (500, 3)
+    assert np.array_equal(labels, (features.sum(axis=1) > 15).astype(int))
+    assert np.allclose(normalized, (features - features.mean(0)) / features.std(0))
+    assert {p.name for p in tmp_path.iterdir()} == {
+        "features.npy",
+        "labels.npy",
+        "normalized.npy",
+    }
+
+
+def test_open_stored_dataset_and_normalize(tmp_path):
+    SimpleMLPreprocessor(200, seed=5, storage_dir=tmp_path).generate_synthetic_data()
+    (tmp_path / "normalized.npy").unlink(missing_ok=True)
+
+    ml = SimpleMLPreprocessor.open(tmp_path, chunk_size=50)
+    assert ml.n_samples == 200
+    assert isinstance(ml.features, np.memmap)
+    normalized = ml.normalize_features()
+    assert normalized.shape == (200, 3)
+    assert (tmp_path / "normalized.npy").exists()
+    assert np.allclose(normalized.mean(axis=0), 0, atol=1e-7)
+
+
+def test_open_missing_dataset(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        SimpleMLPreprocessor.open(tmp_path)
+
+
+@pytest.mark.parametrize("scaling", ["standard", "robust"])
+@pytest.mark.parametrize("n_workers", [2, 3, 8])
+def test_parallel_generation_is_independent_of_worker_count(n_workers, scaling):
+    serial = SimpleMLPreprocessor(1000, seed=42, chunk_size=64, scaling=scaling)
+    features, labels = serial.generate_synthetic_data()
+    normalized = serial.normalize_features()
+
+    parallel = SimpleMLPreprocessor(
+        1000, seed=42, chunk_size=64, n_workers=n_workers, scaling=scaling
+    )
+    parallel_features, parallel_labels = parallel.generate_synthetic_data()
+
+    assert np.array_equal(features, parallel_features)
+    assert np.array_equal(labels, parallel_labels)
+    assert np.array_equal(normalized, parallel.normalize_features())
+    assert parallel.stats == serial.stats
+
+
+def test_process_workers_write_into_memmap(tmp_path):
+    expected, _ = SimpleMLPreprocessor(
+        500, seed=9, chunk_size=50
+    ).generate_synthetic_data()
+
+    ml = SimpleMLPreprocessor(
+        500,
+        seed=9,
+        chunk_size=50,
+        storage_dir=tmp_path,
+        n_workers=2,
+        executor="process",
+    )
+    features, labels = ml.generate_synthetic_data()
+
+    assert np.array_equal(features, expected)
+    assert np.array_equal(labels, (expected.sum(axis=1) > 15).astype(int))
+
+
+def test_process_executor_requires_storage_dir():
+    with pytest.raises(ValueError):
+        SimpleMLPreprocessor(10, n_workers=2, executor="process")
+
+
+def test_float32_pipeline():
+    ml = SimpleMLPreprocessor(300, seed=1, chunk_size=64, dtype=np.float32)
+    features, _ = ml.generate_synthetic_data()
+    normalized = ml.normalize_features()
+
+    assert features.dtype == np.float32
+    assert normalized.dtype == np.float32
+    assert np.allclose(normalized.mean(axis=0), 0, atol=1e-5)
+
+
+def test_normalize_features_inplace_reuses_buffer():
+    ml = SimpleMLPreprocessor(200, seed=2, chunk_size=32)
+    features, _ = ml.generate_synthetic_data()
+    expected = (features - features.mean(0)) / features.std(0)
+
+    normalized = ml.normalize_features(inplace=True)
+
+    assert normalized is features
+    assert np.allclose(normalized, expected)
+
+
+def test_normalize_features_into_out_buffer():
+    ml = SimpleMLPreprocessor(100, seed=3)
+    features, _ = ml.generate_synthetic_data()
+    out = np.empty_like(features)
+
+    assert ml.normalize_features(out=out) is out
+    assert np.allclose(out.std(axis=0), 1)
+    with pytest.raises(ValueError):
+        ml.normalize_features(out=np.empty((3, 3)))
+
+
+def test_joke_labels_are_categorical():
+    ml = SimpleMLPreprocessor(4)
+    ml.labels = np.array([1, 0, 0, 1])
+    jokes = ml.apply_joke_labeling()
+
+    assert jokes.codes.dtype == np.int8
+    assert jokes.nbytes == 4
+    assert jokes[0] == "Definitely ML"
+    assert jokes.to_pandas().tolist() == jokes.tolist()
+
+
+def test_partial_fit_and_transform_match_full_normalization(tmp_path):
+    data = np.random.default_rng(4).normal(5.0, 2.0, size=(600, 3))
+    ml = SimpleMLPreprocessor(0)
+    for batch in np.array_split(data, 9):
+        ml.partial_fit(batch)
+
+    expected = (data - data.mean(axis=0)) / data.std(axis=0)
+    assert np.allclose(ml.transform(data[:10]), expected[:10])
+    assert np.allclose(ml.stats["mean"], data.mean(axis=0))
+
+    path = ml.save_stats(tmp_path / "stats.json")
+    serving = SimpleMLPreprocessor(0).load_stats(path)
+    assert np.array_equal(serving.transform(data[10:20]), ml.transform(data[10:20]))
+
+
+def test_transform_requires_fitted_statistics():
+    with pytest.raises(RuntimeError):
+        SimpleMLPreprocessor(0).transform(np.ones((2, 3)))
+
+
+def test_normalize_features_fits_statistics_for_transform():
+    ml = SimpleMLPreprocessor(100, seed=8)
+    ml.generate_synthetic_data()
+    normalized = ml.normalize_features()
+    assert np.allclose(ml.transform(ml.features), normalized)
+
+
+def test_run_pipeline_is_lazy():
+    ml = SimpleMLPreprocessor(100, seed=6)
+    result = ml.run_pipeline()
+
+    assert not result.is_computed("features")
+    labels = result["labels"]
+    assert labels.shape == (100,)
+    assert result.is_computed("features")
+    assert not result.is_computed("normalized")
+    assert not result.is_computed("joke_labels")
+    assert ml.normalized.size == 0
+
+    assert result["mean"] == ml.stats["mean"]
+    assert result.is_computed("normalized")
+    assert set(result) == {
+        "features",
+        "labels",
+        "normalized",
+        "mean",
+        "std",
+        "joke_labels",
+    }
+
+
+def test_run_pipeline_release_drops_stage():
+    ml = SimpleMLPreprocessor(50, seed=6)
+    result = ml.run_pipeline()
+    result["normalized"]
+
+    result.release("features", "normalized")
+
+    assert ml.features.size == 0
+    assert ml.normalized.size == 0
+    assert result["labels"].shape == (50,)
+    with pytest.raises(RuntimeError):
+        result["features"]
+
+
+@pytest.mark.parametrize("prefetch", [0, 1, 3])
+def test_iter_batches_covers_all_rows(prefetch):
+    ml = SimpleMLPreprocessor(250, seed=12)
+    features, labels = ml.generate_synthetic_data()
+    expected = (features - features.mean(0)) / features.std(0)
+
+    batches = list(ml.iter_batches(64, prefetch=prefetch))
+
+    assert [len(x) for x, _ in batches] == [64, 64, 64, 58]
+    assert np.allclose(np.concatenate([x for x, _ in batches]), expected)
+    assert np.array_equal(np.concatenate([y for _, y in batches]), labels)
+
+
+def test_iter_batches_shuffle_keeps_rows_aligned():
+    ml = SimpleMLPreprocessor(200, seed=13)
+    features, labels = ml.generate_synthetic_data()
+    raw = features.copy()
+
+    batches = list(ml.iter_batches(50, shuffle=True))
+    x = np.concatenate([x for x, _ in batches])
+    y = np.concatenate([y for _, y in batches])
+
+    assert np.array_equal(features, raw)
+    restored = x * np.array(ml.stats["std"]) + np.array(ml.stats["mean"])
+    assert np.array_equal(y, (restored.sum(axis=1) > 15).astype(int))
+    assert not np.allclose(x, (raw - raw.mean(0)) / raw.std(0))
+
+
+def test_shuffle_order_is_independent_of_chunk_streams():
+    def epoch_labels(ml):
+        return np.concatenate([y for _, y in ml.iter_batches(50, shuffle=True)])
+
+    ml = SimpleMLPreprocessor(200, seed=13)
+    _, labels = ml.generate_synthetic_data()
+    first, second = epoch_labels(ml), epoch_labels(ml)
+
+    # Reproducible per seed, different per epoch
+    other = SimpleMLPreprocessor(200, seed=13)
+    other.generate_synthetic_data()
+    assert np.array_equal(epoch_labels(other), first)
+    assert not np.array_equal(first, second)
+    # Not the order drawn from the seeds of chunks 0 and 1
+    for index in (0, 1):
+        chunk_seed = np.random.SeedSequence(13, spawn_key=(index,))
+        order = np.random.default_rng(chunk_seed).permutation(200)
+        assert not np.array_equal(labels[order], first if index == 0 else second)
+
+
+@pytest.mark.parametrize("shuffle", [False, True])
+def test_iter_batches_after_inplace_normalization(shuffle):
+    ml = SimpleMLPreprocessor(1000, seed=8)
+    ml.generate_synthetic_data()
+    ml.normalize_features(inplace=True)
+
+    batches = list(ml.iter_batches(100, shuffle=shuffle))
+    features = np.concatenate([features for features, _ in batches])
+    assert np.allclose(features.mean(axis=0), 0, atol=1e-9)
+    assert np.allclose(features.std(axis=0), 1)
+    with pytest.raises(ValueError):
+        ml.transform(ml.features[:10])
+
+
+def test_iter_batches_stops_producer_on_early_exit():
+    ml = SimpleMLPreprocessor(1000, seed=14)
+    batches = ml.iter_batches(10, prefetch=2)
+    next(batches)
+    batches.close()
+    assert not any(t.name == "batch-prefetch" for t in threading.enumerate())
+
+
+def test_wide_features_pipeline():
+    ml = SimpleMLPreprocessor(64, seed=15, n_features=1000)
+    features, labels = ml.generate_synthetic_data()
+    normalized = ml.normalize_features()
+
+    assert ml.chunk_size == 196
+    assert features.shape == (64, 1000)
+    assert np.array_equal(labels, (features.sum(axis=1) > 5000).astype(int))
+    assert np.allclose(normalized, (features - features.mean(0)) / features.std(0))
+
+
+def test_run_pipeline_warm_cache_skips_computation(tmp_path, monkeypatch):
+    cache = PipelineCache(tmp_path)
+    cold = dict(SimpleMLPreprocessor(300, seed=21, cache=cache).run_pipeline())
+
+    def fail(*args, **kwargs):
+        raise AssertionError("stage recomputed despite warm cache")
+
+    monkeypatch.setattr(SimpleMLPreprocessor, "generate_synthetic_data", fail)
+    monkeypatch.setattr(SimpleMLPreprocessor, "normalize_features", fail)
+    warm = dict(SimpleMLPreprocessor(300, seed=21, cache=cache).run_pipeline())
+
+    assert isinstance(warm["features"], np.memmap)
+    assert np.array_equal(warm["features"], cold["features"])
+    assert np.array_equal(warm["normalized"], cold["normalized"])
+    assert warm["mean"] == cold["mean"]
+    assert warm["joke_labels"].tolist() == cold["joke_labels"].tolist()
+
+
+def test_robust_pipeline_with_only_generation_cached(tmp_path):
+    cache = PipelineCache(tmp_path)
+    ml = SimpleMLPreprocessor(
+        3000, seed=4, chunk_size=500, n_workers=3, scaling="robust", cache=cache
+    )
+    cold = dict(ml.run_pipeline())
+    shutil.rmtree(tmp_path / ml._cache_key("normalize"))
+
+    warm = dict(
+        SimpleMLPreprocessor(
+            3000, seed=4, chunk_size=500, scaling="robust", cache=cache
+        ).run_pipeline()
+    )
+    assert warm["median"] == cold["median"]
+    assert np.array_equal(warm["normalized"], cold["normalized"])
+
+
+@pytest.mark.parametrize("scaling", ["standard", "robust"])
+def test_pipeline_without_samples(scaling):
+    result = dict(SimpleMLPreprocessor(0, scaling=scaling).run_pipeline())
+
+    assert result["features"].size == 0
+    assert result["normalized"].size == 0
+    assert result["mean"] == result["std"] == []
+    assert len(result["joke_labels"]) == 0
+    if scaling == "robust":
+        assert result["median"] == result["iqr"] == []
+
+
+def test_empty_normalize_stage_is_not_cached(tmp_path):
+    cache = PipelineCache(tmp_path)
+    result = SimpleMLPreprocessor(0, seed=1, cache=cache).run_pipeline()
+
+    assert result["normalized"].size == 0
+    # Only the generate stage was stored
+    assert len([p for p in tmp_path.iterdir() if p.is_dir()]) == 1
+
+
+def test_cache_key_depends_on_parameters(tmp_path):
+    cache = PipelineCache(tmp_path)
+    dict(SimpleMLPreprocessor(100, seed=1, cache=cache).run_pipeline())
+    dict(SimpleMLPreprocessor(100, seed=2, cache=cache).run_pipeline())
+    dict(
+        SimpleMLPreprocessor(100, seed=1, dtype=np.float32, cache=cache).run_pipeline()
+    )
+    assert len([p for p in tmp_path.iterdir() if p.is_dir()]) == 9
+
+
+def test_robust_scaling_uses_median_and_iqr(tmp_path):
+    ml = SimpleMLPreprocessor(20_000, seed=3, scaling="robust")
+    ml.generate_synthetic_data()
+    normalized = ml.normalize_features()
+
+    median = np.median(ml.features, axis=0)
+    q25, q75 = np.percentile(ml.features, [25, 75], axis=0)
+    assert np.allclose(ml.stats["median"], median, atol=0.05)
+    assert np.allclose(ml.stats["iqr"], q75 - q25, atol=0.1)
+    assert np.allclose(ml.transform(ml.features[:10]), normalized[:10])
+
+    path = ml.save_stats(tmp_path / "stats.json")
+    serving = SimpleMLPreprocessor(0, scaling="robust").load_stats(path)
+    assert np.array_equal(serving.transform(ml.features[:10]), normalized[:10])
+
+
+def test_robust_scaling_clips_outliers():
+    data = np.random.default_rng(5).normal(size=(5000, 3))
+    data[0] = 1e6
+    ml = SimpleMLPreprocessor(0, scaling="robust", clip_percentiles=(1, 99))
+    ml.partial_fit(data)
+
+    transformed = ml.transform(data)
+    assert np.abs(transformed).max() < 5
+    assert np.allclose(transformed[0], transformed.max(axis=0))
+
+
+def test_robust_stream_pipeline_matches_run_pipeline():
+    result = SimpleMLPreprocessor(1000, seed=9, scaling="robust").run_pipeline()
+    chunks = list(
+        SimpleMLPreprocessor(
+            1000, seed=9, chunk_size=1000, scaling="robust"
+        ).stream_pipeline()
+    )
+    assert "median" in result
+    assert np.allclose(chunks[0]["normalized"], result["normalized"])
+
+
+@pytest.mark.parametrize("n_workers", [1, 4])
+def test_robust_sketch_is_built_during_generation(n_workers, monkeypatch):
+    ml = SimpleMLPreprocessor(
+        20_000, seed=3, chunk_size=1000, n_workers=n_workers, scaling="robust"
+    )
+    ml.generate_synthetic_data()
+
+    def fail(self, batch):
+        raise AssertionError("features were rescanned for the sketch")
+
+    monkeypatch.setattr(QuantileSketch, "update", fail)
+    ml.normalize_features()
+
+    median = np.median(ml.features, axis=0)
+    q25, q75 = np.percentile(ml.features, [25, 75], axis=0)
+    assert ml.fitted_sketch.count == 20_000
+    assert np.allclose(ml.stats["median"], median, atol=0.05)
+    assert np.allclose(ml.stats["iqr"], q75 - q25, atol=0.1)
+
+
+def test_invalid_scaling_options():
+    with pytest.raises(ValueError):
+        SimpleMLPreprocessor(10, scaling="minmax")
+    with pytest.raises(ValueError):
+        SimpleMLPreprocessor(10, scaling="robust", quantile_range=(75, 25))
+
+
+def test_run_pipeline_instrumentation_reports_each_stage():
+    records = []
+    ml = SimpleMLPreprocessor(
+        5000, seed=12, stage_callback=lambda stage, record: records.append(stage)
+    )
+    result = ml.run_pipeline()
+    result["joke_labels"]
+    result["normalized"]
+
+    assert records == ["generate", "joke_labels", "normalize"]
+    assert result.metrics.keys() == {"generate", "joke_labels", "normalize"}
+    normalize = result.metrics["normalize"]
+    assert normalize["cached"] is False
+    assert normalize["wall_s"] > 0
+    assert normalize["cpu_s"] >= 0
+    assert normalize["alloc_peak_bytes"] >= ml.normalized.nbytes
+    assert normalize["peak_rss_delta_bytes"] >= 0
+
+
+def test_run_pipeline_instrumentation_marks_cache_hits(tmp_path):
+    cache = PipelineCache(tmp_path)
+    dict(SimpleMLPreprocessor(200, seed=13, cache=cache).run_pipeline())
+    ml = SimpleMLPreprocessor(200, seed=13, cache=cache, instrument=True)
+    result = ml.run_pipeline()
+    result["normalized"]
+
+    assert result.metrics["normalize"]["cached"] is True
+    assert "generate" not in result.metrics
+
+
+def test_run_pipeline_without_instrumentation_has_no_metrics():
+    result = SimpleMLPreprocessor(100, seed=14).run_pipeline()
+    dict(result)
+    assert result.metrics == {}
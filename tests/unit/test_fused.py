@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from kataglyphispythonpackage.fused import COMPILED_AVAILABLE, fused_label_stats
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_matches_multi_pass(dtype):
+    features = np.random.default_rng(0).normal(5.0, 2.0, size=(5000, 3)).astype(dtype)
+    labels, stats = fused_label_stats(features, block_rows=777, use_compiled=False)
+
+    assert labels.dtype == np.int64
+    assert np.array_equal(labels, (features.sum(axis=1) > 15).astype(int))
+    assert stats.count == 5000
+    assert np.allclose(stats.mean, features.mean(axis=0, dtype=np.float64))
+    assert np.allclose(stats.std, features.std(axis=0, dtype=np.float64))
+
+
+def test_writes_into_labels_buffer():
+    features = np.full((10, 3), 6.0)
+    labels = np.zeros(10, dtype=np.int64)
+
+    result, _ = fused_label_stats(features, labels=labels)
+
+    assert result is labels
+    assert labels.tolist() == [1] * 10
+
+
+@pytest.mark.skipif(not COMPILED_AVAILABLE, reason="compiled kernel not built")
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_compiled_kernel_matches_numpy(dtype):
+    features = np.random.default_rng(1).normal(5.0, 2.0, size=(3000, 3)).astype(dtype)
+    labels, stats = fused_label_stats(features, use_compiled=True)
+    expected_labels, expected_stats = fused_label_stats(features, use_compiled=False)
+
+    assert np.array_equal(labels, expected_labels)
+    assert np.allclose(stats.mean, expected_stats.mean)
+    assert np.allclose(stats.m2, expected_stats.m2)
+
+
+def test_wide_matrix_is_processed_in_column_tiles():
+    features = np.random.default_rng(2).normal(5.0, 2.0, size=(40, 5000))
+    labels, stats = fused_label_stats(
+        features, threshold=25_000.0, block_rows=7, use_compiled=False
+    )
+
+    assert np.array_equal(labels, (features.sum(axis=1) > 25_000).astype(int))
+    assert np.allclose(stats.mean, features.mean(axis=0))
+    assert np.allclose(stats.variance, features.var(axis=0))
@@ -0,0 +1,51 @@
+import os
+
+import numpy as np
+
+from kataglyphispythonpackage.pipeline_cache import PipelineCache
+
+
+def test_store_and_load_round_trip(tmp_path):
+    cache = PipelineCache(tmp_path)
+    key = cache.make_key(n_samples=10, seed=1)
+    cache.store(key, {"values": np.arange(10)}, {"note": "hi"})
+
+    arrays, meta = cache.load(key)
+
+    assert isinstance(arrays["values"], np.memmap)
+    assert arrays["values"].tolist() == list(range(10))
+    assert meta == {"note": "hi"}
+    assert cache.load(cache.make_key(n_samples=10, seed=2)) is None
+    assert not [p for p in tmp_path.iterdir() if p.name.startswith(".")]
+
+
+def test_make_key_is_order_independent():
+    assert PipelineCache.make_key(a=1, b=2) == PipelineCache.make_key(b=2, a=1)
+    assert PipelineCache.make_key(a=1) != PipelineCache.make_key(a=2)
+
+
+def test_lru_eviction_respects_budget(tmp_path):
+    payload = {"values": np.zeros(1000)}
+    cache = PipelineCache(tmp_path, max_bytes=20_000)
+    cache.store("old", payload)
+    cache.store("recent", payload)
+    os.utime(tmp_path / "old", (1, 1))
+    os.utime(tmp_path / "recent", (2, 2))
+    cache.load("old")  # marks "old" as most recently used
+
+    cache.store("new", payload)
+
+    assert cache.load("recent") is None
+    assert cache.load("old") is not None
+    assert cache.load("new") is not None
+    assert cache.size_bytes() <= 20_000
+    assert not [p for p in tmp_path.iterdir() if p.name.startswith(".")]
+
+
+def test_load_of_entry_being_evicted_is_a_miss(tmp_path):
+    cache = PipelineCache(tmp_path)
+    cache.store("entry", {"a": np.arange(3), "b": np.arange(4)})
+    # A concurrent rmtree has already removed one of the arrays
+    (tmp_path / "entry" / "b.npy").unlink()
+
+    assert cache.load("entry") is None
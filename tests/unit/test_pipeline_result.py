@@ -0,0 +1,36 @@
+import pytest
+
+from kataglyphispythonpackage.pipeline_result import PipelineResult
+
+
+def test_stage_is_computed_once_for_all_keys():
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {"a": 1, "b": 2}
+
+    result = PipelineResult()
+    result.add_stage(("a", "b"), compute)
+
+    assert result["a"] == 1
+    assert result["b"] == 2
+    assert len(calls) == 1
+    assert dict(result) == {"a": 1, "b": 2}
+
+
+def test_release_notifies_and_blocks_access():
+    released = []
+    result = PipelineResult(on_release=released.append)
+    result.add_stage(("a",), lambda: {"a": 1})
+    result["a"]
+
+    result.release("a")
+
+    assert released == ["a"]
+    assert "a" in result
+    assert not result.is_computed("a")
+    with pytest.raises(RuntimeError):
+        result["a"]
+    with pytest.raises(KeyError):
+        result.release("missing")
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from kataglyphispythonpackage.quantile_sketch import QuantileSketch
+
+
+def _rank_error(data, estimates, qs):
+    ranks = (data[:, None, :] <= estimates[None, :, :]).mean(axis=0)
+    return np.abs(ranks - np.asarray(qs)[:, None]).max()
+
+
+def test_quantiles_match_numpy_within_rank_error():
+    data = np.random.default_rng(0).lognormal(size=(200_000, 3))
+    sketch = QuantileSketch(seed=0)
+    for chunk in np.array_split(data, 50):
+        sketch.update(chunk)
+
+    qs = [0.01, 0.25, 0.5, 0.75, 0.99]
+    assert sketch.count == len(data)
+    assert sketch.n_retained < 2000
+    assert _rank_error(data, sketch.quantile(qs), qs) < 0.02
+
+
+def test_merge_is_equivalent_to_single_sketch():
+    data = np.random.default_rng(1).normal(size=(100_000, 2))
+    merged = QuantileSketch(seed=1)
+    for part in np.array_split(data, 8):
+        merged.merge(QuantileSketch(seed=2).update(part))
+
+    assert merged.count == len(data)
+    assert _rank_error(data, merged.quantile([0.5]), [0.5]) < 0.02
+
+
+def test_small_inputs_are_exact():
+    data = np.arange(100, dtype=float)[:, None]
+    sketch = QuantileSketch().update(data)
+    assert sketch.quantile(0.5)[0] == np.quantile(data, 0.5, method="inverted_cdf")
+
+
+def test_dict_round_trip():
+    data = np.random.default_rng(3).normal(size=(5000, 3))
+    sketch = QuantileSketch(k=50, seed=3).update(data)
+    restored = QuantileSketch.from_dict(sketch.to_dict())
+
+    assert restored.count == sketch.count
+    assert np.array_equal(restored.quantile([0.1, 0.9]), sketch.quantile([0.1, 0.9]))
+
+
+def test_empty_sketch_raises():
+    with pytest.raises(ValueError):
+        QuantileSketch().quantile(0.5)
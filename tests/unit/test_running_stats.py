@@ -0,0 +1,41 @@
+import numpy as np
+
+from kataglyphispythonpackage.running_stats import RunningStats
+
+
+def test_update_matches_numpy():
+    data = np.random.default_rng(0).normal(3.0, 2.0, size=(1000, 4))
+    stats = RunningStats()
+    for chunk in np.array_split(data, 7):
+        stats.update(chunk)
+
+    assert stats.count == 1000
+    assert np.allclose(stats.mean, data.mean(axis=0))
+    assert np.allclose(stats.std, data.std(axis=0))
+
+
+def test_merge_is_equivalent_to_single_pass():
+    data = np.random.default_rng(1).normal(size=(500, 2))
+    left = RunningStats().update(data[:123])
+    right = RunningStats().update(data[123:])
+    merged = RunningStats().merge(left).merge(right)
+
+    assert merged.count == 500
+    assert np.allclose(merged.mean, data.mean(axis=0))
+    assert np.allclose(merged.variance, data.var(axis=0))
+
+
+def test_empty_batches_are_ignored():
+    stats = RunningStats().update(np.empty((0, 3)))
+    assert stats.count == 0
+    assert stats.mean is None
+
+
+def test_dict_round_trip():
+    data = np.random.default_rng(2).normal(size=(50, 3))
+    stats = RunningStats().update(data)
+    restored = RunningStats.from_dict(stats.to_dict())
+
+    assert restored.count == stats.count
+    assert np.array_equal(restored.mean, stats.mean)
+    assert np.array_equal(restored.m2, stats.m2)
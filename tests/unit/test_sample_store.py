@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+
+from kataglyphispythonpackage.sample_store import SampleStore
+
+
+def _sample(i):
+    return {"timestamp_ns": 10**18 + i, "cpu_percent": i * 0.5, "name": f"gpu{i}"}
+
+
+def test_columns_are_typed_arrays():
+    store = SampleStore(capacity=2)
+    for i in range(5):
+        store.append(_sample(i))
+
+    assert len(store) == 5
+    assert store.columns == ["timestamp_ns", "cpu_percent", "name"]
+    assert store.column("timestamp_ns").dtype == np.int64
+    assert store.column("timestamp_ns")[-1] == 10**18 + 4
+    assert store[1] == _sample(1)
+    assert list(store)[-1] == _sample(4)
+
+
+def test_ring_buffer_keeps_newest_samples():
+    store = SampleStore(max_samples=3)
+    for i in range(10):
+        store.append(_sample(i))
+
+    assert len(store) == 3
+    assert store.total_appended == 10
+    assert store.column("cpu_percent").tolist() == [3.5, 4.0, 4.5]
+    assert store[0] == _sample(7)
+
+
+def test_to_dataframe_is_zero_copy():
+    store = SampleStore(max_samples=4)
+    for i in range(6):
+        store.append(_sample(i))
+    df = store.to_dataframe()
+
+    assert df["timestamp_ns"].tolist() == [10**18 + i for i in range(2, 6)]
+    assert np.shares_memory(df["cpu_percent"].to_numpy(), store.column("cpu_percent"))
+
+
+def test_missing_and_new_metrics():
+    store = SampleStore()
+    store.append({"a": 1, "b": 2.0})
+    store.append({"a": 2, "c": 7})
+    store.append({"a": 2.5, "b": 1.0})
+
+    df = store.to_dataframe()
+    assert df["a"].tolist() == [1.0, 2.0, 2.5]
+    assert np.isnan(df["b"][1])
+    assert np.isnan(df["c"][0]) and df["c"][1] == 7
+
+
+def test_declared_columns_keep_order_and_dtype():
+    store = SampleStore()
+    store.declare({"t": "int64", "slow": "float32", "fast": "float64"})
+    store.append({"t": 0, "fast": 1.0})
+    store.append({"t": 1, "fast": 2.0, "slow": 5.0})
+
+    assert store.columns == ["t", "slow", "fast"]
+    assert store.column("t").dtype == np.int64
+    assert store.column("slow").dtype == np.float64
+    assert np.isnan(store[0]["slow"]) and store[1]["slow"] == 5.0
+
+
+def test_block_columns():
+    store = SampleStore(max_samples=3, capacity=1)
+    store.declare({"t": "int64", "cores": ("float32", 2)})
+    for i in range(5):
+        store.append({"t": i, "cores": np.array([i, 10 * i], dtype=np.float32)})
+    store.append({"t": 5})
+
+    block = store.column("cores")
+    assert block.shape == (3, 2) and block.dtype == np.float32
+    assert block[:2].tolist() == [[3, 30], [4, 40]]
+    assert np.isnan(block[2]).all()
+    assert store[0]["cores"].tolist() == [3, 30]
+
+    df = store.to_dataframe()
+    assert df.columns.tolist() == ["t", "cores_0", "cores_1"]
+    assert df["cores_1"].tolist()[:2] == [30, 40]
+    assert np.shares_memory(df["cores_0"].to_numpy(), block)
+
+
+def test_clear_and_invalid_arguments():
+    store = SampleStore()
+    store.append(_sample(0))
+    store.clear()
+    assert len(store) == 0
+    assert store.nbytes == 0
+
+    with pytest.raises(ValueError):
+        SampleStore(max_samples=0)
+    with pytest.raises(IndexError):
+        store[0]
@@ -0,0 +1,99 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from kataglyphispythonpackage.session_io import (
+    convert_session,
+    read_session,
+    session_format,
+    write_session,
+)
+from kataglyphispythonpackage.system_monitor import SystemMonitor
+from kataglyphispythonpackage.visualize_monitor import MonitoringVisualizer
+
+
+@pytest.fixture
+def session():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "timestamp_ns": np.arange(100, dtype=np.int64) + 10**18,
+            "elapsed_seconds": np.arange(100) / 10,
+            "cpu_percent": rng.uniform(0, 100, 100),
+            "ram_percent": rng.uniform(0, 100, 100),
+        }
+    )
+
+
+def test_session_format_from_suffix():
+    assert session_format("a.parquet") == "parquet"
+    assert session_format("a.FEATHER") == "feather"
+    assert session_format("a.csv") == "csv"
+    assert session_format("a.txt") == "csv"
+
+
+def test_csv_round_trip_with_projection(tmp_path, session):
+    path = write_session(session, tmp_path / "session.csv")
+    df = read_session(path, columns=["elapsed_seconds", "cpu_percent"])
+    assert df.columns.tolist() == ["elapsed_seconds", "cpu_percent"]
+    assert len(df) == 100
+
+
+@pytest.mark.parametrize("suffix", [".parquet", ".feather"])
+def test_binary_formats_are_exact(tmp_path, session, suffix):
+    pytest.importorskip("pyarrow")
+    path = write_session(session, tmp_path / f"session{suffix}")
+
+    pd.testing.assert_frame_equal(read_session(path), session)
+    projected = read_session(path, columns=["cpu_percent"])
+    assert projected["cpu_percent"].tolist() == session["cpu_percent"].tolist()
+
+
+def test_convert_csv_session_to_parquet(tmp_path, session):
+    pytest.importorskip("pyarrow")
+    csv_path = write_session(session, tmp_path / "session.csv")
+    parquet_path = convert_session(csv_path)
+
+    assert parquet_path == tmp_path / "session.parquet"
+    pd.testing.assert_frame_equal(read_session(parquet_path), read_session(csv_path))
+
+
+def test_save_data_as_parquet_loads_in_visualizer(tmp_path):
+    pytest.importorskip("pyarrow")
+    monitor = SystemMonitor(output_dir=tmp_path)
+    for _ in range(3):
+        monitor.sample()
+    path = monitor.save_data(format="parquet")
+
+    assert path.suffix == ".parquet"
+    vis = MonitoringVisualizer(path, columns=["elapsed_seconds", "cpu_percent"])
+    assert vis.df.columns.tolist() == ["elapsed_seconds", "cpu_percent"]
+    assert (
+        vis.df["elapsed_seconds"].tolist()
+        == monitor.to_dataframe()["elapsed_seconds"].tolist()
+    )
+
+
+def test_visualizer_with_projected_memory_columns(tmp_path, capsys):
+    matplotlib = pytest.importorskip("matplotlib")
+    matplotlib.use("Agg")
+    monitor = SystemMonitor(output_dir=tmp_path)
+    for _ in range(3):
+        monitor.sample()
+
+    vis = MonitoringVisualizer(
+        monitor.save_data(), columns=["elapsed_seconds", "ram_percent"]
+    )
+    stats = vis.get_statistics()
+    assert set(stats["ram"]) == {"mean_percent", "max_percent"}
+    assert "cpu" not in stats
+    vis.print_summary()
+    assert "--- RAM ---" in capsys.readouterr().out
+    assert len(vis.plot_all(show=False).axes) == 1
+
+
+def test_save_data_rejects_unknown_format(tmp_path):
+    monitor = SystemMonitor(output_dir=tmp_path)
+    monitor.sample()
+    with pytest.raises(ValueError):
+        monitor.save_data(format="xlsx")
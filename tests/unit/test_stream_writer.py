@@ -0,0 +1,85 @@
+import time
+
+import pytest
+from loguru import logger
+
+from kataglyphispythonpackage.stream_writer import (
+    StreamingCSVWriter,
+    read_monitoring_csv,
+)
+
+
+def test_batches_are_flushed_by_size(tmp_path):
+    path = tmp_path / "samples.csv"
+    writer = StreamingCSVWriter(path, batch_size=10, flush_interval=60)
+    for i in range(25):
+        writer.write({"i": i, "value": i * 0.5})
+
+    deadline = time.time() + 5
+    while writer.rows_written < 20 and time.time() < deadline:
+        time.sleep(0.01)
+    # Two full batches are on disk before close; the rest waits for a flush.
+    assert writer.rows_written == 20
+    assert len(read_monitoring_csv(path)) == 20
+
+    writer.close()
+    df = read_monitoring_csv(path)
+    assert df["i"].tolist() == list(range(25))
+    assert writer.batches_written == 3
+
+
+def test_batches_are_flushed_by_time(tmp_path):
+    path = tmp_path / "samples.csv"
+    with StreamingCSVWriter(path, batch_size=1000, flush_interval=0.05) as writer:
+        writer.write({"i": 0})
+        deadline = time.time() + 5
+        while writer.rows_written == 0 and time.time() < deadline:
+            time.sleep(0.01)
+        assert read_monitoring_csv(path)["i"].tolist() == [0]
+
+
+def test_truncated_last_line_is_dropped(tmp_path):
+    path = tmp_path / "samples.csv"
+    path.write_text("a,b\n1,2\n3,4\n5,")
+    assert read_monitoring_csv(path).values.tolist() == [[1, 2], [3, 4]]
+
+
+def test_header_is_fixed_by_first_sample(tmp_path):
+    path = tmp_path / "samples.csv"
+    with StreamingCSVWriter(path, transform=lambda s: {**s, "double": 2 * s["a"]}) as w:
+        w.write({"a": 1})
+        w.write({"a": 2, "extra": 9})
+    df = read_monitoring_csv(path)
+    assert df.columns.tolist() == ["a", "double"]
+    assert df["double"].tolist() == [2, 4]
+
+
+def test_dropped_columns_are_reported_once(tmp_path):
+    messages = []
+    sink = logger.add(messages.append, level="WARNING")
+    try:
+        with StreamingCSVWriter(tmp_path / "samples.csv", batch_size=1) as w:
+            w.write({"a": 1})
+            for value in range(3):
+                w.write({"a": 2, "disk_sdb_read_bytes_s": value})
+    finally:
+        logger.remove(sink)
+    assert len(messages) == 1
+    assert "disk_sdb_read_bytes_s" in messages[0]
+
+
+def test_declared_header(tmp_path):
+    path = tmp_path / "samples.csv"
+    with StreamingCSVWriter(path, columns=["a", "late"]) as w:
+        w.write({"a": 1})
+        w.write({"a": 2, "late": 3})
+    df = read_monitoring_csv(path)
+    assert df.columns.tolist() == ["a", "late"]
+    assert df["late"].isna().tolist() == [True, False]
+
+
+def test_write_after_close_raises(tmp_path):
+    writer = StreamingCSVWriter(tmp_path / "samples.csv")
+    writer.close()
+    with pytest.raises(RuntimeError):
+        writer.write({"a": 1})
@@ -1,10 +1,16 @@
 """Unit tests for system monitoring module."""
 
+import json
+import queue
 import time
+from datetime import datetime
 from pathlib import Path
+from types import SimpleNamespace
 import pytest
 import pandas as pd
+from loguru import logger
 
+from kataglyphispythonpackage.stream_writer import read_monitoring_csv
 from kataglyphispythonpackage.system_monitor import SystemMonitor, monitor_function
 
 
@@ -20,7 +26,7 @@ class TestSystemMonitor:
         """Test that monitor initializes correctly."""
         assert monitor.output_dir == tmp_path
         assert monitor.output_dir.exists()
-        assert monitor.monitoring_data == []
+        assert len(monitor.monitoring_data) == 0
         assert monitor.start_time is None
         assert monitor.session_id is not None
 
@@ -28,10 +34,35 @@ class TestSystemMonitor:
         """Test CPU information retrieval."""
         cpu_info = monitor.get_cpu_info()
         assert "cpu_percent" in cpu_info
-        assert "cpu_count" in cpu_info
         assert "cpu_freq_current" in cpu_info
         assert cpu_info["cpu_percent"] >= 0
-        assert cpu_info["cpu_count"] > 0
+        # Static facts are collected once per session, not per sample
+        assert "cpu_count" not in cpu_info
+        assert monitor.get_static_info()["cpu_count"] > 0
+
+    def test_cpu_percent_does_not_block(self, monitor):
+        """Test that the default delta mode samples without sleeping."""
+        start = time.perf_counter()
+        for _ in range(20):
+            monitor.sample()
+        assert (time.perf_counter() - start) / 20 < 0.05
+
+    def test_cpu_percent_delta_reflects_load(self, monitor):
+        """Test that CPU usage is measured since the previous sample."""
+        monitor.get_cpu_info()
+        deadline = time.perf_counter() + 0.3
+        while time.perf_counter() < deadline:
+            pass
+        cpu_percent = monitor.get_cpu_info()["cpu_percent"]
+        assert 0 < cpu_percent <= 100
+
+    def test_blocking_cpu_interval(self, tmp_path):
+        """Test that an explicit cpu_interval keeps the blocking measurement."""
+        monitor = SystemMonitor(output_dir=tmp_path, cpu_interval=0.05)
+        start = time.perf_counter()
+        cpu_percent = monitor.get_cpu_info()["cpu_percent"]
+        assert time.perf_counter() - start >= 0.04
+        assert 0 <= cpu_percent <= 100
 
     def test_get_memory_info(self, monitor):
         """Test memory information retrieval."""
@@ -55,9 +86,8 @@ class TestSystemMonitor:
         sample = monitor.sample()
 
         # Check that sample contains expected keys
-        assert "timestamp" in sample
-        assert "elapsed_seconds" in sample
-        assert "datetime" in sample
+        assert isinstance(sample["timestamp_ns"], int)
+        assert isinstance(sample["elapsed_ns"], int)
         assert "cpu_percent" in sample
         assert "ram_percent" in sample
 
@@ -75,14 +105,14 @@ class TestSystemMonitor:
 
         assert len(monitor.monitoring_data) == 5
 
-        # Check that elapsed_seconds increases
+        # Check that elapsed_ns increases
         assert (
-            monitor.monitoring_data[1]["elapsed_seconds"]
-            > monitor.monitoring_data[0]["elapsed_seconds"]
+            monitor.monitoring_data[1]["elapsed_ns"]
+            > monitor.monitoring_data[0]["elapsed_ns"]
         )
         assert (
-            monitor.monitoring_data[4]["elapsed_seconds"]
-            > monitor.monitoring_data[0]["elapsed_seconds"]
+            monitor.monitoring_data[4]["elapsed_ns"]
+            > monitor.monitoring_data[0]["elapsed_ns"]
         )
 
     def test_save_data(self, monitor, tmp_path):
@@ -104,6 +134,50 @@ class TestSystemMonitor:
         assert "cpu_percent" in df.columns
         assert "ram_percent" in df.columns
 
+    def test_export_derives_seconds_and_iso_datetime(self, monitor):
+        """Test that seconds and ISO strings are derived only on export."""
+        for _ in range(3):
+            monitor.sample()
+        df = monitor.to_dataframe()
+
+        first = monitor.monitoring_data[0]
+        assert df["timestamp"][0] == first["timestamp_ns"] / 1e9
+        assert df["elapsed_seconds"][0] == first["elapsed_ns"] / 1e9
+        assert (
+            df["datetime"][0] == datetime.fromtimestamp(df["timestamp"][0]).isoformat()
+        )
+        assert df["elapsed_seconds"].is_monotonic_increasing
+
+    def test_max_samples_keeps_newest(self, tmp_path):
+        """Test the bounded ring-buffer mode."""
+        monitor = SystemMonitor(output_dir=tmp_path, max_samples=3)
+        for _ in range(5):
+            monitor.sample()
+
+        assert len(monitor.monitoring_data) == 3
+        assert monitor.monitoring_data.total_appended == 5
+        df = monitor.to_dataframe()
+        assert len(df) == 3
+        assert df["elapsed_seconds"].is_monotonic_increasing
+
+    def test_stream_to_writes_samples_incrementally(self, tmp_path):
+        """Test that samples reach disk while the session is running."""
+        monitor = SystemMonitor(output_dir=tmp_path, max_samples=2)
+        path = monitor.stream_to(batch_size=2, flush_interval=60)
+        for _ in range(5):
+            monitor.sample()
+
+        deadline = time.time() + 5
+        while len(read_monitoring_csv(path)) < 4 and time.time() < deadline:
+            time.sleep(0.01)
+        assert len(read_monitoring_csv(path)) == 4
+
+        monitor.close_stream()
+        df = read_monitoring_csv(path)
+        assert len(df) == 5
+        assert len(monitor.monitoring_data) == 2
+        assert df.columns.tolist() == monitor.to_dataframe().columns.tolist()
+
     def test_save_data_no_samples(self, monitor):
         """Test saving data when no samples have been taken."""
         result = monitor.save_data()
@@ -162,6 +236,17 @@ class TestSystemMonitor:
         expected_samples = int(duration / 0.5)
         assert len(monitor.monitoring_data) >= expected_samples
 
+    def test_start_monitoring_is_drift_free(self, monitor):
+        """Test that samples stay on the interval grid despite sampling cost."""
+        monitor.start_monitoring(interval=0.05, duration=1.0)
+
+        elapsed = [s["elapsed_ns"] / 1e9 for s in monitor.monitoring_data]
+        offsets = [t - i * 0.05 for i, t in enumerate(elapsed)]
+        # Drift would make the offsets grow with every sample.
+        assert max(offsets) < 0.03
+        assert monitor.schedule_stats["ticks"] == len(elapsed)
+        assert monitor.schedule_stats["skipped"] == 0
+
 
 class TestMonitorDecorator:
     """Test cases for monitor_function decorator."""
@@ -222,3 +307,150 @@ class TestMonitoringIntegration:
         assert all(df["cpu_percent"] >= 0)
         assert all(df["ram_percent"] >= 0)
         assert all(df["ram_percent"] <= 100)
+
+
+class FakeNVML:
+    """Minimal NVML stand-in that counts calls per function."""
+
+    NVML_TEMPERATURE_GPU = 0
+
+    class NVMLError(Exception):
+        pass
+
+    def __init__(self, device_count=2):
+        self.device_count = device_count
+        self.calls = {}
+
+    def _count(self, name):
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    def nvmlDeviceGetCount(self):
+        self._count("count")
+        return self.device_count
+
+    def nvmlDeviceGetHandleByIndex(self, index):
+        self._count("handle")
+        return index
+
+    def nvmlDeviceGetName(self, handle):
+        self._count("name")
+        return f"Fake GPU {handle}".encode()
+
+    def nvmlDeviceGetUtilizationRates(self, handle):
+        self._count("utilization")
+        return SimpleNamespace(gpu=10 * (handle + 1), memory=0)
+
+    def nvmlDeviceGetMemoryInfo(self, handle):
+        self._count("memory")
+        return SimpleNamespace(used=2 * 1024**3, total=8 * 1024**3)
+
+    def nvmlDeviceGetTemperature(self, handle, sensor):
+        self._count("temperature")
+        return 60
+
+
+class TestCachedCollectors:
+    """Test that static facts and GPU handles are collected once."""
+
+    def test_gpu_samples_use_cached_handles(self, tmp_path):
+        """Test that per-sample GPU queries only read dynamic values."""
+        nvml = FakeNVML(device_count=2)
+        monitor = SystemMonitor(output_dir=tmp_path, nvml=nvml)
+        for _ in range(5):
+            sample = monitor.sample()
+
+        assert nvml.calls["count"] == 1
+        assert nvml.calls["handle"] == 2
+        assert "name" not in nvml.calls
+        assert nvml.calls["utilization"] == 10
+        assert sample["gpu_1_gpu_load"] == 20.0
+        assert sample["gpu_0_gpu_memory_percent"] == 25.0
+        assert "gpu_0_gpu_name" not in sample
+
+    def test_static_info_goes_to_metadata(self, tmp_path):
+        """Test that GPU names and sizes are stored in the metadata once."""
+        nvml = FakeNVML(device_count=1)
+        monitor = SystemMonitor(output_dir=tmp_path, nvml=nvml)
+        monitor.sample()
+        with open(monitor.save_metadata()) as f:
+            metadata = json.load(f)
+        monitor.save_metadata()
+
+        assert metadata["gpu_available"] is True
+        assert metadata["gpus"] == [
+            {"id": 0, "name": "Fake GPU 0", "memory_total_mb": 8192.0}
+        ]
+        assert metadata["cpu_count"] > 0
+        assert nvml.calls["name"] == 1
+
+
+class TestBackgroundSampler:
+    """Test cases for non-blocking background sampling."""
+
+    def test_start_and_stop_thread(self, tmp_path):
+        """Test that the thread sampler collects samples without blocking."""
+        monitor = SystemMonitor(output_dir=tmp_path)
+        start = time.time()
+        monitor.start(interval=0.05)
+        assert time.time() - start < 0.5
+        assert monitor.is_running
+
+        time.sleep(0.5)
+        monitor.stop()
+        assert not monitor.is_running
+        assert len(monitor.monitoring_data) >= 2
+
+        # No further samples after stop
+        count = len(monitor.monitoring_data)
+        time.sleep(0.3)
+        assert len(monitor.monitoring_data) == count
+
+    def test_running_context_manager(self, tmp_path):
+        """Test that the context manager stops the sampler on exit."""
+        with SystemMonitor(output_dir=tmp_path).running(interval=0.05) as monitor:
+            sum(i * i for i in range(200_000))
+            time.sleep(0.3)
+        assert not monitor.is_running
+        assert len(monitor.monitoring_data) >= 2
+        assert monitor.save_data().exists()
+
+    def test_context_manager_stops_on_exception(self, tmp_path):
+        """Test clean shutdown when the monitored code raises."""
+        monitor = SystemMonitor(output_dir=tmp_path)
+        with pytest.raises(ValueError):
+            with monitor.running(interval=0.05):
+                raise ValueError("workload failed")
+        assert not monitor.is_running
+
+    def test_start_twice_raises(self, tmp_path):
+        """Test that only one sampler can run at a time."""
+        monitor = SystemMonitor(output_dir=tmp_path)
+        with monitor.running(interval=0.05):
+            with pytest.raises(RuntimeError):
+                monitor.start()
+
+    def test_invalid_mode(self, tmp_path):
+        """Test that unknown sampler modes are rejected."""
+        with pytest.raises(ValueError):
+            SystemMonitor(output_dir=tmp_path).start(mode="fiber")
+
+    def test_process_sampler(self, tmp_path):
+        """Test that the subprocess sampler forwards its samples."""
+        monitor = SystemMonitor(output_dir=tmp_path)
+        with monitor.running(interval=0.1, mode="process"):
+            deadline = time.time() + 30
+            while len(monitor.monitoring_data) < 2 and time.time() < deadline:
+                time.sleep(0.1)
+        assert len(monitor.monitoring_data) >= 2
+        assert monitor.monitoring_data[0]["elapsed_ns"] >= 0
+
+    def test_crashed_sampler_process_is_logged(self, tmp_path):
+        """Test that a sampler dying without the sentinel reports its exit code."""
+        messages = []
+        sink = logger.add(messages.append, level="WARNING")
+        try:
+            dead = SimpleNamespace(is_alive=lambda: False, exitcode=-9)
+            SystemMonitor(output_dir=tmp_path)._receive_samples(queue.Queue(), dead)
+        finally:
+            logger.remove(sink)
+        assert any("exitcode -9" in message for message in messages)
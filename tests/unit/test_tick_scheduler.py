@@ -0,0 +1,53 @@
+import threading
+import time
+
+import pytest
+
+from kataglyphispythonpackage.tick_scheduler import TickScheduler
+
+
+def test_ticks_follow_the_grid():
+    scheduler = TickScheduler(0.02)
+    fired = []
+    for _ in range(10):
+        tick = scheduler.wait()
+        fired.append((tick, time.perf_counter_ns()))
+        time.sleep(0.005)  # work between ticks must not accumulate
+
+    assert [tick for tick, _ in fired] == list(range(10))
+    for tick, now in fired:
+        assert now >= scheduler.deadline_ns(tick)
+    assert fired[-1][1] - scheduler.start_ns < 9 * 0.02e9 + 0.015e9
+
+
+def test_missed_ticks_are_skipped_and_counted():
+    scheduler = TickScheduler(0.01, late_tolerance=0.001)
+    scheduler.wait()
+    time.sleep(0.035)
+    tick = scheduler.wait()
+
+    assert tick == 3
+    assert scheduler.skipped == 2
+    assert scheduler.late == 1
+    assert scheduler.stats() == {
+        "interval_ns": 10_000_000,
+        "ticks": 2,
+        "skipped": 2,
+        "late": 1,
+    }
+
+
+def test_stop_event_interrupts_wait():
+    scheduler = TickScheduler(10.0)
+    scheduler.wait()
+    stop = threading.Event()
+    threading.Timer(0.05, stop.set).start()
+
+    start = time.perf_counter()
+    assert scheduler.wait(stop) is None
+    assert time.perf_counter() - start < 1.0
+
+
+def test_invalid_interval():
+    with pytest.raises(ValueError):
+        TickScheduler(0)